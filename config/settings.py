@@ -8,3 +8,108 @@ DB_CONFIG = {
     "database": "drms",         # Your database name
     "port": 3306                # MySQL default port
 }
+
+# Connection Pool Configuration
+DB_POOL_CONFIG = {
+    "enabled": True,            # Hand out pooled connections from DatabaseConnection.connect()
+    "min_size": 2,              # Connections opened up front
+    "max_size": 10,             # Hard cap on open connections
+    "checkout_timeout": 10,     # Seconds to wait for a free connection
+    "health_check_interval": 30 # Ping idle connections older than this (seconds)
+}
+
+# Prepared Statement Cache Configuration
+STATEMENT_CACHE_CONFIG = {
+    "enabled": True,            # Route parameterised repository queries through prepared statements
+    "max_size": 64              # Prepared statements kept per connection (LRU)
+}
+
+# SOS Priority Scoring Configuration
+PRIORITY_SCORING_CONFIG = {
+    "batch_size": 500,          # Open requests rescored per chunk (one short transaction each)
+    "interval_seconds": 300,    # Period of the background rescoring run
+    "urgency_points": 100,      # Points per unit of UrgencyWeight.weight
+    "age_step_minutes": 30,     # One point per this many minutes waiting
+    "people_weight": 20,        # Points per person affected beyond the first
+    "people_cap": 50,           # People counted at most (keeps mass reports from drowning others)
+    "zone_bonus": {"low": 500, "medium": 1500, "high": 3000}  # Best PriorityZone containing the request
+}
+
+# Proximity Index Configuration
+PROXIMITY_CONFIG = {
+    "cell_km": 2.0,             # Grid cell size of the in-memory spatial index
+    "overlap_seconds": 5,       # Re-read this far behind the watermark on incremental refresh
+    "full_refresh_every": 20    # Rebuild from scratch every N refreshes (catches hard deletes)
+}
+
+# Batch Task Assignment Configuration
+TASK_ASSIGNMENT_CONFIG = {
+    "candidates": 20,           # Nearest free volunteers considered per task
+    "max_km": None,             # Ignore volunteers farther than this (None = no limit)
+    "skill_bonus_km": 5.0,      # A role matching the task type is worth this much distance
+    "unknown_distance_km": 50.0 # Assumed distance when either side has no location
+}
+
+# Reference Data Cache Configuration
+REFERENCE_CACHE_CONFIG = {
+    "enabled": True,            # Serve ResourceType, UrgencyWeight and NGO rows from memory
+    "ttl_seconds": 3600         # Reload a cached table after this long even without a write
+}
+
+# Report Job Configuration
+REPORT_JOB_CONFIG = {
+    "workers": 2,               # Report jobs generated in parallel
+    "freshness_seconds": 600,   # Reuse an identical report generated within this window
+    "output_dir": "reports"     # Where generated artifacts are kept (relative to the project root)
+}
+
+# Notification Outbox Configuration
+NOTIFICATION_CONFIG = {
+    "interval_seconds": 5,      # Dispatcher poll period when nothing wakes it
+    "batch_size": 500,          # Notifications handed to a channel adapter per batch
+    "outbox_batch": 20,         # Outbox entries expanded per dispatcher run
+    "log_dir": "logs"           # Where the local email/SMS stand-in adapters write (relative to the project root)
+}
+
+# SOS Ingestion Configuration
+SOS_INGESTION_CONFIG = {
+    "queue_size": 5000,         # Submissions waiting to be written before callers are pushed back
+    "batch_size": 200,          # Rows per multi-row INSERT
+    "flush_ms": 50,             # Longest a submission waits for its batch to fill
+    "submit_timeout": 2.0,      # Seconds a caller waits for queue space before giving up
+    "lag_seconds": 1.0          # A flush slower than this counts as the database lagging
+}
+
+# Near-duplicate SOS Detection
+SOS_DEDUPE_CONFIG = {
+    "enabled": True,
+    "geohash_precision": 7,     # ~150 m cells; neighbouring cells are checked too
+    "window_minutes": 30,       # Requests further apart in time are never duplicates
+    "max_distance_km": 0.5      # Furthest a duplicate may be from its cluster head
+}
+
+# Hotspot Zone Configuration
+HOTSPOT_CONFIG = {
+    "eps_km": 0.5,              # Grid cell size; requests this close count as neighbours
+    "min_points": 20,           # Requests in a cell's 3x3 neighbourhood that make it a hotspot core
+    "min_cluster_size": 25,     # Smaller clusters are not turned into zones
+    "min_radius_km": 0.5,       # Zone radius bounds
+    "max_radius_km": 10.0,
+    "level_thresholds": {"high": 0.6, "medium": 0.35}  # Mean urgency weight (relative to critical) per level
+}
+
+# Delivery Route Planner Configuration
+ROUTE_CONFIG = {
+    "speed_kmh": 25,            # Average driving speed in disaster conditions
+    "stop_minutes": 10,         # Time spent at each pickup or drop-off
+    "road_factor": 1.3,         # Road distance per straight-line km
+    "two_opt_seconds": 5.0,     # Time budget for route improvement per phase
+    "float32_above": 2000       # Stops beyond which the distance matrix is stored as float32
+}
+
+# Shelter Matching Configuration
+SHELTER_CONFIG = {
+    "need_keywords": ["shelter", "evacuat"],  # SOS typeOfNeed matches that ask for a shelter place
+    "candidates": 8,            # Nearest shelters kept per request (rebuilt when they fill up)
+    "max_km": None              # Furthest shelter a victim may be sent to (None: no limit)
+}
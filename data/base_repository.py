@@ -1,19 +1,109 @@
+import random
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from mysql.connector import Error
+
+from config.settings import STATEMENT_CACHE_CONFIG
+from data.statement_cache import statements_for, cache_stats
+
+# Deadlock victim / lock wait timeout: the transaction was rolled back and can be rerun
+RETRYABLE_ERRNOS = (1213, 1205)
+
+
 class BaseRepository:
     def __init__(self, db):
         self.db = db
 
+    def _session(self):
+        """Physical connection for this call (resolves pooled handles to their lease)."""
+        raw = getattr(self.db, "raw", None)
+        return raw() if raw else self.db
+
+    def _statements(self, params):
+        """Statement cache for parameterised queries, or None to run them ad hoc."""
+        if not params or not STATEMENT_CACHE_CONFIG.get("enabled", False):
+            return None
+        return statements_for(self._session(), STATEMENT_CACHE_CONFIG.get("max_size", 64))
+
     def execute(self, query: str, params: tuple = ()):
+        """Run a write and commit; returns lastrowid/rowcount captured before the cursor is released."""
+        statements = self._statements(params)
+        if statements:
+            cursor = statements.execute(query, params)
+            self.db.commit()
+            return SimpleNamespace(lastrowid=cursor.lastrowid, rowcount=cursor.rowcount)
+
         cursor = self.db.cursor(dictionary=True)
-        cursor.execute(query, params)
-        self.db.commit()
-        return cursor
+        try:
+            cursor.execute(query, params)
+            self.db.commit()
+            return SimpleNamespace(lastrowid=cursor.lastrowid, rowcount=cursor.rowcount)
+        finally:
+            cursor.close()
 
     def fetch_one(self, query: str, params: tuple = ()):
+        statements = self._statements(params)
+        if statements:
+            return statements.fetch_one(query, params)
+
         cursor = self.db.cursor(dictionary=True)
-        cursor.execute(query, params)
-        return cursor.fetchone()
+        try:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            return rows[0] if rows else None
+        finally:
+            cursor.close()
 
     def fetch_all(self, query: str, params: tuple = ()):
+        statements = self._statements(params)
+        if statements:
+            return statements.fetch_all(query, params)
+
         cursor = self.db.cursor(dictionary=True)
-        cursor.execute(query, params)
-        return cursor.fetchall()
\ No newline at end of file
+        try:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Yield a dictionary cursor whose statements commit together; any
+        exception rolls the whole block back.
+        """
+        connection = self._session()
+        if connection.in_transaction:
+            connection.commit()  # end the implicit read snapshot left by earlier queries
+        connection.start_transaction()
+        cursor = connection.cursor(dictionary=True)
+        try:
+            yield cursor
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def run_transaction(self, work, attempts=3):
+        """
+        Run work(cursor) inside transaction() and return its result, rerunning
+        it with a short jittered backoff when MySQL picks it as a deadlock
+        victim or times out waiting for a lock.
+        """
+        for attempt in range(1, attempts + 1):
+            try:
+                with self.transaction() as cursor:
+                    return work(cursor)
+            except Error as e:
+                if e.errno not in RETRYABLE_ERRNOS or attempt == attempts:
+                    raise
+                time.sleep(random.uniform(0.01, 0.05) * attempt)
+
+    @staticmethod
+    def statement_cache_stats():
+        """Hit/miss counters of the prepared statement cache across all connections."""
+        return cache_stats()
@@ -0,0 +1,267 @@
+# data/connection_pool.py
+
+import threading
+import time
+from contextlib import contextmanager
+from queue import Queue, Empty
+
+import mysql.connector
+from mysql.connector import Error
+from config.settings import DB_CONFIG, DB_POOL_CONFIG
+from data import statement_cache
+
+
+class PoolExhaustedError(Exception):
+    """Raised when no connection becomes free within the checkout timeout."""
+
+
+class ConnectionPool:
+    """
+    Bounded pool of MySQL connections with checkout/checkin semantics.
+
+    Idle connections are health-checked before being handed out and are
+    reconnected in place when the server dropped them.
+    """
+
+    def __init__(self, min_size=2, max_size=10, checkout_timeout=10, health_check_interval=30, db_config=None):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1.")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.db_config = db_config or DB_CONFIG
+
+        self._idle = Queue()          # (connection, last_used) pairs
+        self._lock = threading.Lock()
+        self._size = 0
+        self._closed = False
+        self.stats = {"checkouts": 0, "waits": 0, "reconnects": 0, "discarded": 0}
+
+        for _ in range(min_size):
+            self._idle.put((self._open(), time.monotonic()))
+
+    def _connect(self):
+        return mysql.connector.connect(
+            host=self.db_config["host"],
+            user=self.db_config["user"],
+            password=self.db_config["password"],
+            database=self.db_config["database"],
+            port=self.db_config.get("port", 3306)
+        )
+
+    def _open(self):
+        """
+        Reserve a slot under the lock, then connect outside it; returns None
+        when the pool is already at max_size. The slot is given back if
+        connecting fails.
+        """
+        with self._lock:
+            if self._size >= self.max_size:
+                return None
+            self._size += 1
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._size -= 1
+            raise
+
+    def _count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _discard(self, connection):
+        statement_cache.forget(connection)
+        try:
+            connection.close()
+        except Error:
+            pass
+        with self._lock:
+            self._size -= 1
+            self.stats["discarded"] += 1
+
+    def _ensure_healthy(self, connection, last_used):
+        """Ping connections that sat idle too long, reconnecting if needed."""
+        if time.monotonic() - last_used < self.health_check_interval:
+            return connection
+        try:
+            connection.ping()
+            return connection
+        except Error:
+            pass
+        self._count("reconnects")
+        statement_cache.forget(connection)
+        try:
+            connection.reconnect(attempts=2, delay=1)
+            return connection
+        except Error:
+            pass
+        # Replace the dead connection in the slot it already holds
+        try:
+            connection.close()
+        except Error:
+            pass
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._size -= 1
+                self.stats["discarded"] += 1
+            raise
+
+    def checkout(self, timeout=None):
+        """Take a connection from the pool, opening a new one while below max_size."""
+        if self._closed:
+            raise Error("Connection pool is closed.")
+        timeout = self.checkout_timeout if timeout is None else timeout
+
+        try:
+            connection, last_used = self._idle.get_nowait()
+        except Empty:
+            connection, last_used = self._open(), time.monotonic()
+            if connection is None:
+                self._count("waits")
+                try:
+                    connection, last_used = self._idle.get(timeout=timeout)
+                except Empty:
+                    raise PoolExhaustedError(
+                        f"No database connection available after {timeout}s "
+                        f"(max_size={self.max_size})."
+                    )
+
+        connection = self._ensure_healthy(connection, last_used)
+        self._count("checkouts")
+        return connection
+
+    def checkin(self, connection):
+        """Return a connection to the pool, rolling back any open transaction."""
+        if connection is None:
+            return
+        if self._closed:
+            self._discard(connection)
+            return
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except Error:
+            self._discard(connection)
+            return
+        self._idle.put((connection, time.monotonic()))
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """Context manager that checks a connection out and always checks it back in."""
+        connection = self.checkout(timeout)
+        try:
+            yield connection
+        finally:
+            self.checkin(connection)
+
+    def size(self):
+        with self._lock:
+            return self._size
+
+    def idle_count(self):
+        return self._idle.qsize()
+
+    def close_all(self):
+        """Close every idle connection and refuse further checkouts."""
+        self._closed = True
+        while True:
+            try:
+                connection, _ = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(connection)
+
+
+class PooledConnection:
+    """
+    Drop-in stand-in for a mysql.connector connection backed by a ConnectionPool.
+
+    Each thread leases its own pooled connection on first use and keeps it
+    until release() or close(), so screens that hold on to a cursor keep
+    talking to the same session while other threads use other sockets.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self._local = threading.local()
+
+    def _lease(self):
+        connection = getattr(self._local, "connection", None)
+        now = time.monotonic()
+        if connection is None:
+            connection = self.pool.checkout()
+            self._local.connection = connection
+        elif now - self._local.last_used >= self.pool.health_check_interval and not connection.is_connected():
+            # Dropped mid-session: reconnect the same handle so held cursors survive
+            statement_cache.forget(connection)
+            connection.reconnect(attempts=2, delay=1)
+            self.pool._count("reconnects")
+        self._local.last_used = now
+        return connection
+
+    def raw(self):
+        """Return the physical connection currently leased by this thread."""
+        return self._lease()
+
+    def cursor(self, *args, **kwargs):
+        return self._lease().cursor(*args, **kwargs)
+
+    def commit(self):
+        self._lease().commit()
+
+    def rollback(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.rollback()
+
+    def start_transaction(self, *args, **kwargs):
+        self._lease().start_transaction(*args, **kwargs)
+
+    @property
+    def in_transaction(self):
+        connection = getattr(self._local, "connection", None)
+        return bool(connection is not None and connection.in_transaction)
+
+    @property
+    def database(self):
+        return self.pool.db_config["database"]
+
+    def is_connected(self):
+        try:
+            return self._lease().is_connected()
+        except Error:
+            return False
+
+    def ping(self, reconnect=True, attempts=1, delay=0):
+        self._lease().ping(reconnect=reconnect, attempts=attempts, delay=delay)
+
+    def release(self):
+        """Hand this thread's leased connection back to the pool."""
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        self.pool.checkin(connection)
+
+    def close(self):
+        self.release()
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide pool, creating it from DB_POOL_CONFIG on first use."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None or _shared_pool._closed:
+            _shared_pool = ConnectionPool(
+                min_size=DB_POOL_CONFIG.get("min_size", 2),
+                max_size=DB_POOL_CONFIG.get("max_size", 10),
+                checkout_timeout=DB_POOL_CONFIG.get("checkout_timeout", 10),
+                health_check_interval=DB_POOL_CONFIG.get("health_check_interval", 30)
+            )
+        return _shared_pool
@@ -0,0 +1,40 @@
+from .base_repository import BaseRepository
+
+
+class DashboardRepository(BaseRepository):
+    # Entities whose buckets are bounded by their status/flag values
+    SNAPSHOT_ENTITIES = ("Volunteer", "NGO", "SOSRequest", "ResourceStock")
+
+    def get_counters(self, day):
+        """
+        Dashboard counters as {(entity, bucket): value}: the fixed-size
+        entities, Task status buckets and the completed_on bucket of `day`.
+        Per-volunteer and per-day buckets are left out, so the read stays a
+        handful of primary-key ranges however many volunteers and days exist.
+        """
+        placeholders = ", ".join(["%s"] * len(self.SNAPSHOT_ENTITIES))
+        query = f"""
+            SELECT entity, bucket, value FROM DashboardCounter
+            WHERE entity IN ({placeholders})
+               OR (entity = 'Task' AND (bucket LIKE 'status:%%' OR bucket = %s))
+        """
+        rows = self.fetch_all(query, (*self.SNAPSHOT_ENTITIES, f"completed_on:{day.isoformat()}"))
+        return {(row["entity"], row["bucket"]): int(row["value"] or 0) for row in rows}
+
+    def get_volunteer_task_counters(self, volunteer_id):
+        """VolunteerTask buckets of one volunteer and of the unassigned pool ('none')."""
+        query = """
+            SELECT bucket, value FROM DashboardCounter
+            WHERE entity = 'VolunteerTask' AND (bucket LIKE %s OR bucket LIKE 'none:%%')
+        """
+        rows = self.fetch_all(query, (f"{volunteer_id}:%",))
+        return {row["bucket"]: int(row["value"] or 0) for row in rows}
+
+    def rebuild(self):
+        """Recompute all counters from the base tables (drift repair)."""
+        cursor = self.db.cursor()
+        try:
+            cursor.callproc("rebuild_dashboard_counters")
+            self.db.commit()
+        finally:
+            cursor.close()
@@ -1,15 +1,21 @@
 # data/db_connection.py
 
+from contextlib import contextmanager
+
 import mysql.connector
 from mysql.connector import Error
-from config.settings import DB_CONFIG
+from config.settings import DB_CONFIG, DB_POOL_CONFIG
+from data.connection_pool import PooledConnection, get_pool
 
 class DatabaseConnection:
-    def __init__(self):
+    def __init__(self, pooled=None):
         self.connection = None
+        self.pooled = DB_POOL_CONFIG.get("enabled", False) if pooled is None else pooled
 
     def connect(self):
         """Establishes connection to MySQL database."""
+        if self.pooled:
+            return self._connect_pooled()
         try:
             self.connection = mysql.connector.connect(
                 host=DB_CONFIG["host"],
@@ -25,6 +31,18 @@ class DatabaseConnection:
             print(f"❌ Error connecting to MySQL: {e}")
             return None
 
+    def _connect_pooled(self):
+        """Returns a connection-compatible handle backed by the shared pool."""
+        try:
+            self.connection = PooledConnection(get_pool())
+            if self.connection.is_connected():
+                print("✅ Connected to MySQL database (pooled)")
+                return self.connection
+            return None
+        except Error as e:
+            print(f"❌ Error connecting to MySQL: {e}")
+            return None
+
     def get_cursor(self):
         """Returns a cursor object for executing queries."""
         if self.connection and self.connection.is_connected():
@@ -37,3 +55,23 @@ class DatabaseConnection:
         if self.connection and self.connection.is_connected():
             self.connection.close()
             print("✅ MySQL connection closed")
+
+
+@contextmanager
+def job_connection():
+    """
+    Connection for one unit of background work: leased from the shared pool
+    when DB_POOL_CONFIG enables pooling, otherwise opened for the job and
+    closed afterwards.
+    """
+    if DB_POOL_CONFIG.get("enabled", False):
+        with get_pool().connection() as connection:
+            yield connection
+        return
+    connection = DatabaseConnection(pooled=False).connect()
+    if connection is None:
+        raise Error("Cannot connect to database")
+    try:
+        yield connection
+    finally:
+        connection.close()
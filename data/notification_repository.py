@@ -0,0 +1,176 @@
+from .base_repository import BaseRepository
+
+ROLES = ("Admin", "NGO", "Volunteer", "Victim")
+
+
+class NotificationRepository(BaseRepository):
+    STATUS_CHUNK_SIZE = 1000  # ids per status UPDATE
+    INBOX_COLUMNS = "notificationID, message, channel, status, createdAt, recipientUserID, recipientRole"
+
+    def enqueue(self, message, channels, recipient_role=None, recipient_user_id=None,
+                subject=None, created_by=None):
+        """Add one outbox entry; channels is an iterable of 'in_app', 'email', 'sms'."""
+        query = """
+            INSERT INTO NotificationOutbox (subject, message, channels, recipientRole, recipientUserID, createdBy)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """
+        result = self.execute(query, (subject, message, ",".join(channels), recipient_role,
+                                      recipient_user_id, created_by))
+        return result.lastrowid
+
+    def count_recipients(self, recipient_role=None):
+        if recipient_role is None:
+            row = self.fetch_one("SELECT COUNT(*) AS total FROM UserAccount")
+        else:
+            row = self.fetch_one("SELECT COUNT(*) AS total FROM UserAccount WHERE role = %s", (recipient_role,))
+        return row["total"] if row else 0
+
+    def claim_outbox(self, limit):
+        """Pending outbox entries, locked against other dispatchers until expanded."""
+        def work(cursor):
+            cursor.execute("""
+                SELECT outboxID, subject, message, channels, recipientRole, recipientUserID
+                FROM NotificationOutbox
+                WHERE status = 'pending'
+                ORDER BY outboxID
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            """, (limit,))
+            entries = cursor.fetchall()
+            for entry in entries:
+                self._expand(cursor, entry)
+            return entries
+        return self.run_transaction(work)
+
+    def _expand(self, cursor, entry):
+        """
+        Turn one outbox entry into Notification rows with set-based inserts.
+        In-app broadcasts stay role-addressed (one row per role); email and
+        SMS need one row per user so each delivery can be tracked.
+        """
+        text = f"{entry['subject']}: {entry['message']}" if entry["subject"] else entry["message"]
+        channels = entry["channels"] if isinstance(entry["channels"], (set, list)) else entry["channels"].split(",")
+        count = 0
+        for channel in channels:
+            if entry["recipientUserID"] is not None:
+                cursor.execute("""
+                    INSERT INTO Notification (message, channel, recipientUserID, recipientRole, meta)
+                    SELECT %s, %s, userID, role, JSON_OBJECT('outboxID', %s)
+                    FROM UserAccount WHERE userID = %s
+                """, (text, channel, entry["outboxID"], entry["recipientUserID"]))
+            elif channel == "in_app":
+                roles = [entry["recipientRole"]] if entry["recipientRole"] else list(ROLES)
+                cursor.executemany("""
+                    INSERT INTO Notification (message, channel, recipientRole, meta)
+                    VALUES (%s, 'in_app', %s, JSON_OBJECT('outboxID', %s))
+                """, [(text, role, entry["outboxID"]) for role in roles])
+            else:
+                cursor.execute("""
+                    INSERT INTO Notification (message, channel, recipientUserID, recipientRole, meta)
+                    SELECT %s, %s, userID, role, JSON_OBJECT('outboxID', %s)
+                    FROM UserAccount WHERE (%s IS NULL OR role = %s)
+                """, (text, channel, entry["outboxID"], entry["recipientRole"], entry["recipientRole"]))
+            count += cursor.rowcount
+
+        cursor.execute("""
+            UPDATE NotificationOutbox
+            SET status = 'dispatched', recipientCount = %s, dispatchedAt = NOW()
+            WHERE outboxID = %s
+        """, (count, entry["outboxID"]))
+        entry["recipientCount"] = count
+
+    def get_pending(self, channel, after_id, limit):
+        """Next batch of undelivered notifications for a channel, with contact details."""
+        query = """
+            SELECT n.notificationID, n.message, n.recipientUserID, n.recipientRole,
+                   u.name, u.email, u.phone
+            FROM Notification n
+            LEFT JOIN UserAccount u ON u.userID = n.recipientUserID
+            WHERE n.status = 'pending' AND n.channel = %s AND n.notificationID > %s
+            ORDER BY n.notificationID
+            LIMIT %s
+        """
+        return self.fetch_all(query, (channel, after_id, limit))
+
+    def mark(self, notification_ids, status):
+        """Set status (and deliveredAt for successful deliveries) on many rows at once."""
+        ids = list(notification_ids)
+        for start in range(0, len(ids), self.STATUS_CHUNK_SIZE):
+            chunk = ids[start:start + self.STATUS_CHUNK_SIZE]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            self.execute(f"""
+                UPDATE Notification
+                SET status = %s, deliveredAt = IF(%s = 'failed', deliveredAt, NOW())
+                WHERE notificationID IN ({placeholders}) AND status = 'pending'
+            """, (status, status, *chunk))
+
+    # ----- Inbox: role broadcasts plus direct in-app notifications -----
+
+    def get_inbox(self, user_id, role, limit, before=None):
+        """Newest first; before=(createdAt, notificationID) pages further back."""
+        older = "AND (createdAt < %s OR (createdAt = %s AND notificationID < %s))" if before else ""
+        cursor_params = (before[0], before[0], before[1]) if before else ()
+        query = f"""
+            SELECT * FROM (
+                (SELECT {self.INBOX_COLUMNS} FROM Notification
+                 WHERE recipientRole = %s AND recipientUserID IS NULL AND channel = 'in_app' {older}
+                 ORDER BY createdAt DESC, notificationID DESC LIMIT %s)
+                UNION ALL
+                (SELECT {self.INBOX_COLUMNS} FROM Notification
+                 WHERE recipientUserID = %s AND channel = 'in_app' {older}
+                 ORDER BY createdAt DESC, notificationID DESC LIMIT %s)
+            ) inbox
+            ORDER BY createdAt DESC, notificationID DESC
+            LIMIT %s
+        """
+        return self.fetch_all(query, (role, *cursor_params, limit, user_id, *cursor_params, limit, limit))
+
+    def poll(self, user_id, role, since, limit):
+        """Inbox rows after the since=(createdAt, notificationID) cursor, oldest first."""
+        newer = "(createdAt > %s OR (createdAt = %s AND notificationID > %s))"
+        cursor_params = (since[0], since[0], since[1])
+        query = f"""
+            SELECT * FROM (
+                (SELECT {self.INBOX_COLUMNS} FROM Notification
+                 WHERE recipientRole = %s AND recipientUserID IS NULL AND channel = 'in_app' AND {newer}
+                 ORDER BY createdAt, notificationID LIMIT %s)
+                UNION ALL
+                (SELECT {self.INBOX_COLUMNS} FROM Notification
+                 WHERE recipientUserID = %s AND channel = 'in_app' AND {newer}
+                 ORDER BY createdAt, notificationID LIMIT %s)
+            ) inbox
+            ORDER BY createdAt, notificationID
+            LIMIT %s
+        """
+        return self.fetch_all(query, (role, *cursor_params, limit, user_id, *cursor_params, limit, limit))
+
+    def unread_count(self, user_id, role):
+        """
+        Two primary-key reads of trigger-maintained counters: the user's
+        direct unread count plus the role broadcasts sent since roleSeenSeq.
+        The role sequence never goes down, so deleting broadcasts cannot
+        hide newer ones.
+        """
+        row = self.fetch_one("""
+            SELECT COALESCE(i.unreadDirect, 0) AS direct,
+                   GREATEST(0, COALESCE(s.broadcasts, 0) - COALESCE(i.roleSeenSeq, 0)) AS broadcasts
+            FROM (SELECT 1) one
+            LEFT JOIN NotificationInbox i ON i.userID = %s
+            LEFT JOIN NotificationRoleSequence s ON s.recipientRole = %s
+        """, (user_id, role))
+        return int(row["direct"]) + int(row["broadcasts"])
+
+    def mark_all_read(self, user_id, role):
+        def work(cursor):
+            cursor.execute("""
+                INSERT INTO NotificationInbox (userID, roleSeenSeq, lastSeenAt)
+                SELECT %s, COALESCE(s.broadcasts, 0), NOW()
+                FROM (SELECT 1) one
+                LEFT JOIN NotificationRoleSequence s ON s.recipientRole = %s
+                ON DUPLICATE KEY UPDATE roleSeenSeq = VALUES(roleSeenSeq), lastSeenAt = VALUES(lastSeenAt)
+            """, (user_id, role))
+            cursor.execute("""
+                UPDATE Notification SET status = 'read'
+                WHERE recipientUserID = %s AND status <> 'read' AND channel = 'in_app'
+            """, (user_id,))
+        self.run_transaction(work)
@@ -0,0 +1,33 @@
+from .base_repository import BaseRepository
+
+ZONE_FIELDS = ("name", "description", "centerLat", "centerLong", "radius_km", "priority_level")
+
+
+class PriorityZoneRepository(BaseRepository):
+
+    def get_all(self):
+        query = """
+            SELECT zoneID, name, description, centerLat, centerLong, radius_km, priority_level, source
+            FROM PriorityZone
+        """
+        return self.fetch_all(query)
+
+    def apply_plan(self, plan):
+        """Insert, update and retire auto-generated zones in one transaction."""
+        def work(cursor):
+            if plan["insert"]:
+                cursor.executemany(f"""
+                    INSERT INTO PriorityZone ({", ".join(ZONE_FIELDS)}, source)
+                    VALUES ({", ".join(["%s"] * len(ZONE_FIELDS))}, 'auto')
+                """, [tuple(zone[f] for f in ZONE_FIELDS) for zone in plan["insert"]])
+            if plan["update"]:
+                cursor.executemany(f"""
+                    UPDATE PriorityZone SET {", ".join(f"{f} = %s" for f in ZONE_FIELDS)}
+                    WHERE zoneID = %s AND source = 'auto'
+                """, [tuple(zone[f] for f in ZONE_FIELDS) + (zone["zoneID"],) for zone in plan["update"]])
+            if plan["retire"]:
+                cursor.execute(f"""
+                    DELETE FROM PriorityZone
+                    WHERE source = 'auto' AND zoneID IN ({", ".join(["%s"] * len(plan["retire"]))})
+                """, tuple(plan["retire"]))
+        self.run_transaction(work)
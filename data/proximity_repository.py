@@ -0,0 +1,44 @@
+from .base_repository import BaseRepository
+
+
+class ProximityRepository(BaseRepository):
+    """Located rows for the proximity index; `since` limits reads to recent changes."""
+
+    def get_db_time(self):
+        return self.fetch_one("SELECT NOW() AS now")["now"]
+
+    def get_volunteers(self, since=None):
+        query = """
+            SELECT v.volunteerID, u.name, v.roles, v.status, u.latitude, u.longitude,
+                   GREATEST(v.updatedAt, u.updatedAt) AS updatedAt
+            FROM Volunteer v
+            JOIN UserAccount u ON v.volunteerID = u.userID
+        """
+        if since is None:
+            return self.fetch_all(query)
+        return self.fetch_all(query + " WHERE v.updatedAt >= %s OR u.updatedAt >= %s", (since, since))
+
+    def get_open_requests(self, since=None):
+        query = """
+            SELECT requestID, urgencyLevel, status, priorityScore, latitude, longitude, updatedAt
+            FROM SOSRequest
+        """
+        if since is None:
+            return self.fetch_all(query + " WHERE status IN ('pending','in_process','assigned')")
+        # Closed requests are read too so the index can drop them
+        return self.fetch_all(query + " WHERE updatedAt >= %s", (since,))
+
+    def get_resources(self, since=None):
+        query = """
+            SELECT rs.resourceID, rt.name AS resourceType, rs.quantity, rs.status,
+                   rs.latitude, rs.longitude, rs.lastUpdated AS updatedAt
+            FROM ResourceStock rs
+            JOIN ResourceType rt ON rs.resourceTypeID = rt.resourceTypeID
+        """
+        if since is None:
+            return self.fetch_all(query)
+        return self.fetch_all(query + " WHERE rs.lastUpdated >= %s", (since,))
+
+    def get_shelters(self):
+        query = "SELECT shelterID, name, capacity, current_occupancy, latitude, longitude FROM Shelter"
+        return self.fetch_all(query)
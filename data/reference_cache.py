@@ -0,0 +1,186 @@
+# data/reference_cache.py
+
+import threading
+import time
+
+from config.settings import REFERENCE_CACHE_CONFIG
+
+
+class ReferenceCache:
+    """
+    Process-wide TTL cache for small, rarely changing lookup tables.
+
+    Each dataset is registered with a loader(connection) that reads the whole
+    table once, and optionally with indexes: {index name: row -> key}, built
+    once per load. Lookups afterwards are dictionary reads until the TTL runs
+    out or a write path calls invalidate(name). Callers get their own copy of
+    the rows they are handed (rows are flat, so copying them is enough), so
+    they cannot change the cached ones.
+    """
+
+    def __init__(self, ttl_seconds=3600, enabled=True):
+        self.ttl = ttl_seconds
+        self.enabled = enabled
+        self._loaders = {}
+        self._indexes = {}            # name -> {index name: key function}
+        self._entries = {}            # name -> (value, {index name: {key: row}}, loaded_at)
+        self._versions = {}           # bumped by invalidate() so in-flight loads are not stored
+        self._lock = threading.Lock()
+        self.hits = {}
+        self.misses = {}
+
+    def register(self, name, loader, indexes=None):
+        self._loaders[name] = loader
+        self._indexes[name] = indexes or {}
+        self.hits.setdefault(name, 0)
+        self._versions.setdefault(name, 0)
+        self.misses.setdefault(name, 0)
+
+    def _current(self, name, connection):
+        """(value, indexes) of a dataset, loading it through connection when stale; not copied."""
+        with self._lock:
+            entry = self._entries.get(name)
+            if self.enabled and entry and time.monotonic() - entry[2] < self.ttl:
+                self.hits[name] += 1
+                return entry[0], entry[1]
+            self.misses[name] += 1
+            version = self._versions[name]
+
+        value = self._loaders[name](connection)
+        rows = value.values() if isinstance(value, dict) else value
+        indexes = {index: {key(row): row for row in rows}
+                   for index, key in self._indexes[name].items()}
+        with self._lock:
+            if self._versions[name] == version:
+                self._entries[name] = (value, indexes, time.monotonic())
+        return value, indexes
+
+    def get(self, name, connection):
+        """A copy of a dataset's cached value."""
+        return _copy_rows(self._current(name, connection)[0])
+
+    def find(self, name, index, key, connection):
+        """A copy of the row of a dataset whose index key matches, or None."""
+        row = self._current(name, connection)[1][index].get(key)
+        return dict(row) if row is not None else None
+
+    def invalidate(self, *names):
+        """Drop the given datasets (all of them when called without names)."""
+        with self._lock:
+            for name in names or list(self._loaders):
+                self._entries.pop(name, None)
+                self._versions[name] = self._versions.get(name, 0) + 1
+
+    def warm_up(self, connection):
+        for name in self._loaders:
+            self.get(name, connection)
+
+    def warm_up_async(self):
+        """Load every dataset on a background thread with its own connection."""
+        from data.db_connection import job_connection
+
+        def run():
+            try:
+                with job_connection() as connection:
+                    self.warm_up(connection)
+            except Exception as e:
+                print(f"⚠️ Reference cache warm-up failed: {e}")
+
+        threading.Thread(target=run, name="drms-reference-warmup", daemon=True).start()
+
+    def stats(self):
+        with self._lock:
+            result = {}
+            for name in self._loaders:
+                hits, misses = self.hits[name], self.misses[name]
+                result[name] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                    "cached": name in self._entries,
+                }
+            return result
+
+
+def _copy_rows(value):
+    """Copy of a dataset: a list of rows, or a dict of rows or of plain values."""
+    if isinstance(value, dict):
+        return {key: dict(row) if isinstance(row, dict) else row for key, row in value.items()}
+    return [dict(row) for row in value]
+
+
+def _fetch_all(connection, query):
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute(query)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def _load_resource_types(connection):
+    return _fetch_all(connection, "SELECT resourceTypeID, name, unit FROM ResourceType ORDER BY name")
+
+
+def _load_urgency_weights(connection):
+    rows = _fetch_all(connection, "SELECT urgencyLevel, weight FROM UrgencyWeight")
+    return {row["urgencyLevel"]: row["weight"] for row in rows}
+
+
+def _load_ngos(connection):
+    rows = _fetch_all(connection, "SELECT ngoID, orgName, verified, region FROM NGO ORDER BY orgName")
+    return {row["ngoID"]: row for row in rows}
+
+
+# Process-wide instance; use the module functions below (import the module,
+# not this name: `from data import reference_cache`).
+_cache = ReferenceCache(
+    ttl_seconds=REFERENCE_CACHE_CONFIG.get("ttl_seconds", 3600),
+    enabled=REFERENCE_CACHE_CONFIG.get("enabled", True)
+)
+_cache.register("resource_types", _load_resource_types, indexes={
+    "name": lambda row: row["name"],
+    "id": lambda row: row["resourceTypeID"],
+})
+_cache.register("urgency_weights", _load_urgency_weights)
+_cache.register("ngos", _load_ngos, indexes={"id": lambda row: row["ngoID"]})
+
+
+def invalidate(*names):
+    """Drop cached datasets after a write (all of them when called without names)."""
+    _cache.invalidate(*names)
+
+
+def warm_up_async():
+    _cache.warm_up_async()
+
+
+def stats():
+    return _cache.stats()
+
+
+def resource_types(connection):
+    """[{resourceTypeID, name, unit}] ordered by name."""
+    return _cache.get("resource_types", connection)
+
+
+def resource_type_by_name(connection, name):
+    return _cache.find("resource_types", "name", name, connection)
+
+
+def resource_type_by_id(connection, type_id):
+    return _cache.find("resource_types", "id", type_id, connection)
+
+
+def urgency_weights(connection):
+    return _cache.get("urgency_weights", connection)
+
+
+def ngos(connection):
+    """{ngoID: {ngoID, orgName, verified, region}}"""
+    return _cache.get("ngos", connection)
+
+
+def ngo(connection, ngo_id):
+    """{ngoID, orgName, verified, region} of one NGO, or None."""
+    return _cache.find("ngos", "id", ngo_id, connection)
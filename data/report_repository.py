@@ -0,0 +1,109 @@
+import json
+
+from .base_repository import BaseRepository
+
+# Report type -> (column headings, query); columns and SELECT list line up
+REPORT_QUERIES = {
+    "volunteers": (
+        ["ID", "Name", "Email", "Phone", "Location", "Status"],
+        """
+            SELECT u.userID, u.name, u.email, u.phone, u.location, v.status
+            FROM UserAccount u
+            LEFT JOIN Volunteer v ON v.volunteerID = u.userID
+            WHERE u.role = 'Volunteer'
+            ORDER BY u.userID
+        """
+    ),
+    "ngos": (
+        ["ID", "Organization", "Email", "Phone", "Region", "Verified"],
+        """
+            SELECT u.userID, COALESCE(n.orgName, u.name), u.email, u.phone, n.region,
+                   IF(n.verified, 'Yes', 'No')
+            FROM UserAccount u
+            LEFT JOIN NGO n ON n.ngoID = u.userID
+            WHERE u.role = 'NGO'
+            ORDER BY u.userID
+        """
+    ),
+    "victims": (
+        ["ID", "Name", "Email", "Phone", "Location", "Needs"],
+        """
+            SELECT u.userID, u.name, u.email, u.phone, u.location, vi.vulnerability_notes
+            FROM UserAccount u
+            LEFT JOIN Victim vi ON vi.victimID = u.userID
+            WHERE u.role = 'Victim'
+            ORDER BY u.userID
+        """
+    ),
+}
+
+
+class ReportRepository(BaseRepository):
+    STREAM_CHUNK_SIZE = 1000  # rows pulled from the server per fetchmany()
+
+    @staticmethod
+    def columns_for(report_type):
+        if report_type not in REPORT_QUERIES:
+            raise ValueError(f"Unknown report type: {report_type}")
+        return REPORT_QUERIES[report_type][0]
+
+    def preview(self, report_type, limit):
+        """First rows of a report as tuples, for on-screen display."""
+        self.columns_for(report_type)
+        cursor = self.db.cursor()
+        try:
+            cursor.execute(f"{REPORT_QUERIES[report_type][1]} LIMIT %s", (limit,))
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def stream(self, report_type, chunk_size=None):
+        """
+        Yield lists of row tuples from an unbuffered cursor, so only one chunk
+        is held in memory. The connection is busy until the generator is
+        exhausted or closed; use a dedicated (pooled) connection.
+        """
+        self.columns_for(report_type)
+        connection = self._session()
+        if connection.in_transaction:
+            connection.commit()
+        cursor = connection.cursor(buffered=False)
+        finished = False
+        try:
+            cursor.execute(REPORT_QUERIES[report_type][1])
+            while True:
+                rows = cursor.fetchmany(chunk_size or self.STREAM_CHUNK_SIZE)
+                if not rows:
+                    finished = True
+                    return
+                yield rows
+        finally:
+            if not finished:
+                # Abandoned half way: drain the rest so the session can be reused
+                try:
+                    connection.consume_results()
+                except Exception:
+                    pass
+            cursor.close()
+
+    def record_report(self, report_type, parameters, generated_by, file_path):
+        query = """
+            INSERT INTO Report (reportType, parameters, generatedBy, filePath)
+            VALUES (%s, %s, %s, %s)
+        """
+        result = self.execute(query, (report_type, json.dumps(parameters), generated_by, file_path))
+        return result.lastrowid
+
+    def find_recent(self, report_type, parameters_key, max_age_seconds):
+        """Newest Report row with the same parameter key generated within max_age_seconds."""
+        query = """
+            SELECT reportID, filePath, generatedAt,
+                   JSON_UNQUOTE(JSON_EXTRACT(parameters, '$.rows')) AS rowCount
+            FROM Report
+            WHERE reportType = %s
+              AND generatedAt >= NOW() - INTERVAL %s SECOND
+              AND JSON_UNQUOTE(JSON_EXTRACT(parameters, '$.key')) = %s
+            ORDER BY generatedAt DESC
+            LIMIT 1
+        """
+        return self.fetch_one(query, (report_type, max_age_seconds, parameters_key))
@@ -1,6 +1,8 @@
 from .base_repository import BaseRepository
+from . import reference_cache
 
 class ResourceRepository(BaseRepository):
+    ALLOCATION_CHUNK_SIZE = 1000  # plan lines per statement inside an allocation transaction
 
     def add_resource(self, resource_type_id, donor_ngo_id, quantity, last_verified_by, location, latitude=0.0, longitude=0.0):
         query = """
@@ -40,18 +42,15 @@ class ResourceRepository(BaseRepository):
         return True
 
     def get_resource_type_id_by_name(self, name):
-        query = "SELECT resourceTypeID FROM ResourceType WHERE name = %s"
-        result = self.fetch_one(query, (name,))
+        result = reference_cache.resource_type_by_name(self.db, name)
         return result['resourceTypeID'] if result else None
 
     def get_resource_type_name_by_id(self, type_id):
-        query = "SELECT name FROM ResourceType WHERE resourceTypeID = %s"
-        result = self.fetch_one(query, (type_id,))
+        result = reference_cache.resource_type_by_id(self.db, type_id)
         return result['name'] if result else None
 
     def get_all_resource_types(self):
-        query = "SELECT resourceTypeID, name FROM ResourceType"
-        return self.fetch_all(query)
+        return reference_cache.resource_types(self.db)
 
     def get_resource_quantity(self, resource_id):
         query = "SELECT quantity FROM ResourceStock WHERE resourceID = %s"
@@ -73,3 +72,143 @@ class ResourceRepository(BaseRepository):
         """
         self.execute(query, (resource_id, allocated_to_type, allocated_to_id, request_id, quantity, allocation_status))
         return True
+
+    def _deduct_stock(self, cursor, resource_id, quantity):
+        """Take quantity off a stock row in the caller's transaction, only if that much is there."""
+        # status is assigned first so it sees the quantity before deduction
+        cursor.execute("""
+            UPDATE ResourceStock
+            SET status = CASE
+                    WHEN quantity - %s <= 0 THEN 'out_of_stock'
+                    WHEN quantity - %s <= 5 THEN 'low'
+                    ELSE status
+                END,
+                quantity = quantity - %s
+            WHERE resourceID = %s AND quantity >= %s
+        """, (quantity, quantity, quantity, resource_id, quantity))
+        if cursor.rowcount != 1:
+            raise ValueError("Insufficient resources available.")
+
+    def transfer_from_stock(self, resource_id, from_ngo_id, to_ngo_id, from_location, to_location, quantity, transferred_by):
+        """Deduct stock and record the transfer atomically; returns the transferID."""
+        def work(cursor):
+            self._deduct_stock(cursor, resource_id, quantity)
+            cursor.execute("""
+                INSERT INTO ResourceTransfer (resourceID, fromNGO, toNGO, fromLocation, toLocation, quantity, status, transferredBy)
+                VALUES (%s, %s, %s, %s, %s, %s, 'pending', %s)
+            """, (resource_id, from_ngo_id, to_ngo_id, from_location, to_location, quantity, transferred_by))
+            return cursor.lastrowid
+        return self.run_transaction(work)
+
+    def allocate_from_stock(self, resource_id, allocated_to_type, allocated_to_id, request_id, quantity):
+        """
+        Deduct stock, record the allocation and move a linked pending request
+        to in_process atomically; returns the allocationID.
+        """
+        def work(cursor):
+            self._deduct_stock(cursor, resource_id, quantity)
+            cursor.execute("""
+                INSERT INTO ResourceAllocation (resourceID, allocatedToType, allocatedToID, requestID, quantity, allocationStatus)
+                VALUES (%s, %s, %s, %s, %s, 'pending')
+            """, (resource_id, allocated_to_type, allocated_to_id, request_id, quantity))
+            allocation_id = cursor.lastrowid
+            if request_id:
+                cursor.execute(
+                    "UPDATE SOSRequest SET status = 'in_process' WHERE requestID = %s AND status = 'pending'",
+                    (request_id,)
+                )
+            return allocation_id
+        return self.run_transaction(work)
+
+    def get_need_resource_types(self):
+        query = """
+            SELECT n.needKeyword, n.resourceTypeID, rt.name AS resourceType, n.quantityPerPerson
+            FROM NeedResourceType n
+            JOIN ResourceType rt ON n.resourceTypeID = rt.resourceTypeID
+        """
+        return self.fetch_all(query)
+
+    def get_unserved_requests(self):
+        """Pending requests that have no live allocation yet, most urgent first."""
+        query = """
+            SELECT r.requestID, r.victimID, r.typeOfNeed, r.urgencyLevel, r.peopleAffected,
+                   r.priorityScore, r.location, r.latitude, r.longitude
+            FROM SOSRequest r
+            WHERE r.status = 'pending'
+              AND NOT EXISTS (
+                  SELECT 1 FROM ResourceAllocation a
+                  WHERE a.requestID = r.requestID AND a.allocationStatus <> 'cancelled'
+              )
+            ORDER BY r.priorityScore DESC, r.createdAt ASC
+        """
+        return self.fetch_all(query)
+
+    def get_allocatable_stock(self, donor_ngo_id=None):
+        query = """
+            SELECT rs.resourceID, rs.resourceTypeID, rt.name AS resourceType, rs.quantity,
+                   rs.location, rs.latitude, rs.longitude, rs.donorNGO
+            FROM ResourceStock rs
+            JOIN ResourceType rt ON rs.resourceTypeID = rt.resourceTypeID
+            WHERE rs.status IN ('available', 'low') AND rs.quantity > 0
+        """
+        if donor_ngo_id is None:
+            return self.fetch_all(query)
+        return self.fetch_all(query + " AND rs.donorNGO = %s", (donor_ngo_id,))
+
+    def commit_allocation_plan(self, lines):
+        """
+        Apply [(resourceID, victimID, requestID, quantity)] in one transaction:
+        allocation rows, stock deductions and request statuses. Raises
+        ValueError, leaving nothing written, if any stock ran short meanwhile.
+        """
+        if not lines:
+            return 0
+        with self.transaction() as cursor:
+            for start in range(0, len(lines), self.ALLOCATION_CHUNK_SIZE):
+                self._allocate_chunk(cursor, lines[start:start + self.ALLOCATION_CHUNK_SIZE])
+        return len(lines)
+
+    def _allocate_chunk(self, cursor, lines):
+        cursor.executemany("""
+            INSERT INTO ResourceAllocation (resourceID, allocatedToType, allocatedToID, requestID, quantity, allocationStatus)
+            VALUES (%s, 'Victim', %s, %s, %s, 'pending')
+        """, lines)
+
+        totals = {}
+        for resource_id, _, _, quantity in lines:
+            totals[resource_id] = totals.get(resource_id, 0) + quantity
+        # Lock the rows (in id order) and work out the new quantities here, so
+        # neither SET assignment below depends on the other having run first:
+        # MySQL does not order assignments of a multiple-table UPDATE.
+        resource_ids = sorted(totals)
+        cursor.execute(f"""
+            SELECT resourceID, quantity FROM ResourceStock
+            WHERE resourceID IN ({", ".join(["%s"] * len(resource_ids))})
+            ORDER BY resourceID
+            FOR UPDATE
+        """, tuple(resource_ids))
+        available = {row["resourceID"]: row["quantity"] for row in cursor.fetchall()}
+        remaining = {}
+        for resource_id in resource_ids:
+            if available.get(resource_id, 0) < totals[resource_id]:
+                raise ValueError("Stock changed while planning; refresh and plan again.")
+            remaining[resource_id] = available[resource_id] - totals[resource_id]
+
+        rows = " UNION ALL ".join(["SELECT %s AS resourceID, %s AS quantity"] * len(remaining))
+        cursor.execute(f"""
+            UPDATE ResourceStock rs
+            JOIN ({rows}) d ON d.resourceID = rs.resourceID
+            SET rs.quantity = d.quantity,
+                rs.status = CASE
+                    WHEN d.quantity <= 0 THEN 'out_of_stock'
+                    WHEN d.quantity <= 5 THEN 'low'
+                    ELSE rs.status
+                END
+        """, tuple(value for pair in remaining.items() for value in pair))
+
+        request_ids = sorted({request_id for _, _, request_id, _ in lines})
+        placeholders = ", ".join(["%s"] * len(request_ids))
+        cursor.execute(f"""
+            UPDATE SOSRequest SET status = 'in_process'
+            WHERE requestID IN ({placeholders}) AND status = 'pending'
+        """, tuple(request_ids))
@@ -0,0 +1,78 @@
+from mysql.connector import IntegrityError
+
+from .base_repository import BaseRepository
+from .sos_repository import OPEN_STATUSES
+
+# Duplicate entry on uq_shelter_request: the request already has a shelter
+DUPLICATE_KEY_ERRNO = 1062
+
+
+class ShelterRepository(BaseRepository):
+    CHUNK_SIZE = 1000  # rows per statement inside the commit transaction
+
+    def get_shelters_with_room(self):
+        query = """
+            SELECT shelterID, name, latitude, longitude, capacity, current_occupancy
+            FROM Shelter
+            WHERE capacity > current_occupancy
+        """
+        return self.fetch_all(query)
+
+    def get_unsheltered_requests(self, need_keywords):
+        """Open SOS requests whose type of need mentions a keyword and that have no shelter yet."""
+        needs = " OR ".join(["LOWER(s.typeOfNeed) LIKE %s"] * len(need_keywords))
+        query = f"""
+            SELECT s.requestID, s.victimID, s.latitude, s.longitude, s.peopleAffected,
+                   s.urgencyLevel, s.priorityScore
+            FROM SOSRequest s
+            LEFT JOIN ShelterAssignment a ON a.requestID = s.requestID
+            WHERE s.status IN (%s, %s, %s) AND a.assignmentID IS NULL AND ({needs})
+        """
+        return self.fetch_all(query, (*OPEN_STATUSES, *[f"%{k.lower()}%" for k in need_keywords]))
+
+    def commit_assignments(self, assignments):
+        """
+        Record assignments and add their people to each shelter's occupancy in
+        one transaction. Raises RuntimeError, leaving nothing written, if a
+        shelter no longer has room or a request was sheltered meanwhile.
+        Occupancy is given back by the trg_shelter_* triggers when a request
+        is closed or deleted.
+        """
+        per_shelter = {}
+        for a in assignments:
+            per_shelter[a["shelterID"]] = per_shelter.get(a["shelterID"], 0) + a["people"]
+        shelters = list(per_shelter.items())
+
+        def work(cursor):
+            for start in range(0, len(shelters), self.CHUNK_SIZE):
+                chunk = shelters[start:start + self.CHUNK_SIZE]
+                rows = " UNION ALL ".join(["SELECT %s AS shelterID, %s AS people"] * len(chunk))
+                cursor.execute(f"""
+                    UPDATE Shelter s
+                    JOIN ({rows}) a ON a.shelterID = s.shelterID
+                    SET s.current_occupancy = s.current_occupancy + a.people
+                    WHERE s.current_occupancy + a.people <= s.capacity
+                """, tuple(value for pair in chunk for value in pair))
+                if cursor.rowcount != len(chunk):
+                    raise RuntimeError("Some shelters filled up in the meantime; run the matching again.")
+
+            for start in range(0, len(assignments), self.CHUNK_SIZE):
+                chunk = assignments[start:start + self.CHUNK_SIZE]
+                cursor.executemany("""
+                    INSERT INTO ShelterAssignment (shelterID, victimID, requestID, people, distance_km)
+                    VALUES (%s, %s, %s, %s, %s)
+                """, [(a["shelterID"], a["victimID"], a["requestID"], a["people"], a["distance_km"])
+                      for a in chunk])
+                cursor.execute(f"""
+                    UPDATE SOSRequest SET status = 'in_process'
+                    WHERE status = 'pending' AND requestID IN ({", ".join(["%s"] * len(chunk))})
+                """, tuple(a["requestID"] for a in chunk))
+            return len(assignments)
+
+        try:
+            return self.run_transaction(work)
+        except IntegrityError as e:
+            if e.errno != DUPLICATE_KEY_ERRNO:
+                raise
+            raise RuntimeError("Some requests were given a shelter in the meantime; "
+                               "run the matching again.") from e
@@ -0,0 +1,194 @@
+from config.settings import PRIORITY_SCORING_CONFIG
+from .base_repository import BaseRepository
+from . import reference_cache
+
+OPEN_STATUSES = ("pending", "in_process", "assigned")
+
+
+class SOSRepository(BaseRepository):
+    SUBMISSION_COLUMNS = ("victimID", "location", "latitude", "longitude", "typeOfNeed",
+                          "description", "urgencyLevel", "peopleAffected", "submissionKey")
+
+    def get_open_batch(self, after_id, limit):
+        """Next chunk of open requests after after_id, in requestID order."""
+        query = """
+            SELECT requestID, urgencyLevel, latitude, longitude, peopleAffected,
+                   priorityScore, TIMESTAMPDIFF(MINUTE, createdAt, NOW()) AS ageMinutes
+            FROM SOSRequest
+            WHERE requestID > %s AND status IN (%s, %s, %s)
+            ORDER BY requestID
+            LIMIT %s
+        """
+        return self.fetch_all(query, (after_id, *OPEN_STATUSES, limit))
+
+    def get_open_points(self):
+        """Coordinates and urgency of every open request that has a location."""
+        query = """
+            SELECT latitude, longitude, urgencyLevel
+            FROM SOSRequest
+            WHERE status IN (%s, %s, %s) AND latitude IS NOT NULL AND longitude IS NOT NULL
+              AND NOT (latitude = 0 AND longitude = 0)
+        """
+        return self.fetch_all(query, OPEN_STATUSES)
+
+    def get_zone_points(self, since=None):
+        """
+        (database time, rows) for the zone index: every open request, or with
+        `since` every request changed from a few seconds before it.
+        """
+        now = self.fetch_one("SELECT NOW() AS now")["now"]
+        if since is None:
+            query = """
+                SELECT requestID, status, latitude, longitude FROM SOSRequest
+                WHERE status IN (%s, %s, %s)
+            """
+            return now, self.fetch_all(query, OPEN_STATUSES)
+        query = """
+            SELECT requestID, status, latitude, longitude FROM SOSRequest
+            WHERE updatedAt >= %s - INTERVAL 5 SECOND
+        """
+        return now, self.fetch_all(query, (since,))
+
+    def get_urgency_weights(self):
+        return reference_cache.urgency_weights(self.db)
+
+    def get_priority_zones(self):
+        query = "SELECT zoneID, centerLat, centerLong, radius_km, priority_level FROM PriorityZone"
+        return self.fetch_all(query)
+
+    def update_priority_scores(self, scores):
+        """
+        Write {requestID: score} in one statement. updatedAt is kept as is so
+        rescoring does not show up as an edit in change feeds.
+        """
+        if not scores:
+            return 0
+        rows = " UNION ALL ".join(["SELECT %s AS requestID, %s AS score"] * len(scores))
+        params = []
+        for request_id, score in scores.items():
+            params.extend((request_id, score))
+        query = f"""
+            UPDATE SOSRequest r
+            JOIN ({rows}) s ON s.requestID = r.requestID
+            SET r.priorityScore = s.score, r.updatedAt = r.updatedAt
+        """
+        return self.execute(query, tuple(params)).rowcount
+
+    def compute_open_priorities(self, config=None):
+        """
+        Rescore open requests inside MySQL with the compute_open_priorities()
+        procedure, passing PRIORITY_SCORING_CONFIG as its factors.
+        """
+        cfg = dict(PRIORITY_SCORING_CONFIG, **(config or {}))
+        zone_bonus = cfg["zone_bonus"]
+        cursor = self.db.cursor()
+        try:
+            cursor.callproc("compute_open_priorities", (
+                cfg["batch_size"], cfg["urgency_points"], cfg["age_step_minutes"],
+                cfg["people_weight"], cfg["people_cap"],
+                zone_bonus.get("low", 0), zone_bonus.get("medium", 0), zone_bonus.get("high", 0),
+            ))
+            self.db.commit()
+        finally:
+            cursor.close()
+
+    def set_urgency(self, request_ids, urgency_level, with_duplicates=False):
+        """
+        Change the urgency of requests (and, with_duplicates, of their pending
+        duplicates). priorityScore moves by the change in urgency weight so the
+        new order holds before the next rescoring run. Returns the changed
+        rows (requestID, status, urgencyLevel, priorityScore, location).
+        """
+        if not request_ids:
+            return []
+        placeholders = ", ".join(["%s"] * len(request_ids))
+        where = f"r.requestID IN ({placeholders})"
+        params = tuple(request_ids)
+        if with_duplicates:
+            where += f" OR (r.duplicateOf IN ({placeholders}) AND r.status = 'pending')"
+            params += tuple(request_ids)
+
+        def work(cursor):
+            cursor.execute(f"""
+                UPDATE SOSRequest r
+                LEFT JOIN UrgencyWeight w_old ON w_old.urgencyLevel = r.urgencyLevel
+                LEFT JOIN UrgencyWeight w_new ON w_new.urgencyLevel = %s
+                SET r.priorityScore = COALESCE(r.priorityScore, 0)
+                        + (COALESCE(w_new.weight, 0) - COALESCE(w_old.weight, 0)) * %s,
+                    r.urgencyLevel = %s
+                WHERE {where}
+            """, (urgency_level, PRIORITY_SCORING_CONFIG["urgency_points"], urgency_level, *params))
+            cursor.execute(f"""
+                SELECT r.requestID, r.status, r.urgencyLevel, r.priorityScore, r.location
+                FROM SOSRequest r
+                WHERE {where}
+            """, params)
+            return cursor.fetchall()
+
+        return self.run_transaction(work)
+
+    def get_recent_pending(self, minutes):
+        """Pending requests created in the last `minutes`, oldest first (for duplicate detection)."""
+        query = """
+            SELECT requestID, location, latitude, longitude, typeOfNeed, createdAt, duplicateOf
+            FROM SOSRequest
+            WHERE status = 'pending' AND createdAt >= NOW() - INTERVAL %s MINUTE
+            ORDER BY requestID
+        """
+        return self.fetch_all(query, (minutes,))
+
+    def link_duplicates(self, links):
+        """
+        Point each {requestID: headID} at its cluster head. Heads get their
+        updatedAt touched so change feeds pick up the new cluster size.
+        """
+        if not links:
+            return 0
+        rows = " UNION ALL ".join(["SELECT %s AS requestID, %s AS headID"] * len(links))
+        params = []
+        for request_id, head_id in links.items():
+            params.extend((request_id, head_id))
+        heads = sorted(set(links.values()))
+
+        def work(cursor):
+            cursor.execute(f"""
+                UPDATE SOSRequest r
+                JOIN ({rows}) l ON l.requestID = r.requestID
+                SET r.duplicateOf = l.headID
+                WHERE r.duplicateOf IS NULL
+            """, tuple(params))
+            linked = cursor.rowcount
+            cursor.execute(f"""
+                UPDATE SOSRequest SET updatedAt = NOW()
+                WHERE requestID IN ({", ".join(["%s"] * len(heads))})
+            """, tuple(heads))
+            return linked
+        return self.run_transaction(work)
+
+    def insert_batch(self, submissions):
+        """
+        Insert many SOS submissions with one multi-row INSERT and return their
+        requestIDs in order. Every submission carries a submissionKey; a key
+        that is already stored is not inserted again and maps to the original
+        request, so client retries are harmless.
+        """
+        if not submissions:
+            return []
+        row = "(" + ", ".join(["%s"] * len(self.SUBMISSION_COLUMNS)) + ", 'pending')"
+        query = f"""
+            INSERT INTO SOSRequest ({", ".join(self.SUBMISSION_COLUMNS)}, status)
+            VALUES {", ".join([row] * len(submissions))}
+            ON DUPLICATE KEY UPDATE submissionKey = submissionKey
+        """
+        params = tuple(s[column] for s in submissions for column in self.SUBMISSION_COLUMNS)
+        keys = [s["submissionKey"] for s in submissions]
+
+        def work(cursor):
+            cursor.execute(query, params)
+            cursor.execute(f"""
+                SELECT requestID, submissionKey FROM SOSRequest
+                WHERE submissionKey IN ({", ".join(["%s"] * len(keys))})
+            """, tuple(keys))
+            ids = {row["submissionKey"]: row["requestID"] for row in cursor.fetchall()}
+            return [ids[key] for key in keys]
+        return self.run_transaction(work)
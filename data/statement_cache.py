@@ -0,0 +1,131 @@
+# data/statement_cache.py
+
+import threading
+import weakref
+from collections import OrderedDict
+
+from mysql.connector import Error
+
+# Server error raised when a prepared statement handle no longer exists
+# (e.g. after the session was reconnected).
+ER_UNKNOWN_STMT_HANDLER = 1243
+
+
+class StatementCache:
+    """
+    LRU cache of server-side prepared statements for one MySQL session.
+
+    Each distinct SQL text gets its own prepared cursor; evicted cursors are
+    closed so the server deallocates the statement. The connection is only
+    weakly referenced, so the cache never keeps its own key in _caches alive.
+    """
+
+    def __init__(self, connection, max_size=64):
+        self._connection = weakref.ref(connection)
+        self.max_size = max_size
+        self._cursors = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _cursor_for(self, query):
+        cursor = self._cursors.get(query)
+        if cursor is not None:
+            self._cursors.move_to_end(query)
+            self.hits += 1
+            return cursor
+
+        self.misses += 1
+        connection = self._connection()
+        if connection is None:
+            raise Error("The connection of this statement cache was closed.")
+        cursor = connection.cursor(prepared=True)
+        self._cursors[query] = cursor
+        if len(self._cursors) > self.max_size:
+            _, evicted = self._cursors.popitem(last=False)
+            self.evictions += 1
+            self._close_cursor(evicted)
+        return cursor
+
+    def execute(self, query, params=()):
+        """Execute query on its cached prepared cursor, re-preparing once if the handle went stale."""
+        cursor = self._cursor_for(query)
+        try:
+            cursor.execute(query, params)
+        except Error as e:
+            if e.errno != ER_UNKNOWN_STMT_HANDLER:
+                raise
+            self.clear()
+            cursor = self._cursor_for(query)
+            cursor.execute(query, params)
+        return cursor
+
+    def fetch_one(self, query, params=()):
+        cursor = self.execute(query, params)
+        rows = cursor.fetchall()
+        return self._as_dict(cursor, rows[0]) if rows else None
+
+    def fetch_all(self, query, params=()):
+        cursor = self.execute(query, params)
+        return [self._as_dict(cursor, row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _as_dict(cursor, row):
+        return dict(zip(cursor.column_names, row))
+
+    @staticmethod
+    def _close_cursor(cursor):
+        try:
+            cursor.close()
+        except Error:
+            pass
+
+    def clear(self):
+        """Close every cached cursor (deallocating the prepared statements)."""
+        while self._cursors:
+            _, cursor = self._cursors.popitem()
+            self._close_cursor(cursor)
+
+    def stats(self):
+        return {
+            "size": len(self._cursors),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+# One cache per physical connection; entries vanish with their connection.
+_caches = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def statements_for(connection, max_size=64):
+    """Return the StatementCache bound to this physical connection."""
+    with _caches_lock:
+        cache = _caches.get(connection)
+        if cache is None:
+            cache = StatementCache(connection, max_size)
+            _caches[connection] = cache
+        return cache
+
+
+def forget(connection):
+    """Drop the cache of a connection whose session was reset or closed."""
+    with _caches_lock:
+        cache = _caches.pop(connection, None)
+    if cache is not None:
+        cache.clear()
+
+
+def cache_stats():
+    """Aggregate hit/miss counters across every live connection."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    totals = {"connections": len(caches), "size": 0, "hits": 0, "misses": 0, "evictions": 0}
+    for cache in caches:
+        for key, value in cache.stats().items():
+            totals[key] += value
+    lookups = totals["hits"] + totals["misses"]
+    totals["hit_rate"] = totals["hits"] / lookups if lookups else 0.0
+    return totals
@@ -0,0 +1,90 @@
+from .base_repository import BaseRepository
+
+
+class TaskRepository(BaseRepository):
+    CHUNK_SIZE = 1000  # pairs per statement inside a batch-assignment transaction
+
+    def get_unassigned_tasks(self):
+        query = """
+            SELECT t.taskID, t.title, t.taskType, t.relatedRequestID, t.createdAt,
+                   COALESCE(s.urgencyLevel, 'medium') AS urgency, s.latitude, s.longitude
+            FROM Task t
+            LEFT JOIN SOSRequest s ON t.relatedRequestID = s.requestID
+            WHERE t.status = 'unassigned'
+        """
+        return self.fetch_all(query)
+
+    def get_available_volunteers(self):
+        query = """
+            SELECT v.volunteerID, u.name, v.roles, u.latitude, u.longitude
+            FROM Volunteer v
+            JOIN UserAccount u ON v.volunteerID = u.userID
+            WHERE v.status = 'available'
+        """
+        return self.fetch_all(query)
+
+    def get_volunteer_location(self, volunteer_id):
+        return self.fetch_one("SELECT latitude, longitude FROM UserAccount WHERE userID = %s", (volunteer_id,))
+
+    def get_delivery_stops(self, volunteer_id):
+        """
+        One row per (open delivery task, outstanding allocation for its SOS
+        request): drop-off coordinates from SOSRequest, pickup coordinates
+        from ResourceStock. Tasks without allocations come back once with
+        NULL allocation columns.
+        """
+        query = """
+            SELECT t.taskID, s.requestID, s.location, s.latitude, s.longitude,
+                   a.allocationID, a.quantity, rs.resourceID, rt.name AS resourceName,
+                   rs.location AS pickupLocation, rs.latitude AS pickupLat, rs.longitude AS pickupLong
+            FROM Task t
+            JOIN SOSRequest s ON s.requestID = t.relatedRequestID
+            LEFT JOIN ResourceAllocation a
+              ON a.requestID = s.requestID AND a.allocationStatus IN ('pending', 'sent')
+            LEFT JOIN ResourceStock rs ON rs.resourceID = a.resourceID
+            LEFT JOIN ResourceType rt ON rt.resourceTypeID = rs.resourceTypeID
+            WHERE t.assignedVolunteerID = %s AND t.taskType = 'delivery'
+              AND t.status IN ('assigned', 'in_progress')
+            ORDER BY t.taskID
+        """
+        return self.fetch_all(query, (volunteer_id,))
+
+    def commit_assignments(self, assignments, assigned_by, note):
+        """
+        Apply [(taskID, volunteerID)] in one transaction: tasks, volunteer
+        statuses and TaskHistory rows. Raises RuntimeError, leaving nothing
+        written, if any task or volunteer was taken in the meantime.
+        """
+        if not assignments:
+            return 0
+        with self.transaction() as cursor:
+            for start in range(0, len(assignments), self.CHUNK_SIZE):
+                self._assign_chunk(cursor, assignments[start:start + self.CHUNK_SIZE], assigned_by, note)
+        return len(assignments)
+
+    def _assign_chunk(self, cursor, assignments, assigned_by, note):
+        pairs = " UNION ALL ".join(["SELECT %s AS taskID, %s AS volunteerID"] * len(assignments))
+        pair_params = [value for pair in assignments for value in pair]
+        volunteer_ids = [volunteer_id for _, volunteer_id in assignments]
+        placeholders = ", ".join(["%s"] * len(volunteer_ids))
+
+        cursor.execute(f"""
+            UPDATE Task t
+            JOIN ({pairs}) a ON a.taskID = t.taskID
+            SET t.assignedVolunteerID = a.volunteerID, t.status = 'assigned', t.createdBy = %s
+            WHERE t.status = 'unassigned'
+        """, (*pair_params, assigned_by))
+        if cursor.rowcount != len(assignments):
+            raise RuntimeError("Some tasks were assigned by someone else; refresh and plan again.")
+
+        cursor.execute(f"""
+            UPDATE Volunteer SET status = 'busy', last_active = NOW()
+            WHERE volunteerID IN ({placeholders}) AND status = 'available'
+        """, tuple(volunteer_ids))
+        if cursor.rowcount != len(volunteer_ids):
+            raise RuntimeError("Some volunteers are no longer available; refresh and plan again.")
+
+        cursor.executemany("""
+            INSERT INTO TaskHistory (taskID, volunteerID, previousStatus, newStatus, note)
+            VALUES (%s, %s, 'unassigned', 'assigned', %s)
+        """, [(task_id, volunteer_id, note) for task_id, volunteer_id in assignments])
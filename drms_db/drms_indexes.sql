@@ -6,14 +6,25 @@ CREATE INDEX idx_user_location ON UserAccount(latitude, longitude);
 CREATE INDEX idx_ngo_verified ON NGO(verified);
 
 CREATE INDEX idx_volunteer_status ON Volunteer(status);
+CREATE INDEX idx_volunteer_updated ON Volunteer(updatedAt);
+CREATE INDEX idx_user_updated ON UserAccount(updatedAt);
 
 CREATE INDEX idx_sos_status ON SOSRequest(status);
 CREATE INDEX idx_sos_urgency ON SOSRequest(urgencyLevel);
 CREATE INDEX idx_sos_priority ON SOSRequest(priorityScore DESC);
+CREATE INDEX idx_sos_updated ON SOSRequest(updatedAt);
+CREATE INDEX idx_sos_status_created ON SOSRequest(status, createdAt);
 
 CREATE INDEX idx_resource_type ON ResourceStock(resourceTypeID);
 CREATE INDEX idx_resource_status ON ResourceStock(status);
+CREATE INDEX idx_resource_updated ON ResourceStock(lastUpdated);
+CREATE INDEX idx_allocation_request ON ResourceAllocation(requestID, allocationStatus);
 
 CREATE INDEX idx_task_status ON Task(status);
 
-CREATE INDEX idx_notification_recipient ON Notification(recipientUserID);
+CREATE INDEX idx_notification_role_created ON Notification(recipientRole, createdAt);
+CREATE INDEX idx_notification_user_status_created ON Notification(recipientUserID, status, createdAt);
+CREATE INDEX idx_notification_delivery ON Notification(status, channel, notificationID);
+CREATE INDEX idx_outbox_status ON NotificationOutbox(status, outboxID);
+
+CREATE INDEX idx_report_type_generated ON Report(reportType, generatedAt);
@@ -90,6 +90,17 @@ INSERT INTO ResourceStock (resourceID, resourceTypeID, donorNGO, quantity, statu
 (2, 2, 6, 150, 'reserved', 8, 'Shelter 2 Storage', 34.0650, -118.2600),
 (3, 3, 2, 10, 'low', 1, 'Mobile Unit 1', 34.0550, -118.2470);
 
+-- NeedResourceType
+INSERT INTO NeedResourceType (needKeyword, resourceTypeID, quantityPerPerson) VALUES
+('Medical', 3, 1),
+('Food', 1, 6),
+('Water', 1, 6),
+('Flood', 1, 6),
+('Flood', 2, 1),
+('Shelter', 2, 1),
+('Rescue', 3, 1),
+('Trapped', 3, 1);
+
 -- ResourceAdd
 INSERT INTO ResourceAdd (resourceID, addedBy, quantity, note) VALUES
 (1, 2, 200, 'Initial stock'),
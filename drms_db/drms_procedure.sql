@@ -1,14 +1,117 @@
 USE drms;
 
 DELIMITER //
-CREATE PROCEDURE compute_priorities()
+-- Rescores open requests only, one chunk of p_batch_size rows per transaction.
+-- Mirrors services/priority_scoring_service.py: urgency weight, waiting time,
+-- people affected and the best PriorityZone containing the request. The factors
+-- are parameters so callers pass PRIORITY_SCORING_CONFIG
+-- (SOSRepository.compute_open_priorities) instead of copies of it living here.
+CREATE PROCEDURE compute_open_priorities(IN p_batch_size INT, IN p_urgency_points INT,
+                                         IN p_age_step_minutes INT, IN p_people_weight INT,
+                                         IN p_people_cap INT, IN p_zone_low INT,
+                                         IN p_zone_medium INT, IN p_zone_high INT)
 BEGIN
-    UPDATE SOSRequest r
-    JOIN UrgencyWeight u ON r.urgencyLevel = u.urgencyLevel
-    SET r.priorityScore =
-        (u.weight * 100)
-        + GREATEST(0, TIMESTAMPDIFF(MINUTE, r.createdAt, NOW()) DIV 30);
+    DECLARE v_last_id INT DEFAULT 0;
+    DECLARE v_batch_end INT;
+
+    batch_loop: LOOP
+        SELECT MAX(requestID) INTO v_batch_end
+        FROM (
+            SELECT requestID FROM SOSRequest
+            WHERE requestID > v_last_id AND status IN ('pending','in_process','assigned')
+            ORDER BY requestID
+            LIMIT p_batch_size
+        ) batch;
+
+        IF v_batch_end IS NULL THEN
+            LEAVE batch_loop;
+        END IF;
+
+        START TRANSACTION;
+        UPDATE SOSRequest r
+        JOIN UrgencyWeight u ON r.urgencyLevel = u.urgencyLevel
+        LEFT JOIN (
+            SELECT s.requestID,
+                   MAX(CASE z.priority_level WHEN 'high' THEN p_zone_high
+                                             WHEN 'medium' THEN p_zone_medium
+                                             ELSE p_zone_low END) AS bonus
+            FROM SOSRequest s
+            JOIN PriorityZone z
+              ON ST_Distance_Sphere(POINT(s.longitude, s.latitude), POINT(z.centerLong, z.centerLat)) <= z.radius_km * 1000
+            WHERE s.requestID > v_last_id AND s.requestID <= v_batch_end
+              AND NOT (s.latitude = 0 AND s.longitude = 0)
+            GROUP BY s.requestID
+        ) zb ON zb.requestID = r.requestID
+        SET r.priorityScore =
+                (u.weight * p_urgency_points)
+                + GREATEST(0, TIMESTAMPDIFF(MINUTE, r.createdAt, NOW()) DIV p_age_step_minutes)
+                + (LEAST(GREATEST(IFNULL(r.peopleAffected, 1), 1), p_people_cap) - 1) * p_people_weight
+                + IFNULL(zb.bonus, 0),
+            r.updatedAt = r.updatedAt
+        WHERE r.requestID > v_last_id AND r.requestID <= v_batch_end
+          AND r.status IN ('pending','in_process','assigned');
+        COMMIT;
+
+        SET v_last_id = v_batch_end;
+    END LOOP;
+END //
+
+-- Dashboard counters: bump_counter() is called from the triggers in
+-- drms_triggers.sql; rebuild_dashboard_counters() recomputes everything from
+-- the base tables (initial fill, or repair after bulk loads with triggers off).
+CREATE PROCEDURE bump_counter(IN p_entity VARCHAR(30), IN p_bucket VARCHAR(60), IN p_delta BIGINT)
+BEGIN
+    IF p_delta <> 0 THEN
+        INSERT INTO DashboardCounter (entity, bucket, value)
+        VALUES (p_entity, p_bucket, p_delta)
+        ON DUPLICATE KEY UPDATE value = value + p_delta;
+    END IF;
+END //
+
+CREATE PROCEDURE rebuild_dashboard_counters()
+BEGIN
+    START TRANSACTION;
+    DELETE FROM DashboardCounter;
+
+    INSERT INTO DashboardCounter (entity, bucket, value)
+    SELECT 'Volunteer', CONCAT('status:', status), COUNT(*) FROM Volunteer GROUP BY status
+    UNION ALL
+    SELECT 'Volunteer', CONCAT('verified:', IF(verified, 1, 0)), COUNT(*) FROM Volunteer GROUP BY IF(verified, 1, 0)
+    UNION ALL
+    SELECT 'NGO', CONCAT('verified:', IF(verified, 1, 0)), COUNT(*) FROM NGO GROUP BY IF(verified, 1, 0)
+    UNION ALL
+    SELECT 'Task', CONCAT('status:', status), COUNT(*) FROM Task GROUP BY status
+    UNION ALL
+    SELECT 'Task', CONCAT('completed_on:', DATE(completedAt)), COUNT(*) FROM Task
+    WHERE status = 'completed' AND completedAt IS NOT NULL GROUP BY DATE(completedAt)
+    UNION ALL
+    SELECT 'VolunteerTask', CONCAT(IFNULL(assignedVolunteerID, 'none'), ':', status), COUNT(*) FROM Task
+    GROUP BY IFNULL(assignedVolunteerID, 'none'), status
+    UNION ALL
+    SELECT 'SOSRequest', CONCAT('status:', status), COUNT(*) FROM SOSRequest GROUP BY status
+    UNION ALL
+    SELECT 'ResourceStock', CONCAT('status:', status), COUNT(*) FROM ResourceStock GROUP BY status
+    UNION ALL
+    SELECT 'ResourceStock', CONCAT('quantity:', status), SUM(quantity) FROM ResourceStock GROUP BY status;
+
+    INSERT INTO NotificationInbox (userID, unreadDirect)
+    SELECT u.userID, COUNT(n.notificationID)
+    FROM UserAccount u
+    LEFT JOIN Notification n
+      ON n.recipientUserID = u.userID AND n.channel = 'in_app' AND n.status <> 'read'
+    GROUP BY u.userID
+    ON DUPLICATE KEY UPDATE unreadDirect = VALUES(unreadDirect);
+
+    -- Never lowered: users' roleSeenSeq positions refer to it
+    INSERT INTO NotificationRoleSequence (recipientRole, broadcasts)
+    SELECT recipientRole, COUNT(*) FROM Notification
+    WHERE channel = 'in_app' AND recipientUserID IS NULL AND recipientRole IS NOT NULL
+    GROUP BY recipientRole
+    ON DUPLICATE KEY UPDATE broadcasts = GREATEST(broadcasts, VALUES(broadcasts));
+    COMMIT;
 END //
 DELIMITER ;
 
-CALL compute_priorities();
+-- priorityScore is filled by compute_open_priorities() with PRIORITY_SCORING_CONFIG,
+-- called from PriorityScoringScheduler (services/priority_scoring_service.py)
+CALL rebuild_dashboard_counters();
@@ -39,6 +39,7 @@ CREATE TABLE Volunteer (
     verified BOOLEAN DEFAULT FALSE,
     status ENUM('available','busy','inactive') DEFAULT 'available',
     last_active DATETIME,
+    updatedAt DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (volunteerID) REFERENCES UserAccount(userID) ON DELETE CASCADE
 );
 
@@ -57,7 +58,9 @@ CREATE TABLE PriorityZone (
     centerLat DECIMAL(10,7),
     centerLong DECIMAL(10,7),
     radius_km DECIMAL(6,2),
-    priority_level ENUM('low','medium','high') DEFAULT 'medium'
+    priority_level ENUM('low','medium','high') DEFAULT 'medium',
+    source ENUM('manual','auto') DEFAULT 'manual',  -- 'auto' zones are maintained by the hotspot job
+    updatedAt DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
 CREATE TABLE Shelter (
@@ -80,17 +83,37 @@ CREATE TABLE SOSRequest (
     typeOfNeed VARCHAR(100),
     description TEXT,
     urgencyLevel ENUM('low','medium','high','critical') DEFAULT 'low',
+    peopleAffected INT DEFAULT 1,
     status ENUM('pending','in_process','assigned','delivered','cancelled') DEFAULT 'pending',
     priorityScore INT DEFAULT 0,
     createdAt DATETIME DEFAULT CURRENT_TIMESTAMP,
     updatedAt DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     assignedVolunteerID INT,
     assignedNGO INT,
+    submissionKey CHAR(36),  -- generated per form session; a resubmit maps to the same request
+    duplicateOf INT,         -- cluster head this request probably duplicates (same area, need and time window)
+    UNIQUE KEY uq_sos_submission (submissionKey),
+    FOREIGN KEY (duplicateOf) REFERENCES SOSRequest(requestID) ON DELETE SET NULL,
     FOREIGN KEY (victimID) REFERENCES Victim(victimID) ON DELETE CASCADE,
     FOREIGN KEY (assignedVolunteerID) REFERENCES Volunteer(volunteerID) ON DELETE SET NULL,
     FOREIGN KEY (assignedNGO) REFERENCES NGO(ngoID) ON DELETE SET NULL
 );
 
+-- Shelter places given to SOS requests (one per request, sized by peopleAffected)
+CREATE TABLE ShelterAssignment (
+    assignmentID INT AUTO_INCREMENT PRIMARY KEY,
+    shelterID INT NOT NULL,
+    victimID INT,
+    requestID INT,
+    people INT NOT NULL DEFAULT 1,
+    distance_km DECIMAL(8,2),
+    assignedAt DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY uq_shelter_request (requestID),
+    FOREIGN KEY (shelterID) REFERENCES Shelter(shelterID) ON DELETE CASCADE,
+    FOREIGN KEY (victimID) REFERENCES Victim(victimID) ON DELETE SET NULL,
+    FOREIGN KEY (requestID) REFERENCES SOSRequest(requestID) ON DELETE CASCADE
+);
+
 -- 4. RESOURCE MANAGEMENT
 CREATE TABLE ResourceType (
     resourceTypeID INT AUTO_INCREMENT PRIMARY KEY,
@@ -165,6 +188,15 @@ CREATE TABLE ResourceAllocation (
     FOREIGN KEY (requestID) REFERENCES SOSRequest(requestID) ON DELETE SET NULL
 );
 
+-- Which resources a type of need calls for (matched as a keyword in SOSRequest.typeOfNeed)
+CREATE TABLE NeedResourceType (
+    needKeyword VARCHAR(100) NOT NULL,
+    resourceTypeID INT NOT NULL,
+    quantityPerPerson DECIMAL(6,2) NOT NULL DEFAULT 1,
+    PRIMARY KEY (needKeyword, resourceTypeID),
+    FOREIGN KEY (resourceTypeID) REFERENCES ResourceType(resourceTypeID) ON DELETE CASCADE
+);
+
 -- 5. TASKS
 CREATE TABLE Task (
     taskID INT AUTO_INCREMENT PRIMARY KEY,
@@ -177,6 +209,7 @@ CREATE TABLE Task (
     relatedRequestID INT,
     createdAt DATETIME DEFAULT CURRENT_TIMESTAMP,
     updatedAt DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    completedAt DATETIME,  -- set by trg_task_completed_at_* while status = 'completed'
     FOREIGN KEY (assignedVolunteerID) REFERENCES Volunteer(volunteerID),
     FOREIGN KEY (relatedRequestID) REFERENCES SOSRequest(requestID)
 );
@@ -203,9 +236,46 @@ CREATE TABLE Notification (
     deliveredAt DATETIME,
     status ENUM('pending','sent','delivered','read','failed') DEFAULT 'pending',
     meta JSON,
+    requestID INT,  -- set on SOS alerts only
+    UNIQUE KEY uq_notification_sos (requestID, recipientRole),
     FOREIGN KEY (recipientUserID) REFERENCES UserAccount(userID)
 );
 
+-- One row per notification request; the dispatcher expands it into Notification rows
+CREATE TABLE NotificationOutbox (
+    outboxID INT AUTO_INCREMENT PRIMARY KEY,
+    subject VARCHAR(200),
+    message TEXT NOT NULL,
+    channels SET('in_app','email','sms') NOT NULL DEFAULT 'in_app',
+    recipientRole ENUM('Admin','NGO','Volunteer','Victim'),  -- NULL with no user = everyone
+    recipientUserID INT,
+    createdBy INT,
+    createdAt DATETIME DEFAULT CURRENT_TIMESTAMP,
+    status ENUM('pending','dispatched','failed') DEFAULT 'pending',
+    recipientCount INT DEFAULT 0,
+    dispatchedAt DATETIME,
+    FOREIGN KEY (recipientUserID) REFERENCES UserAccount(userID),
+    FOREIGN KEY (createdBy) REFERENCES UserAccount(userID) ON DELETE SET NULL
+);
+
+-- In-app broadcasts ever sent to each role (kept by triggers). Only goes up:
+-- deleting a broadcast does not lower it, so it works as a sequence number.
+CREATE TABLE NotificationRoleSequence (
+    recipientRole ENUM('Admin','NGO','Volunteer','Victim') PRIMARY KEY,
+    broadcasts BIGINT NOT NULL DEFAULT 0
+);
+
+-- Per-user inbox state. Unread = role broadcasts since roleSeenSeq (the role's
+-- sequence when the user last marked all read) + unread direct rows
+-- (unreadDirect, kept by triggers).
+CREATE TABLE NotificationInbox (
+    userID INT PRIMARY KEY,
+    roleSeenSeq BIGINT NOT NULL DEFAULT 0,
+    unreadDirect INT NOT NULL DEFAULT 0,
+    lastSeenAt DATETIME,
+    FOREIGN KEY (userID) REFERENCES UserAccount(userID) ON DELETE CASCADE
+);
+
 -- 7. REPORTING & AUDIT
 CREATE TABLE Report (
     reportID INT AUTO_INCREMENT PRIMARY KEY,
@@ -244,3 +314,11 @@ CREATE TABLE UrgencyWeight (
     urgencyLevel ENUM('low','medium','high','critical') PRIMARY KEY,
     weight INT NOT NULL
 );
+
+-- 10. DASHBOARD COUNTERS (maintained by triggers, see drms_triggers.sql)
+CREATE TABLE DashboardCounter (
+    entity VARCHAR(30) NOT NULL,
+    bucket VARCHAR(60) NOT NULL,
+    value BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (entity, bucket)
+);
@@ -7,14 +7,15 @@ FOR EACH ROW
 BEGIN
     DECLARE v_message TEXT;
 
-    SET v_message = CONCAT('New SOS Request: ', NEW.typeOfNeed,
+    SET v_message = CONCAT('New SOS Request #', NEW.requestID, ': ', NEW.typeOfNeed,
                            ' | Urgency: ', NEW.urgencyLevel,
                            ' | Location: ', COALESCE(NEW.location,'unknown'));
 
-    INSERT INTO Notification (message, channel, recipientRole)
-    VALUES (v_message, 'in_app', 'Admin'),
-           (v_message, 'in_app', 'NGO'),
-           (v_message, 'in_app', 'Volunteer');
+    -- Sole source of SOS alerts; (requestID, recipientRole) is unique, so a replay adds nothing
+    INSERT IGNORE INTO Notification (message, channel, recipientRole, requestID)
+    VALUES (v_message, 'in_app', 'Admin', NEW.requestID),
+           (v_message, 'in_app', 'NGO', NEW.requestID),
+           (v_message, 'in_app', 'Volunteer', NEW.requestID);
 END //
  
 CREATE TRIGGER trg_after_update_resource
@@ -27,4 +28,246 @@ BEGIN
                 'in_app', 'NGO');
     END IF;
 END //
+
+-- Dashboard counters (DashboardCounter via bump_counter, see drms_procedure.sql)
+CREATE TRIGGER trg_counter_volunteer_insert
+AFTER INSERT ON Volunteer
+FOR EACH ROW
+BEGIN
+    CALL bump_counter('Volunteer', CONCAT('status:', NEW.status), 1);
+    CALL bump_counter('Volunteer', CONCAT('verified:', IF(NEW.verified, 1, 0)), 1);
+END //
+
+CREATE TRIGGER trg_counter_volunteer_update
+AFTER UPDATE ON Volunteer
+FOR EACH ROW
+BEGIN
+    IF NOT (NEW.status <=> OLD.status) THEN
+        CALL bump_counter('Volunteer', CONCAT('status:', OLD.status), -1);
+        CALL bump_counter('Volunteer', CONCAT('status:', NEW.status), 1);
+    END IF;
+    IF IF(NEW.verified, 1, 0) <> IF(OLD.verified, 1, 0) THEN
+        CALL bump_counter('Volunteer', CONCAT('verified:', IF(OLD.verified, 1, 0)), -1);
+        CALL bump_counter('Volunteer', CONCAT('verified:', IF(NEW.verified, 1, 0)), 1);
+    END IF;
+END //
+
+CREATE TRIGGER trg_counter_volunteer_delete
+AFTER DELETE ON Volunteer
+FOR EACH ROW
+BEGIN
+    CALL bump_counter('Volunteer', CONCAT('status:', OLD.status), -1);
+    CALL bump_counter('Volunteer', CONCAT('verified:', IF(OLD.verified, 1, 0)), -1);
+END //
+
+CREATE TRIGGER trg_counter_ngo_insert
+AFTER INSERT ON NGO
+FOR EACH ROW
+BEGIN
+    CALL bump_counter('NGO', CONCAT('verified:', IF(NEW.verified, 1, 0)), 1);
+END //
+
+CREATE TRIGGER trg_counter_ngo_update
+AFTER UPDATE ON NGO
+FOR EACH ROW
+BEGIN
+    IF IF(NEW.verified, 1, 0) <> IF(OLD.verified, 1, 0) THEN
+        CALL bump_counter('NGO', CONCAT('verified:', IF(OLD.verified, 1, 0)), -1);
+        CALL bump_counter('NGO', CONCAT('verified:', IF(NEW.verified, 1, 0)), 1);
+    END IF;
+END //
+
+CREATE TRIGGER trg_counter_ngo_delete
+AFTER DELETE ON NGO
+FOR EACH ROW
+BEGIN
+    CALL bump_counter('NGO', CONCAT('verified:', IF(OLD.verified, 1, 0)), -1);
+END //
+
+-- completedAt keys the completed_on:<date> counter, so it can be taken back
+-- when a task leaves 'completed' or is deleted
+CREATE TRIGGER trg_task_completed_at_insert
+BEFORE INSERT ON Task
+FOR EACH ROW
+BEGIN
+    IF NEW.status = 'completed' THEN
+        SET NEW.completedAt = IFNULL(NEW.completedAt, NOW());
+    ELSE
+        SET NEW.completedAt = NULL;
+    END IF;
+END //
+
+CREATE TRIGGER trg_task_completed_at_update
+BEFORE UPDATE ON Task
+FOR EACH ROW
+BEGIN
+    IF NEW.status = 'completed' AND NOT (OLD.status <=> 'completed') THEN
+        SET NEW.completedAt = NOW();
+    ELSEIF NEW.status <> 'completed' THEN
+        SET NEW.completedAt = NULL;
+    END IF;
+END //
+
+CREATE TRIGGER trg_counter_task_insert
+AFTER INSERT ON Task
+FOR EACH ROW
+BEGIN
+    CALL bump_counter('Task', CONCAT('status:', NEW.status), 1);
+    IF NEW.status = 'completed' THEN
+        CALL bump_counter('Task', CONCAT('completed_on:', DATE(NEW.completedAt)), 1);
+    END IF;
+    CALL bump_counter('VolunteerTask', CONCAT(IFNULL(NEW.assignedVolunteerID, 'none'), ':', NEW.status), 1);
+END //
+
+CREATE TRIGGER trg_counter_task_update
+AFTER UPDATE ON Task
+FOR EACH ROW
+BEGIN
+    IF NOT (NEW.status <=> OLD.status) THEN
+        CALL bump_counter('Task', CONCAT('status:', OLD.status), -1);
+        CALL bump_counter('Task', CONCAT('status:', NEW.status), 1);
+    END IF;
+    IF NOT (NEW.completedAt <=> OLD.completedAt) THEN
+        IF OLD.completedAt IS NOT NULL THEN
+            CALL bump_counter('Task', CONCAT('completed_on:', DATE(OLD.completedAt)), -1);
+        END IF;
+        IF NEW.completedAt IS NOT NULL THEN
+            CALL bump_counter('Task', CONCAT('completed_on:', DATE(NEW.completedAt)), 1);
+        END IF;
+    END IF;
+    IF NOT (NEW.status <=> OLD.status) OR NOT (NEW.assignedVolunteerID <=> OLD.assignedVolunteerID) THEN
+        CALL bump_counter('VolunteerTask', CONCAT(IFNULL(OLD.assignedVolunteerID, 'none'), ':', OLD.status), -1);
+        CALL bump_counter('VolunteerTask', CONCAT(IFNULL(NEW.assignedVolunteerID, 'none'), ':', NEW.status), 1);
+    END IF;
+END //
+
+CREATE TRIGGER trg_counter_task_delete
+AFTER DELETE ON Task
+FOR EACH ROW
+BEGIN
+    CALL bump_counter('Task', CONCAT('status:', OLD.status), -1);
+    IF OLD.completedAt IS NOT NULL THEN
+        CALL bump_counter('Task', CONCAT('completed_on:', DATE(OLD.completedAt)), -1);
+    END IF;
+    CALL bump_counter('VolunteerTask', CONCAT(IFNULL(OLD.assignedVolunteerID, 'none'), ':', OLD.status), -1);
+END //
+
+CREATE TRIGGER trg_counter_sos_insert
+AFTER INSERT ON SOSRequest
+FOR EACH ROW FOLLOWS trg_after_insert_sos
+BEGIN
+    CALL bump_counter('SOSRequest', CONCAT('status:', NEW.status), 1);
+END //
+
+CREATE TRIGGER trg_counter_sos_update
+AFTER UPDATE ON SOSRequest
+FOR EACH ROW
+BEGIN
+    IF NOT (NEW.status <=> OLD.status) THEN
+        CALL bump_counter('SOSRequest', CONCAT('status:', OLD.status), -1);
+        CALL bump_counter('SOSRequest', CONCAT('status:', NEW.status), 1);
+    END IF;
+END //
+
+CREATE TRIGGER trg_counter_sos_delete
+AFTER DELETE ON SOSRequest
+FOR EACH ROW
+BEGIN
+    CALL bump_counter('SOSRequest', CONCAT('status:', OLD.status), -1);
+END //
+
+CREATE TRIGGER trg_counter_resource_insert
+AFTER INSERT ON ResourceStock
+FOR EACH ROW
+BEGIN
+    CALL bump_counter('ResourceStock', CONCAT('status:', NEW.status), 1);
+    CALL bump_counter('ResourceStock', CONCAT('quantity:', NEW.status), NEW.quantity);
+END //
+
+CREATE TRIGGER trg_counter_resource_update
+AFTER UPDATE ON ResourceStock
+FOR EACH ROW FOLLOWS trg_after_update_resource
+BEGIN
+    IF NOT (NEW.status <=> OLD.status) THEN
+        CALL bump_counter('ResourceStock', CONCAT('status:', OLD.status), -1);
+        CALL bump_counter('ResourceStock', CONCAT('status:', NEW.status), 1);
+    END IF;
+    IF NOT (NEW.status <=> OLD.status) OR NEW.quantity <> OLD.quantity THEN
+        CALL bump_counter('ResourceStock', CONCAT('quantity:', OLD.status), -OLD.quantity);
+        CALL bump_counter('ResourceStock', CONCAT('quantity:', NEW.status), NEW.quantity);
+    END IF;
+END //
+
+CREATE TRIGGER trg_counter_resource_delete
+AFTER DELETE ON ResourceStock
+FOR EACH ROW
+BEGIN
+    CALL bump_counter('ResourceStock', CONCAT('status:', OLD.status), -1);
+    CALL bump_counter('ResourceStock', CONCAT('quantity:', OLD.status), -OLD.quantity);
+END //
+
+-- Inbox counters (direct unread in NotificationInbox; role broadcasts in
+-- NotificationRoleSequence, which deletes never lower)
+CREATE TRIGGER trg_inbox_notification_insert
+AFTER INSERT ON Notification
+FOR EACH ROW
+BEGIN
+    IF NEW.channel = 'in_app' AND NEW.recipientUserID IS NOT NULL AND NEW.status <> 'read' THEN
+        INSERT INTO NotificationInbox (userID, unreadDirect) VALUES (NEW.recipientUserID, 1)
+        ON DUPLICATE KEY UPDATE unreadDirect = unreadDirect + 1;
+    ELSEIF NEW.channel = 'in_app' AND NEW.recipientUserID IS NULL AND NEW.recipientRole IS NOT NULL THEN
+        INSERT INTO NotificationRoleSequence (recipientRole, broadcasts) VALUES (NEW.recipientRole, 1)
+        ON DUPLICATE KEY UPDATE broadcasts = broadcasts + 1;
+    END IF;
+END //
+
+CREATE TRIGGER trg_inbox_notification_update
+AFTER UPDATE ON Notification
+FOR EACH ROW
+BEGIN
+    IF NEW.channel = 'in_app' AND NEW.recipientUserID IS NOT NULL
+       AND (OLD.status = 'read') <> (NEW.status = 'read') THEN
+        UPDATE NotificationInbox
+        SET unreadDirect = GREATEST(0, unreadDirect + IF(NEW.status = 'read', -1, 1))
+        WHERE userID = NEW.recipientUserID;
+    END IF;
+END //
+
+CREATE TRIGGER trg_inbox_notification_delete
+AFTER DELETE ON Notification
+FOR EACH ROW
+BEGIN
+    IF OLD.channel = 'in_app' AND OLD.recipientUserID IS NOT NULL AND OLD.status <> 'read' THEN
+        UPDATE NotificationInbox SET unreadDirect = GREATEST(0, unreadDirect - 1)
+        WHERE userID = OLD.recipientUserID;
+    END IF;
+END //
+
+-- Shelter occupancy: a ShelterAssignment holds its people's places until it is
+-- deleted, which happens when its request is closed (delivered or cancelled)
+-- or deleted. Foreign key cascades do not fire triggers, so the SOSRequest
+-- triggers delete the assignment themselves.
+CREATE TRIGGER trg_shelter_assignment_delete
+AFTER DELETE ON ShelterAssignment
+FOR EACH ROW
+BEGIN
+    UPDATE Shelter SET current_occupancy = GREATEST(0, current_occupancy - OLD.people)
+    WHERE shelterID = OLD.shelterID;
+END //
+
+CREATE TRIGGER trg_shelter_sos_closed
+AFTER UPDATE ON SOSRequest
+FOR EACH ROW FOLLOWS trg_counter_sos_update
+BEGIN
+    IF NEW.status IN ('delivered','cancelled') AND OLD.status NOT IN ('delivered','cancelled') THEN
+        DELETE FROM ShelterAssignment WHERE requestID = NEW.requestID;
+    END IF;
+END //
+
+CREATE TRIGGER trg_shelter_sos_delete
+BEFORE DELETE ON SOSRequest
+FOR EACH ROW
+BEGIN
+    DELETE FROM ShelterAssignment WHERE requestID = OLD.requestID;
+END //
 DELIMITER ;
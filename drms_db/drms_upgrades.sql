@@ -0,0 +1,237 @@
+USE drms;
+
+-- Schema changes for databases created before they were added to
+-- drms_tables.sql / drms_indexes.sql / drms_procedure.sql. Run the sections
+-- newer than your database, in order.
+
+-- SOS change feed
+CREATE INDEX idx_sos_updated ON SOSRequest(updatedAt);
+
+-- Incremental priority scoring
+ALTER TABLE SOSRequest ADD COLUMN peopleAffected INT DEFAULT 1 AFTER urgencyLevel;
+UPDATE SOSRequest
+SET peopleAffected = GREATEST(1, CAST(SUBSTRING_INDEX(SUBSTRING_INDEX(description, 'People affected: ', -1), '.', 1) AS UNSIGNED)),
+    updatedAt = updatedAt
+WHERE description LIKE 'People affected: %';
+DROP PROCEDURE IF EXISTS compute_priorities;
+DROP PROCEDURE IF EXISTS compute_open_priorities;
+-- then re-run drms_procedure.sql
+
+-- Proximity index
+ALTER TABLE Volunteer ADD COLUMN updatedAt DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP AFTER last_active;
+CREATE INDEX idx_volunteer_updated ON Volunteer(updatedAt);
+CREATE INDEX idx_user_updated ON UserAccount(updatedAt);
+CREATE INDEX idx_resource_updated ON ResourceStock(lastUpdated);
+
+-- Bulk resource allocation planner
+CREATE TABLE NeedResourceType (
+    needKeyword VARCHAR(100) NOT NULL,
+    resourceTypeID INT NOT NULL,
+    quantityPerPerson DECIMAL(6,2) NOT NULL DEFAULT 1,
+    PRIMARY KEY (needKeyword, resourceTypeID),
+    FOREIGN KEY (resourceTypeID) REFERENCES ResourceType(resourceTypeID) ON DELETE CASCADE
+);
+CREATE INDEX idx_allocation_request ON ResourceAllocation(requestID, allocationStatus);
+
+-- Dashboard counters
+CREATE TABLE DashboardCounter (
+    entity VARCHAR(30) NOT NULL,
+    bucket VARCHAR(60) NOT NULL,
+    value BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (entity, bucket)
+);
+-- then create bump_counter / rebuild_dashboard_counters from drms_procedure.sql,
+-- the trg_counter_* triggers from drms_triggers.sql, and fill the table:
+-- CALL rebuild_dashboard_counters();
+
+-- Report job queue
+CREATE INDEX idx_report_type_generated ON Report(reportType, generatedAt);
+
+-- Notification outbox
+CREATE TABLE NotificationOutbox (
+    outboxID INT AUTO_INCREMENT PRIMARY KEY,
+    subject VARCHAR(200),
+    message TEXT NOT NULL,
+    channels SET('in_app','email','sms') NOT NULL DEFAULT 'in_app',
+    recipientRole ENUM('Admin','NGO','Volunteer','Victim'),  -- NULL with no user = everyone
+    recipientUserID INT,
+    createdBy INT,
+    createdAt DATETIME DEFAULT CURRENT_TIMESTAMP,
+    status ENUM('pending','dispatched','failed') DEFAULT 'pending',
+    recipientCount INT DEFAULT 0,
+    dispatchedAt DATETIME,
+    FOREIGN KEY (recipientUserID) REFERENCES UserAccount(userID),
+    FOREIGN KEY (createdBy) REFERENCES UserAccount(userID) ON DELETE SET NULL
+);
+CREATE INDEX idx_notification_delivery ON Notification(status, channel, notificationID);
+CREATE INDEX idx_outbox_status ON NotificationOutbox(status, outboxID);
+
+-- SOS notification dedupe
+-- The SOS form used to insert its own three alerts next to trg_after_insert_sos.
+-- Tag existing alerts with their request, collapse the pairs, then enforce one per role.
+ALTER TABLE Notification ADD COLUMN requestID INT AFTER meta;
+
+-- Form alerts read "🚨 NEW SOS REQUEST #<id>: <need> at <location>. ..."; the id is
+-- between the first '#' and the first ': ' (locations may contain '#' too)
+UPDATE Notification n
+JOIN SOSRequest s
+  ON s.requestID = CAST(SUBSTRING_INDEX(SUBSTRING_INDEX(n.message, ': ', 1), '#', -1) AS UNSIGNED)
+SET n.requestID = s.requestID
+WHERE n.recipientUserID IS NULL AND n.message LIKE '%NEW SOS REQUEST #%: %'
+  AND SUBSTRING_INDEX(SUBSTRING_INDEX(n.message, ': ', 1), '#', -1) REGEXP '^[0-9]+$';
+
+-- Old trigger alerts only carry need, urgency and location: tag one when exactly
+-- one request matches it; bursts of look-alike requests stay untagged (and kept)
+UPDATE Notification n
+JOIN (
+    SELECT n2.notificationID, MIN(s.requestID) AS requestID
+    FROM Notification n2
+    JOIN SOSRequest s
+      ON n2.message = CONCAT('New SOS Request: ', s.typeOfNeed,
+                             ' | Urgency: ', s.urgencyLevel,
+                             ' | Location: ', COALESCE(s.location, 'unknown'))
+     AND n2.createdAt BETWEEN s.createdAt AND s.createdAt + INTERVAL 5 SECOND
+    WHERE n2.recipientUserID IS NULL AND n2.requestID IS NULL
+    GROUP BY n2.notificationID
+    HAVING COUNT(*) = 1
+) m ON m.notificationID = n.notificationID
+SET n.requestID = m.requestID;
+
+-- Keep the oldest alert per (request, role), carrying over "read" from its duplicates
+UPDATE Notification k
+JOIN (
+    SELECT requestID, recipientRole, MIN(notificationID) AS keepID, MAX(status = 'read') AS anyRead
+    FROM Notification
+    WHERE requestID IS NOT NULL
+    GROUP BY requestID, recipientRole
+    HAVING COUNT(*) > 1
+) d ON k.notificationID = d.keepID
+SET k.status = IF(d.anyRead, 'read', k.status);
+
+DELETE n FROM Notification n
+JOIN Notification k
+  ON k.requestID = n.requestID
+ AND k.recipientRole = n.recipientRole
+ AND k.notificationID < n.notificationID;
+
+ALTER TABLE Notification ADD UNIQUE KEY uq_notification_sos (requestID, recipientRole);
+-- then recreate trg_after_insert_sos from drms_triggers.sql:
+DROP TRIGGER IF EXISTS trg_after_insert_sos;
+
+-- Alerts per SOS (expect 3 for new requests; sos_alert_benchmark.py measures a burst):
+-- SELECT AVG(c) FROM (SELECT COUNT(*) AS c FROM Notification WHERE requestID IS NOT NULL GROUP BY requestID) t;
+
+-- Notification inbox
+CREATE TABLE NotificationInbox (
+    userID INT PRIMARY KEY,
+    roleSeen BIGINT NOT NULL DEFAULT 0,
+    unreadDirect INT NOT NULL DEFAULT 0,
+    lastSeenAt DATETIME,
+    FOREIGN KEY (userID) REFERENCES UserAccount(userID) ON DELETE CASCADE
+);
+CREATE INDEX idx_notification_role_created ON Notification(recipientRole, createdAt);
+CREATE INDEX idx_notification_user_status_created ON Notification(recipientUserID, status, createdAt);
+DROP INDEX idx_notification_recipient ON Notification;
+-- then create the trg_inbox_* triggers from drms_triggers.sql, recreate
+-- rebuild_dashboard_counters from drms_procedure.sql and fill the counters:
+-- CALL rebuild_dashboard_counters();
+
+-- Idempotent SOS submission
+ALTER TABLE SOSRequest ADD COLUMN submissionKey CHAR(36) AFTER assignedNGO,
+                       ADD UNIQUE KEY uq_sos_submission (submissionKey);
+
+-- Near-duplicate SOS clusters
+ALTER TABLE SOSRequest ADD COLUMN duplicateOf INT AFTER submissionKey,
+                       ADD FOREIGN KEY (duplicateOf) REFERENCES SOSRequest(requestID) ON DELETE SET NULL;
+CREATE INDEX idx_sos_status_created ON SOSRequest(status, createdAt);
+
+-- Hotspot PriorityZones
+ALTER TABLE PriorityZone ADD COLUMN source ENUM('manual','auto') DEFAULT 'manual',
+                         ADD COLUMN updatedAt DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP;
+
+-- Shelter matching
+CREATE TABLE ShelterAssignment (
+    assignmentID INT AUTO_INCREMENT PRIMARY KEY,
+    shelterID INT NOT NULL,
+    victimID INT,
+    requestID INT,
+    people INT NOT NULL DEFAULT 1,
+    distance_km DECIMAL(8,2),
+    assignedAt DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY uq_shelter_request (requestID),
+    FOREIGN KEY (shelterID) REFERENCES Shelter(shelterID) ON DELETE CASCADE,
+    FOREIGN KEY (victimID) REFERENCES Victim(victimID) ON DELETE SET NULL,
+    FOREIGN KEY (requestID) REFERENCES SOSRequest(requestID) ON DELETE CASCADE
+);
+
+-- Notification inbox seen watermark (replaces the role counter in DashboardCounter)
+ALTER TABLE NotificationInbox ADD COLUMN roleSeenAt DATETIME AFTER userID,
+                              ADD COLUMN roleSeenID INT NOT NULL DEFAULT 0 AFTER roleSeenAt;
+UPDATE NotificationInbox i
+JOIN UserAccount u ON u.userID = i.userID
+SET i.roleSeenAt = (SELECT MAX(n.createdAt) FROM Notification n
+                    WHERE n.recipientRole = u.role AND n.recipientUserID IS NULL AND n.channel = 'in_app'
+                      AND n.createdAt <= i.lastSeenAt)
+WHERE i.lastSeenAt IS NOT NULL;
+UPDATE NotificationInbox i
+JOIN UserAccount u ON u.userID = i.userID
+SET i.roleSeenID = (SELECT COALESCE(MAX(n.notificationID), 0) FROM Notification n
+                    WHERE n.recipientRole = u.role AND n.recipientUserID IS NULL AND n.channel = 'in_app'
+                      AND n.createdAt = i.roleSeenAt)
+WHERE i.roleSeenAt IS NOT NULL;
+ALTER TABLE NotificationInbox DROP COLUMN roleSeen;
+DELETE FROM DashboardCounter WHERE entity = 'Notification';
+-- then recreate trg_inbox_notification_insert / trg_inbox_notification_delete
+-- from drms_triggers.sql and rebuild_dashboard_counters from drms_procedure.sql
+
+-- Task completion date for the completed_on counters
+ALTER TABLE Task ADD COLUMN completedAt DATETIME AFTER updatedAt;
+UPDATE Task SET completedAt = updatedAt, updatedAt = updatedAt WHERE status = 'completed';
+-- then create trg_task_completed_at_insert / trg_task_completed_at_update and
+-- recreate trg_counter_task_* from drms_triggers.sql, recreate
+-- rebuild_dashboard_counters from drms_procedure.sql and refill the counters:
+-- CALL rebuild_dashboard_counters();
+
+-- Priority scoring factors as procedure parameters
+DROP PROCEDURE IF EXISTS compute_priorities;
+DROP PROCEDURE IF EXISTS compute_open_priorities;
+-- then re-run drms_procedure.sql
+
+-- Shelter occupancy release
+-- Give back the places held for requests that are already closed, then create
+-- trg_shelter_assignment_delete / trg_shelter_sos_closed / trg_shelter_sos_delete
+-- from drms_triggers.sql
+UPDATE Shelter s
+JOIN (
+    SELECT a.shelterID, SUM(a.people) AS people
+    FROM ShelterAssignment a
+    JOIN SOSRequest r ON r.requestID = a.requestID
+    WHERE r.status IN ('delivered','cancelled')
+    GROUP BY a.shelterID
+) c ON c.shelterID = s.shelterID
+SET s.current_occupancy = GREATEST(0, s.current_occupancy - c.people);
+DELETE a FROM ShelterAssignment a
+JOIN SOSRequest r ON r.requestID = a.requestID
+WHERE r.status IN ('delivered','cancelled');
+
+-- Notification role sequence (replaces the roleSeenAt/roleSeenID watermark, which
+-- left unread_count counting every broadcast since it)
+CREATE TABLE NotificationRoleSequence (
+    recipientRole ENUM('Admin','NGO','Volunteer','Victim') PRIMARY KEY,
+    broadcasts BIGINT NOT NULL DEFAULT 0
+);
+INSERT INTO NotificationRoleSequence (recipientRole, broadcasts)
+SELECT recipientRole, COUNT(*) FROM Notification
+WHERE channel = 'in_app' AND recipientUserID IS NULL AND recipientRole IS NOT NULL
+GROUP BY recipientRole;
+ALTER TABLE NotificationInbox ADD COLUMN roleSeenSeq BIGINT NOT NULL DEFAULT 0 AFTER userID;
+UPDATE NotificationInbox i
+JOIN UserAccount u ON u.userID = i.userID
+SET i.roleSeenSeq = (SELECT COUNT(*) FROM Notification n
+                     WHERE n.recipientRole = u.role AND n.recipientUserID IS NULL AND n.channel = 'in_app'
+                       AND (n.createdAt < i.roleSeenAt
+                            OR (n.createdAt = i.roleSeenAt AND n.notificationID <= i.roleSeenID)))
+WHERE i.roleSeenAt IS NOT NULL;
+ALTER TABLE NotificationInbox DROP COLUMN roleSeenAt, DROP COLUMN roleSeenID;
+-- then recreate trg_inbox_notification_insert from drms_triggers.sql and
+-- rebuild_dashboard_counters from drms_procedure.sql
@@ -7,6 +7,7 @@ from tkinter import ttk, messagebox
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from data.db_connection import DatabaseConnection
+from data import reference_cache
 import mysql.connector
 
 
@@ -144,10 +145,7 @@ class AddResourcesApp(tk.Tk):
     def load_resource_types(self):
         """Load all resource types into dropdown."""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute("SELECT resourceTypeID, name FROM ResourceType ORDER BY name")
-            rows = cursor.fetchall()
-            cursor.close()
+            rows = reference_cache.resource_types(self.connection)
 
             self.resource_types = rows
             names = [row["name"] for row in rows]
@@ -8,6 +8,9 @@ from tkinter import ttk, messagebox
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from data.db_connection import DatabaseConnection
+from frontend.db_executor import QueryExecutor
+from services.allocation_planner_service import AllocationPlannerService
+from services.resource_service import ResourceService
 import mysql.connector
 
 class AllocateResourcesApp(tk.Tk):
@@ -37,11 +40,17 @@ class AllocateResourcesApp(tk.Tk):
             messagebox.showerror("Database Error", "Cannot connect to database!")
             self.destroy()
             return
+        self.executor = QueryExecutor(self)
         
         self.create_widgets()
         self.load_pending_requests()
         self.load_available_resources()
 
+    def destroy(self):
+        if hasattr(self, "executor"):
+            self.executor.shutdown()
+        super().destroy()
+
     def create_widgets(self):
         # Title
         tk.Label(self, text="Allocate Resources", font=("Helvetica", 16, "bold"), bg="#f5f5f5").pack(pady=15)
@@ -129,11 +138,14 @@ class AllocateResourcesApp(tk.Tk):
         tk.Button(btn_frame, text="Allocate Resource", font=("Helvetica", 12, "bold"), 
                  bg="#4CAF50", fg="white", width=18, command=self.allocate_resource).grid(row=0, column=0, padx=5)
         
+        tk.Button(btn_frame, text="Plan Relief Round", font=("Helvetica", 12, "bold"), 
+                 bg="#2196F3", fg="white", width=18, command=self.plan_relief_round).grid(row=0, column=1, padx=5)
+        
         tk.Button(btn_frame, text="Refresh", font=("Helvetica", 12), 
-                 bg="#FF9800", fg="white", width=18, command=self.refresh_data).grid(row=0, column=1, padx=5)
+                 bg="#FF9800", fg="white", width=18, command=self.refresh_data).grid(row=0, column=2, padx=5)
         
         tk.Button(btn_frame, text="Back", font=("Helvetica", 12), 
-                 bg="#757575", fg="white", width=18, command=self.go_back).grid(row=0, column=2, padx=5)
+                 bg="#757575", fg="white", width=18, command=self.go_back).grid(row=0, column=3, padx=5)
 
     def load_pending_requests(self):
         """Load pending SOS requests"""
@@ -282,33 +294,10 @@ class AllocateResourcesApp(tk.Tk):
             return
         
         try:
-            cursor = self.connection.cursor()
-            
-            # Create allocation record
-            cursor.execute("""
-                INSERT INTO ResourceAllocation (resourceID, allocatedToType, allocatedToID, requestID, 
-                                              quantity, allocationStatus)
-                VALUES (%s, %s, %s, %s, %s, 'pending')
-            """, (resource_id, allocate_type, allocate_id, request_id, quantity))
-            
-            # Update resource quantity
-            new_qty = available_qty - quantity
-            cursor.execute("""
-                UPDATE ResourceStock 
-                SET quantity = %s, status = CASE WHEN %s <= 5 THEN 'low' ELSE status END
-                WHERE resourceID = %s
-            """, (new_qty, new_qty, resource_id))
-            
-            # Update request status if linked
-            if request_id:
-                cursor.execute("""
-                    UPDATE SOSRequest 
-                    SET status = 'in_process' 
-                    WHERE requestID = %s AND status = 'pending'
-                """, (request_id,))
-            
-            self.connection.commit()
-            cursor.close()
+            # Stock is deducted only if still available, together with the allocation record
+            ResourceService(self.connection).allocate_resource(
+                resource_id, allocate_type, allocate_id, request_id, quantity
+            )
             
             messagebox.showinfo("Success", 
                               f"Resource allocated successfully!\n"
@@ -320,9 +309,77 @@ class AllocateResourcesApp(tk.Tk):
             self.quantity_entry.delete(0, tk.END)
             self.allocate_id_entry.delete(0, tk.END)
         
+        except ValueError as e:
+            messagebox.showerror("Insufficient Resources", f"{str(e)}\nRefresh to see current stock.")
+            self.refresh_data()
         except mysql.connector.Error as e:
             messagebox.showerror("Database Error", f"Failed to allocate resource: {str(e)}")
 
+    def plan_relief_round(self):
+        """Plan allocations for every unserved pending request and show them for review"""
+        donor_ngo_id = self.logged_in_user.get("id") if self.role == "NGO" else None
+        self.executor.submit(
+            "allocation_plan",
+            lambda connection: AllocationPlannerService(connection).plan(donor_ngo_id),
+            on_success=self.preview_plan,
+            on_error=lambda e: messagebox.showerror("Database Error", f"Failed to plan allocations: {str(e)}")
+        )
+
+    def preview_plan(self, plan):
+        """Show a planned relief round and commit it on confirmation"""
+        if not plan["lines"]:
+            messagebox.showinfo("Relief Round",
+                                f"Nothing to allocate.\nUnmet needs: {len(plan['unmet'])}")
+            return
+
+        window = tk.Toplevel(self)
+        window.title("Relief Round Preview")
+        window.geometry("900x500")
+
+        tk.Label(window, text=f"{len(plan['lines'])} allocations planned, "
+                              f"{len(plan['unmet'])} needs cannot be covered",
+                 font=("Helvetica", 12, "bold")).pack(pady=10)
+
+        columns = ("requestID", "typeOfNeed", "resourceType", "quantity", "source", "distance")
+        tree = ttk.Treeview(window, columns=columns, show="headings", height=15)
+        for col, heading in zip(columns, ["Request ID", "Need", "Resource", "Qty", "From", "Distance"]):
+            tree.heading(col, text=heading)
+            tree.column(col, width=140)
+        scrollbar = ttk.Scrollbar(window, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side="left", fill="both", expand=True, padx=(10, 0))
+        scrollbar.pack(side="left", fill="y")
+
+        for line in plan["lines"]:
+            tree.insert("", "end", values=(
+                line["request"]["requestID"],
+                line["request"]["typeOfNeed"] or "N/A",
+                line["resource"]["resourceType"],
+                line["quantity"],
+                line["resource"]["location"] or f"Stock #{line['resource']['resourceID']}",
+                f"{line['distance_km']:.1f} km" if line["distance_km"] is not None else "N/A"
+            ))
+
+        def commit():
+            def on_committed(count):
+                window.destroy()
+                messagebox.showinfo("Success", f"{count} allocations created.")
+                self.refresh_data()
+
+            self.executor.submit(
+                "allocation_commit",
+                lambda connection: AllocationPlannerService(connection).commit(plan),
+                on_success=on_committed,
+                on_error=lambda e: messagebox.showerror("Allocation Failed", str(e))
+            )
+
+        btns = tk.Frame(window)
+        btns.pack(side="right", fill="y", padx=10)
+        tk.Button(btns, text="Commit Plan", font=("Helvetica", 11, "bold"), bg="#4CAF50", fg="white",
+                  width=14, command=commit).pack(pady=10)
+        tk.Button(btns, text="Cancel", font=("Helvetica", 11), width=14,
+                  command=window.destroy).pack()
+
     def refresh_data(self):
         """Refresh both tables"""
         self.load_pending_requests()
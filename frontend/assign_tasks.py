@@ -8,6 +8,14 @@ import sv_ttk
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from data.db_connection import DatabaseConnection
+from data.proximity_repository import ProximityRepository
+from data.task_repository import TaskRepository
+from frontend.db_executor import QueryExecutor
+from frontend.virtual_table import KeysetPager, VirtualTreeview
+from services.dashboard_metrics_service import DashboardMetricsService
+from services.notification_service import InboxService
+from services.proximity_service import get_proximity_service
+from services.task_assignment_service import TaskAssignmentService
 
 class AssignTaskApp(tk.Tk):
     def __init__(self, logged_in_user, db_connection=None, back_command=None):
@@ -43,12 +51,19 @@ class AssignTaskApp(tk.Tk):
         # DB connection
         self.connection = db_connection if db_connection else DatabaseConnection().connect()
         self.cursor = self.connection.cursor(dictionary=True)
+        self.executor = QueryExecutor(self)
+        self.proximity = get_proximity_service()
 
         # Create scrollable UI
         self.create_scrollable_ui()
         self.load_dashboard_data()
         self.load_volunteers()
         self.load_tasks()
+        self.refresh_proximity()
+
+    def destroy(self):
+        self.executor.shutdown()
+        super().destroy()
 
     def create_scrollable_ui(self):
         # ========== MAIN CONTAINER WITH SCROLLBAR ==========
@@ -419,6 +434,7 @@ class AssignTaskApp(tk.Tk):
         
         action_buttons = [
             ("⚡ Quick Assign", "#8B5CF6", self.quick_assign),
+            ("📍 Nearest Volunteers", "#0EA5E9", self.suggest_nearest_volunteers),
             ("📊 View Statistics", "#3B82F6", self.show_statistics),
             ("📋 Task History", "#10B981", self.view_task_history),
             ("🔔 Notifications", "#F59E0B", self.show_notifications)
@@ -551,8 +567,10 @@ class AssignTaskApp(tk.Tk):
         
         # Treeview
         columns = ("taskID", "title", "description", "taskType", "status", "urgency")
-        self.task_tree = ttk.Treeview(
+        self.task_tree = VirtualTreeview(
             tree_frame,
+            self.executor,
+            self.format_task,
             columns=columns,
             show="headings",
             height=12,
@@ -582,50 +600,37 @@ class AssignTaskApp(tk.Tk):
             self.task_tree.column(col, width=width, anchor=anchor)
 
     def load_dashboard_data(self):
-        """Load dashboard statistics"""
-        try:
-            # Total Volunteers
-            self.cursor.execute("SELECT COUNT(*) as count FROM Volunteer")
-            total_vol = self.cursor.fetchone()["count"]
-            
-            # Available Tasks
-            self.cursor.execute("SELECT COUNT(*) as count FROM Task WHERE status = 'unassigned'")
-            avail_tasks = self.cursor.fetchone()["count"]
-            
-            # Active SOS Requests
-            self.cursor.execute("""
-                SELECT COUNT(*) as count FROM SOSRequest 
-                WHERE status IN ('assigned', 'in_process')
-            """)
-            active_sos = self.cursor.fetchone()["count"]
-            
-            # Completed Today
-            self.cursor.execute("""
-                SELECT COUNT(*) as count FROM Task 
-                WHERE status = 'completed' 
-                AND DATE(updated_at) = CURDATE()
-            """)
-            completed_today = self.cursor.fetchone()["count"] or 0
-            
-            # Resources Stock
-            self.cursor.execute("SELECT SUM(quantity) as total FROM ResourceStock WHERE status = 'available'")
-            resources = self.cursor.fetchone()["total"] or 0
-            
-            # Update statistics labels
-            stats = [total_vol, avail_tasks, active_sos, completed_today, resources, "High"]
-            for i, value in enumerate(stats):
-                if i < len(self.stat_labels):
-                    self.stat_labels[i].config(text=str(value))
-            
-        except Exception as e:
-            print(f"Error loading dashboard data: {e}")
+        """Load dashboard statistics from the counters table in the background"""
+        def work(connection):
+            metrics = DashboardMetricsService(connection).snapshot()
+            active_sos = metrics.get("SOSRequest", "status:assigned") + metrics.get("SOSRequest", "status:in_process")
+            return [
+                metrics.total("Volunteer"),
+                metrics.get("Task", "status:unassigned"),
+                active_sos,
+                metrics.completed_on(),
+                metrics.stock_quantity("available"),
+                "High"
+            ]
+
+        self.executor.submit(
+            "dashboard", work,
+            on_success=self.show_dashboard_data,
+            on_error=lambda e: print(f"Error loading dashboard data: {e}")
+        )
+
+    def show_dashboard_data(self, stats):
+        """Update statistics labels"""
+        for i, value in enumerate(stats):
+            if i < len(self.stat_labels):
+                self.stat_labels[i].config(text=str(value))
 
     def load_volunteers(self):
-        """Load volunteers from database"""
-        self.vol_tree.delete(*self.vol_tree.get_children())
-        
-        try:
-            self.cursor.execute("""
+        """Load volunteers from database in the background"""
+        self.status_label.config(text="⏳ Loading volunteers...")
+        self.executor.run_query(
+            "volunteers",
+            """
                 SELECT u.userID AS volunteerID, u.name, v.roles, v.status, v.verified, v.last_active
                 FROM Volunteer v
                 JOIN UserAccount u ON v.volunteerID = u.userID
@@ -636,10 +641,21 @@ class AssignTaskApp(tk.Tk):
                         ELSE 3
                     END,
                     u.name
-            """)
-            
-            volunteers = self.cursor.fetchall()
-            
+            """,
+            dictionary=True,
+            on_success=self.show_volunteers,
+            on_error=self.on_volunteers_error
+        )
+
+    def on_volunteers_error(self, error):
+        messagebox.showerror("Database Error", f"Failed to load volunteers: {str(error)}")
+        self.status_label.config(text="❌ Failed to load volunteers")
+
+    def show_volunteers(self, volunteers):
+        """Fill the volunteer table with rows fetched by load_volunteers"""
+        self.vol_tree.delete(*self.vol_tree.get_children())
+        
+        try:
             for vol in volunteers:
                 # Format status with icon
                 status_icon = "✅ " if vol["status"] == "available" else "⏳ "
@@ -664,59 +680,98 @@ class AssignTaskApp(tk.Tk):
             self.status_label.config(text="❌ Failed to load volunteers")
 
     def load_tasks(self):
-        """Load tasks from database"""
-        self.task_tree.delete(*self.task_tree.get_children())
-        
-        try:
-            self.cursor.execute("""
-                SELECT t.taskID, t.title, t.description, t.taskType, t.status, 
-                       COALESCE(s.urgencyLevel, 'medium') as urgency
+        """Load unassigned tasks page by page, most urgent first"""
+        self.status_label.config(text="⏳ Loading tasks...")
+        pager = KeysetPager(
+            """
+                SELECT t.taskID, t.title, t.description, t.taskType, t.status, t.relatedRequestID,
+                       COALESCE(s.urgencyLevel, 'medium') as urgency,
+                       FIELD(COALESCE(s.urgencyLevel, 'medium'), 'critical', 'high', 'medium', 'low') as urgencyRank
                 FROM Task t
                 LEFT JOIN SOSRequest s ON t.relatedRequestID = s.requestID
-                WHERE t.status = 'unassigned'
-                ORDER BY 
-                    CASE COALESCE(s.urgencyLevel, 'medium')
-                        WHEN 'critical' THEN 1
-                        WHEN 'high' THEN 2
-                        WHEN 'medium' THEN 3
-                        WHEN 'low' THEN 4
-                        ELSE 5
-                    END,
-                    t.taskID
-            """)
-            
-            tasks = self.cursor.fetchall()
-            
-            for task in tasks:
-                # Format urgency with icon
-                urgency_icons = {
-                    "critical": "🚨",
-                    "high": "⚠️",
-                    "medium": "📊",
-                    "low": "📉"
-                }
-                urgency_icon = urgency_icons.get(task["urgency"], "📝")
-                urgency_display = f"{urgency_icon} {task['urgency'].title()}"
-                
-                # Truncate description if too long
-                description = task["description"]
-                if len(description) > 60:
-                    description = description[:57] + "..."
-                
-                self.task_tree.insert("", tk.END, values=(
-                    task["taskID"],
-                    task["title"],
-                    description,
-                    task["taskType"].title(),
-                    task["status"].title(),
-                    urgency_display
-                ))
-            
-            self.status_label.config(text=f"✅ Loaded {len(tasks)} available tasks")
-            
-        except Exception as e:
-            messagebox.showerror("Database Error", f"Failed to load tasks: {str(e)}")
-            self.status_label.config(text="❌ Failed to load tasks")
+                WHERE t.status = 'unassigned' {keyset}
+            """,
+            order=[
+                ("FIELD(COALESCE(s.urgencyLevel, 'medium'), 'critical', 'high', 'medium', 'low')", "urgencyRank", "ASC"),
+                ("t.taskID", "taskID", "ASC")
+            ]
+        )
+        self.task_tree.load(pager, on_error=self.on_tasks_error)
+        self.executor.run_query(
+            "task_count",
+            "SELECT COUNT(*) FROM Task WHERE status = 'unassigned'",
+            on_success=lambda rows: self.status_label.config(text=f"✅ Loaded {rows[0][0]} available tasks"),
+            on_error=self.on_tasks_error
+        )
+
+    def on_tasks_error(self, error):
+        messagebox.showerror("Database Error", f"Failed to load tasks: {str(error)}")
+        self.status_label.config(text="❌ Failed to load tasks")
+
+    def format_task(self, task):
+        """Table values for one task row"""
+        # Format urgency with icon
+        urgency_icons = {
+            "critical": "🚨",
+            "high": "⚠️",
+            "medium": "📊",
+            "low": "📉"
+        }
+        urgency_icon = urgency_icons.get(task["urgency"], "📝")
+        urgency_display = f"{urgency_icon} {task['urgency'].title()}"
+        
+        # Truncate description if too long
+        description = task["description"] or ""
+        if len(description) > 60:
+            description = description[:57] + "..."
+        
+        return (
+            task["taskID"],
+            task["title"],
+            description,
+            task["taskType"].title(),
+            task["status"].title(),
+            urgency_display
+        )
+
+    def refresh_proximity(self, on_done=None):
+        """Bring the shared volunteer/request location index up to date in the background"""
+        self.executor.submit(
+            "proximity",
+            lambda connection: self.proximity.refresh(ProximityRepository(connection)),
+            on_success=on_done,
+            on_error=lambda e: print(f"Error refreshing proximity index: {e}")
+        )
+
+    def suggest_nearest_volunteers(self):
+        """Select the available volunteers closest to the selected task's SOS request"""
+        selected_task = self.task_tree.focus()
+        task = self.task_tree.row(selected_task) if selected_task else None
+        if not task:
+            messagebox.showwarning("Selection Missing", "Please select a task first.")
+            return
+        if not task["relatedRequestID"]:
+            messagebox.showinfo("No Location", "This task is not linked to an SOS request.")
+            return
+
+        def show_nearest(_=None):
+            nearest = self.proximity.nearest_volunteers_to_request(task["relatedRequestID"], k=5)
+            if not nearest:
+                self.status_label.config(text="ℹ️ No located available volunteers near this request")
+                return
+            wanted = {row["volunteerID"]: distance for distance, row in nearest}
+            items = [item for item in self.vol_tree.get_children()
+                     if self.vol_tree.item(item)["values"][0] in wanted]
+            if items:
+                self.vol_tree.selection_set(items)
+                self.vol_tree.focus(items[0])
+                self.vol_tree.see(items[0])
+            self.status_label.config(text="📍 Nearest: " + ", ".join(
+                f"{row['name']} ({distance:.1f} km)" for distance, row in nearest
+            ))
+
+        self.status_label.config(text="⏳ Finding nearest volunteers...")
+        self.refresh_proximity(on_done=show_nearest)
 
     def on_volunteer_select(self, event):
         """Handle volunteer selection"""
@@ -954,25 +1009,76 @@ class AssignTaskApp(tk.Tk):
         ).pack(pady=20)
 
     def quick_assign(self):
-        """Quick assign functionality"""
-        messagebox.showinfo("Quick Assign", 
-                          "This feature automatically assigns the most urgent task\n"
-                          "to the first available volunteer.\n\n"
-                          "Feature coming soon!")
+        """Plan assignments for all unassigned tasks, preview them and commit on confirmation"""
+        self.status_label.config(text="⏳ Planning assignments...")
+
+        def work(connection):
+            service = TaskAssignmentService(TaskRepository(connection))
+            tasks = service.repo.get_unassigned_tasks()
+            plan = service.plan(tasks=tasks)
+            return plan, service.summarize(plan, len(tasks))
+
+        self.executor.submit("quick_assign", work, on_success=self.confirm_assignment_plan,
+                             on_error=self.on_quick_assign_error)
+
+    def confirm_assignment_plan(self, result):
+        plan, summary = result
+        if not plan:
+            messagebox.showinfo("Quick Assign", "No unassigned tasks or no available volunteers.")
+            self.status_label.config(text="ℹ️ Nothing to assign")
+            return
+
+        preview = "\n".join(
+            f"• {p['task']['title']} → {p['volunteer']['name']}"
+            + (f" ({p['distance_km']:.1f} km)" if p["distance_km"] is not None else "")
+            for p in plan[:10]
+        )
+        if len(plan) > 10:
+            preview += f"\n… and {len(plan) - 10} more"
+        avg = summary["avg_distance_km"]
+        if not messagebox.askyesno(
+            "Confirm Quick Assign",
+            f"Assign {summary['assigned']} tasks ({summary['unassigned']} left without a volunteer)?\n"
+            f"Role matches: {summary['skill_matches']} | "
+            f"Average distance: {f'{avg} km' if avg is not None else 'N/A'}\n\n{preview}"
+        ):
+            self.status_label.config(text="Assignment cancelled")
+            return
+
+        ngo_id = self.logged_in_user.get("userID") or self.logged_in_user.get("id") or 2
+        note = f"Quick-assigned by {self.logged_in_user.get('name', 'NGO')}"
+
+        def on_committed(count):
+            messagebox.showinfo("Success", f"✅ Assigned {count} tasks!")
+            self.status_label.config(text=f"✅ Quick-assigned {count} tasks")
+            self.load_dashboard_data()
+            self.load_volunteers()
+            self.load_tasks()
+
+        self.status_label.config(text="⏳ Saving assignments...")
+        self.executor.submit(
+            "quick_assign",
+            lambda connection: TaskAssignmentService(TaskRepository(connection)).commit(plan, ngo_id, note),
+            on_success=on_committed,
+            on_error=self.on_quick_assign_error
+        )
+
+    def on_quick_assign_error(self, error):
+        messagebox.showerror("Quick Assign Failed", f"Failed to assign tasks: {str(error)}")
+        self.status_label.config(text="❌ Quick assign failed")
 
     def show_statistics(self):
         """Show detailed statistics"""
         try:
-            self.cursor.execute("""
-                SELECT 
-                    (SELECT COUNT(*) FROM Volunteer) as total_volunteers,
-                    (SELECT COUNT(*) FROM Volunteer WHERE status='available') as available_volunteers,
-                    (SELECT COUNT(*) FROM Task) as total_tasks,
-                    (SELECT COUNT(*) FROM Task WHERE status='unassigned') as unassigned_tasks,
-                    (SELECT COUNT(*) FROM Task WHERE status='in_progress') as in_progress_tasks,
-                    (SELECT COUNT(*) FROM Task WHERE status='completed') as completed_tasks
-            """)
-            stats = self.cursor.fetchone()
+            metrics = DashboardMetricsService(self.connection).snapshot()
+            stats = {
+                "total_volunteers": metrics.total("Volunteer"),
+                "available_volunteers": metrics.get("Volunteer", "status:available"),
+                "total_tasks": metrics.total("Task"),
+                "unassigned_tasks": metrics.get("Task", "status:unassigned"),
+                "in_progress_tasks": metrics.get("Task", "status:in_progress"),
+                "completed_tasks": metrics.get("Task", "status:completed")
+            }
             
             messagebox.showinfo(
                 "System Statistics",
@@ -1042,22 +1148,20 @@ class AssignTaskApp(tk.Tk):
     def show_notifications(self):
         """Show notifications"""
         try:
-            self.cursor.execute("""
-                SELECT message, channel, status, timestamp
-                FROM Notification
-                WHERE recipientRole = 'NGO'
-                ORDER BY timestamp DESC
-                LIMIT 10
-            """)
-            notifications = self.cursor.fetchall()
+            ngo_id = self.logged_in_user.get("userID") or self.logged_in_user.get("id") or 2
+            inbox = InboxService(self.connection, ngo_id, "NGO")
+            unread = inbox.unread()
+            notifications = inbox.latest(10)
             
-            notif_text = "🔔 Recent Notifications:\n\n"
+            notif_text = f"🔔 Recent Notifications ({unread} unread):\n\n"
             for notif in notifications:
                 channel_icon = "📱" if notif["channel"] == "sms" else "📧" if notif["channel"] == "email" else "💬"
                 status_icon = "✅" if notif["status"] == "read" else "📨" if notif["status"] == "sent" else "📤"
                 notif_text += f"{channel_icon} {status_icon} {notif['message']}\n"
             
             messagebox.showinfo("Notifications", notif_text)
+            if unread:
+                inbox.mark_all_read()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load notifications: {str(e)}")
 
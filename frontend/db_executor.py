@@ -0,0 +1,130 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from data.db_connection import job_connection
+
+
+class QueryExecutor:
+    """
+    Runs database work off the Tk main loop.
+
+    Jobs execute on a small thread pool, each with its own pooled connection
+    (or its own short-lived connection when DB_POOL_CONFIG disables pooling).
+    Results are pushed onto a queue that the UI thread drains via after(), so
+    callbacks always run on the main loop. Jobs are submitted under a key;
+    submitting again under the same key supersedes the earlier job and its
+    result is dropped.
+    """
+
+    def __init__(self, widget, max_workers=4, poll_interval=50):
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="drms-db")
+        self._results = queue.Queue()
+        self._generations = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._after_id = None
+        self._closed = False
+
+    def submit(self, key, work, on_success, on_error=None):
+        """
+        Run work(connection) in the background and hand its return value to
+        on_success on the UI thread. Errors go to on_error(exception).
+        """
+        if self._closed:
+            return
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            previous = self._futures.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+
+        future = self._pool.submit(self._run, key, generation, work, on_success, on_error)
+        with self._lock:
+            self._futures[key] = future
+        self._schedule_poll()
+
+    def run_query(self, key, query, params=(), on_success=None, on_error=None, dictionary=False):
+        """Convenience wrapper: fetch all rows of a single SELECT in the background."""
+        def work(connection):
+            cursor = connection.cursor(dictionary=dictionary)
+            try:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+        self.submit(key, work, on_success, on_error)
+
+    def cancel(self, key):
+        """Drop the pending or running job under key; its callbacks will not fire."""
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            future = self._futures.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def is_busy(self, key):
+        with self._lock:
+            future = self._futures.get(key)
+        return future is not None and not future.done()
+
+    def _run(self, key, generation, work, on_success, on_error):
+        if not self._is_current(key, generation):
+            return
+        try:
+            with job_connection() as connection:
+                result = work(connection)
+            self._results.put((key, generation, on_success, result, None, on_error))
+        except Exception as e:
+            self._results.put((key, generation, on_success, None, e, on_error))
+
+    def _is_current(self, key, generation):
+        with self._lock:
+            return self._generations.get(key) == generation
+
+    def _schedule_poll(self):
+        if self._after_id is None and not self._closed:
+            self._after_id = self.widget.after(self.poll_interval, self._poll)
+
+    def _poll(self):
+        self._after_id = None
+        while True:
+            try:
+                key, generation, on_success, result, error, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if not self._is_current(key, generation):
+                continue  # superseded while in flight
+            with self._lock:
+                self._futures.pop(key, None)
+            if error is not None:
+                if on_error:
+                    on_error(error)
+                else:
+                    print(f"Background query '{key}' failed: {error}")
+            elif on_success:
+                on_success(result)
+
+        with self._lock:
+            pending = any(not f.done() for f in self._futures.values())
+        if pending or not self._results.empty():
+            self._schedule_poll()
+
+    def shutdown(self):
+        """Stop polling and abandon outstanding jobs (call from the window's destroy)."""
+        self._closed = True
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        with self._lock:
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+        self._pool.shutdown(wait=False)
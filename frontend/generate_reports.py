@@ -3,8 +3,6 @@ import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 import sv_ttk
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 
 # Add parent folder to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -13,7 +11,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from services.user_service import UserService
 from data.db_connection import DatabaseConnection
 from data.user_repository import UserRepository
+from data.report_repository import ReportRepository
+from services.report_job_service import get_report_job_queue
 from frontend.language import LanguageManager
+from frontend.db_executor import QueryExecutor
 
 # ---------- Backend setup ----------
 db = DatabaseConnection()
@@ -37,10 +38,13 @@ def apply_windows11_theme(window):
 
 # ---------- Generate Reports App ----------
 class GenerateReportsApp(tk.Tk):
+    PREVIEW_ROWS = 500  # rows shown on screen; exports always stream the full report
+
     def __init__(self, logged_in_user):
         super().__init__()
         self.logged_in_user = logged_in_user
         self.lang_manager = LanguageManager()
+        self.executor = QueryExecutor(self)
         self.geometry("900x600")
         self.configure(bg="#f3f3f3")
         self.title("Generate Reports")
@@ -189,7 +193,7 @@ class GenerateReportsApp(tk.Tk):
 
         self.print_button = tk.Button(
             btn_frame,
-            text="🖨️ Print/Save PDF",
+            text="🖨️ Export PDF/CSV",
             font=("Segoe UI", 11, "bold"),
             bg="#2196F3",
             fg="white",
@@ -270,6 +274,10 @@ class GenerateReportsApp(tk.Tk):
 
         self.refresh_language()
 
+    def destroy(self):
+        self.executor.shutdown()
+        super().destroy()
+
     # ---------------- Functions ----------------
     def go_back_to_admin(self):
         """Go back to AdminOptionsApp"""
@@ -299,107 +307,98 @@ class GenerateReportsApp(tk.Tk):
             self.tree.delete(i)
 
         try:
-            if report_type == "volunteers":
-                data = user_service.get_users_by_role("volunteer")
-                columns = ["ID", "Name", "Email", "Phone", "Location", "Status"]
-            elif report_type == "ngos":
-                data = user_service.get_users_by_role("ngo")
-                columns = ["ID", "Organization", "Email", "Phone", "Region", "Verified"]
-            elif report_type == "victims":
-                data = user_service.get_users_by_role("victim")
-                columns = ["ID", "Name", "Email", "Phone", "Location", "Needs"]
-            else:
-                messagebox.showwarning("Invalid Report", "Invalid report type selected.")
-                self.status_label.config(text="✗ Invalid report type")
-                return
-
-            if not data:
+            columns = ReportRepository.columns_for(report_type)
+        except ValueError:
+            messagebox.showwarning("Invalid Report", "Invalid report type selected.")
+            self.status_label.config(text="✗ Invalid report type")
+            return
+
+        def show_preview(rows):
+            if not rows:
                 messagebox.showinfo("No Data", f"No data available for {report_type}.")
                 self.status_label.config(text=f"✗ No data for {report_type}")
                 return
 
             self.columns = columns
-            self.report_data = data
+            self.report_type = report_type
             self.tree["columns"] = columns
             self.tree["show"] = "headings"
-            
+
             # Configure columns with better width
             for col in columns:
                 self.tree.heading(col, text=col, anchor="w")
                 self.tree.column(col, width=150, minwidth=100, stretch=True)
-            
+
             # Insert data
-            for row in data:
-                self.tree.insert("", "end", values=row)
-                
-            self.status_label.config(text=f"✓ Generated {report_type} report with {len(data)} records")
-            
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            for row in rows:
+                self.tree.insert("", "end", values=["" if value is None else value for value in row])
+
+            if len(rows) >= self.PREVIEW_ROWS:
+                self.status_label.config(text=f"✓ Showing first {len(rows)} {report_type} records - export for the full report")
+            else:
+                self.status_label.config(text=f"✓ Generated {report_type} report with {len(rows)} records")
+
+        def on_error(error):
+            messagebox.showerror("Error", str(error))
             self.status_label.config(text="✗ Error generating report")
 
+        self.status_label.config(text=f"⏳ Loading {report_type} report...")
+        self.executor.submit(
+            "report_preview",
+            lambda conn: ReportRepository(conn).preview(report_type, self.PREVIEW_ROWS),
+            on_success=show_preview,
+            on_error=on_error
+        )
+
     def print_report(self):
-        try:
-            if not hasattr(self, 'report_data') or not self.report_data:
-                messagebox.showwarning("Print Error", "Generate a report first before printing.")
-                self.status_label.config(text="✗ Generate report first")
-                return
+        if not getattr(self, "report_type", None):
+            messagebox.showwarning("Print Error", "Generate a report first before printing.")
+            self.status_label.config(text="✗ Generate report first")
+            return
+        if getattr(self, "export_job", None) and not self.export_job.done():
+            messagebox.showinfo("Export Running", "A report export is already in progress.")
+            return
+
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("PDF files", "*.pdf"), ("CSV files", "*.csv"),
+                       ("JSON Lines", "*.jsonl"), ("All files", "*.*")],
+            initialfile=f"{self.report_type}_report.pdf"
+        )
+        if not file_path:
+            return
 
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".pdf",
-                filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
-                initialfile=f"{self.report_var.get()}_report.pdf"
-            )
-            if not file_path:
-                return
+        file_format = os.path.splitext(file_path)[1].lower().lstrip(".")
+        if file_format not in ("pdf", "csv", "jsonl"):
+            messagebox.showerror("Error", "Please save the report as .pdf, .csv or .jsonl.")
+            return
 
-            c = canvas.Canvas(file_path, pagesize=letter)
-            width, height = letter
-            
-            # Title
-            c.setFont("Helvetica-Bold", 16)
-            c.drawString(50, height-50, f"{self.report_var.get().upper()} REPORT")
-            
-            # Subtitle with date
-            from datetime import datetime
-            date_str = datetime.now().strftime("%Y-%m-%d %H:%M")
-            c.setFont("Helvetica", 10)
-            c.drawString(50, height-70, f"Generated on: {date_str}")
-            c.drawString(50, height-85, f"Generated by: {self.logged_in_user.get('name', 'System')}")
-            
-            # Column headers
-            c.setFont("Helvetica-Bold", 10)
-            y = height - 120
-            col_width = (width - 100) / len(self.columns)
-            for i, col in enumerate(self.columns):
-                c.drawString(50 + i*col_width, y, col)
-            
-            # Data rows
-            c.setFont("Helvetica", 9)
-            y -= 20
-            
-            for row in self.report_data:
-                for i, item in enumerate(row):
-                    c.drawString(50 + i*col_width, y, str(item))
-                y -= 15
-                if y < 50:  # New page if running out of space
-                    c.showPage()
-                    y = height - 50
-                    c.setFont("Helvetica", 9)
-
-            # Footer
-            c.setFont("Helvetica-Oblique", 8)
-            c.drawString(50, 30, f"Total Records: {len(self.report_data)}")
-            c.drawString(width-250, 30, "DRMS - Disaster Relief Management System")
-
-            c.save()
-            
-            messagebox.showinfo("Success", f"✅ PDF report saved successfully!\n\nLocation: {file_path}")
-            self.status_label.config(text=f"✓ PDF exported: {os.path.basename(file_path)}")
+        self.status_label.config(text=f"⏳ Exporting {self.report_type} report to {os.path.basename(file_path)}...")
+        self.export_job = get_report_job_queue().submit(
+            self.report_type, file_format, dict(self.logged_in_user or {}), copy_to=file_path
+        )
+        self.after(100, self.check_export)
 
+    def check_export(self):
+        """Poll the running export job from the Tk loop."""
+        if not self.export_job.done():
+            self.after(200, self.check_export)
+            return
+
+        try:
+            result = self.export_job.result()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save PDF:\n{str(e)}")
-            self.status_label.config(text="✗ Failed to export PDF")
+            messagebox.showerror("Error", f"Failed to export report:\n{str(e)}")
+            self.status_label.config(text="✗ Failed to export report")
+            return
+
+        source = "reused report from the last few minutes" if result["cached"] else f"generated in {result['seconds']}s"
+        messagebox.showinfo(
+            "Success",
+            f"✅ Report saved successfully!\n\n"
+            f"Records: {result['rows']} ({source})\nLocation: {result['file_path']}"
+        )
+        self.status_label.config(text=f"✓ Exported {result['rows']} records to {os.path.basename(result['file_path'])}")
 
 
 # ---------- Test ----------
@@ -159,6 +159,11 @@ from services.user_service import UserService
 from data.db_connection import DatabaseConnection
 from data.user_repository import UserRepository
 from frontend.language import LanguageManager
+from frontend.db_executor import QueryExecutor
+from services.dashboard_metrics_service import DashboardMetricsService
+from data import reference_cache
+from services.notification_service import get_notification_dispatcher
+from services.priority_scoring_service import get_priority_scoring_scheduler
 
 # ----------------- Database connection -----------------
 db = DatabaseConnection()
@@ -197,10 +202,7 @@ class BaseApp(tk.Tk):
         self.colors = None
         self.db_connection = None
         self.cursor = None
-<<<<<<< HEAD
         self.after_id = None # Initialize after_id here
-=======
->>>>>>> 64f68c9c02ce6399ad50303b29192cd023d3df13
 
     def create_header(self, title, subtitle=None, show_back_button=False, back_command=None):
         """
@@ -525,6 +527,10 @@ class LoginApp(BaseApp):
             if user and user.get("role") == role:
                 user_name = user.get('name', 'User')
                 self.status_label.config(text=f"✓ Welcome, {user_name}!")
+                # Lookup tables load in the background while the welcome box is up
+                reference_cache.warm_up_async()
+                get_notification_dispatcher().start()
+                get_priority_scoring_scheduler().start()
                 
                 messagebox.showinfo("Login Successful", f"Welcome back, {user_name}!", parent=self)
                 self.destroy()
@@ -1342,26 +1348,11 @@ class VictimDashboardApp(BaseApp):
 
     def view_my_requests(self):
         """View SOS requests made by this victim"""
-<<<<<<< HEAD
-        
-        
-        messagebox.showinfo("View Requests", "This feature will be available soon!")
-=======
         messagebox.showinfo("View Requests", "This feature will be available soon!", parent=self)
->>>>>>> 64f68c9c02ce6399ad50303b29192cd023d3df13
         self.status_label.config(text="⚠ View My Requests - Coming Soon")
 
     def view_resources(self):
         """View available resources"""
-<<<<<<< HEAD
-        messagebox.showinfo("View Requests", "This feature will be available soon!")
-        self.status_label.config(text="⚠ View My Requests - Coming Soon")
-
-    def view_profile(self):
-        """View and edit victim profile"""
-        messagebox.showinfo("View Requests", "This feature will be available soon!")
-        self.status_label.config(text="⚠ View My Requests - Coming Soon")
-=======
         messagebox.showinfo("View Resources", "This feature will be available soon!", parent=self)
         self.status_label.config(text="⚠ View Resources - Coming Soon")
 
@@ -1369,7 +1360,6 @@ class VictimDashboardApp(BaseApp):
         """View and edit victim profile"""
         messagebox.showinfo("View Profile", "This feature will be available soon!", parent=self)
         self.status_label.config(text="⚠ View Profile - Coming Soon")
->>>>>>> 64f68c9c02ce6399ad50303b29192cd023d3df13
 
 
 # ----------------- Volunteer Dashboard -----------------
@@ -1391,6 +1381,7 @@ class VolunteerDashboardApp(BaseApp):
             db = DatabaseConnection()
             self.db_connection = db.connect()
             self.cursor = self.db_connection.cursor()
+        self.executor = QueryExecutor(self)
         
         try:
             enable_acrylic_for_window(self, accent_color=0xCCFFFFFF)
@@ -1406,6 +1397,10 @@ class VolunteerDashboardApp(BaseApp):
         self.create_status_bar()
         self.load_my_tasks()
 
+    def destroy(self):
+        self.executor.shutdown()
+        super().destroy()
+
     def create_widgets(self):
         # Header with back button
         self.create_header(
@@ -1707,84 +1702,88 @@ class VolunteerDashboardApp(BaseApp):
         self.status_label.pack(side="left", padx=20)
 
     def load_my_tasks(self):
-        """Load tasks assigned to this volunteer"""
-        try:
-            self.status_label.config(text="⏳ Loading your tasks...")
-            self.update()
-            
-            volunteer_id = self.logged_in_user.get("id")
-            
-            # Get task counts
-            count_query = """
-            SELECT 
-                SUM(CASE WHEN status = 'pending' OR status = 'unassigned' THEN 1 ELSE 0 END) as pending,
-                SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                SUM(CASE WHEN status = 'in_progress' THEN 1 ELSE 0 END) as in_progress,
-                COUNT(*) as total
-            FROM Task
-            WHERE assignedVolunteerID = %s OR assignedVolunteerID IS NULL
-            """
-            self.cursor.execute(count_query, (volunteer_id,))
-            counts = self.cursor.fetchone()
-            
-            # Update count labels
-            if counts:
-                self.pending_count.config(text=str(counts[0] or 0))
-                self.completed_count.config(text=str(counts[1] or 0))
-                self.inprogress_count.config(text=str(counts[2] or 0))
-                self.total_count.config(text=str(counts[3] or 0))
-            
-            # Get tasks for table
-            task_query = """
-            SELECT 
-                T.taskID, T.title, T.taskType, T.status, 
-                U.name as createdBy, T.relatedRequestID
-            FROM Task T
-            LEFT JOIN UserAccount U ON T.createdBy = U.userID
-            WHERE T.assignedVolunteerID = %s OR T.assignedVolunteerID IS NULL
-            ORDER BY 
-                CASE T.status
-                    WHEN 'unassigned' THEN 1
-                    WHEN 'pending' THEN 2
-                    WHEN 'in_progress' THEN 3
-                    WHEN 'completed' THEN 4
-                    ELSE 5
-                END,
-                T.taskID
-            """
-            self.cursor.execute(task_query, (volunteer_id,))
-            results = self.cursor.fetchall()
-            
-            self.tree.delete(*self.tree.get_children())
-            
-            for row in results:
-                # Format status with icon
-                status_icons = {
-                    "unassigned": "⏳",
-                    "pending": "⏳",
-                    "assigned": "👤",
-                    "in_progress": "🔄",
-                    "completed": "✅"
-                }
-                status = row[3]  # status is at index 3
-                status_icon = status_icons.get(status, "❓")
-                status_display = f"{status_icon} {status.title()}"
-                
-                self.tree.insert("", tk.END, values=(
-                    row[0],  # taskID
-                    row[1],  # title
-                    row[2].title(),  # taskType
-                    status_display,
-                    row[4] or "System",  # createdBy
-                    row[5] or "N/A"  # relatedRequestID
-                ))
-            
-            self.status_label.config(text=f"✅ Loaded {len(results)} tasks")
-            
-        except Exception as e:
+        """Load tasks assigned to this volunteer in the background"""
+        self.status_label.config(text="⏳ Loading your tasks...")
+        volunteer_id = self.logged_in_user.get("id")
+
+        def work(connection):
+            # Task counts come from the trigger-maintained counters table
+            by_status = DashboardMetricsService(connection).volunteer_tasks(volunteer_id)
+            counts = (
+                by_status.get("pending", 0) + by_status.get("unassigned", 0),
+                by_status.get("completed", 0),
+                by_status.get("in_progress", 0),
+                sum(by_status.values())
+            )
+
+            cursor = connection.cursor()
+            try:
+                # Get tasks for table
+                task_query = """
+                SELECT 
+                    T.taskID, T.title, T.taskType, T.status, 
+                    U.name as createdBy, T.relatedRequestID
+                FROM Task T
+                LEFT JOIN UserAccount U ON T.createdBy = U.userID
+                WHERE T.assignedVolunteerID = %s OR T.assignedVolunteerID IS NULL
+                ORDER BY 
+                    CASE T.status
+                        WHEN 'unassigned' THEN 1
+                        WHEN 'pending' THEN 2
+                        WHEN 'in_progress' THEN 3
+                        WHEN 'completed' THEN 4
+                        ELSE 5
+                    END,
+                    T.taskID
+                """
+                cursor.execute(task_query, (volunteer_id,))
+                return counts, cursor.fetchall()
+            finally:
+                cursor.close()
+
+        def on_error(e):
             messagebox.showerror("Database Error", f"Failed to load tasks.\n{str(e)}")
             self.status_label.config(text="❌ Failed to load tasks")
 
+        self.executor.submit("my_tasks", work, on_success=self.show_my_tasks, on_error=on_error)
+
+    def show_my_tasks(self, result):
+        """Fill counters and the task table with rows fetched by load_my_tasks"""
+        counts, results = result
+        
+        # Update count labels
+        if counts:
+            self.pending_count.config(text=str(counts[0] or 0))
+            self.completed_count.config(text=str(counts[1] or 0))
+            self.inprogress_count.config(text=str(counts[2] or 0))
+            self.total_count.config(text=str(counts[3] or 0))
+        
+        self.tree.delete(*self.tree.get_children())
+        
+        for row in results:
+            # Format status with icon
+            status_icons = {
+                "unassigned": "⏳",
+                "pending": "⏳",
+                "assigned": "👤",
+                "in_progress": "🔄",
+                "completed": "✅"
+            }
+            status = row[3]  # status is at index 3
+            status_icon = status_icons.get(status, "❓")
+            status_display = f"{status_icon} {status.title()}"
+            
+            self.tree.insert("", tk.END, values=(
+                row[0],  # taskID
+                row[1],  # title
+                row[2].title(),  # taskType
+                status_display,
+                row[4] or "System",  # createdBy
+                row[5] or "N/A"  # relatedRequestID
+            ))
+        
+        self.status_label.config(text=f"✅ Loaded {len(results)} tasks")
+
     def on_task_select(self, event):
         """Handle task selection"""
         selected_item = self.tree.focus()
@@ -8,6 +8,7 @@ from tkinter import ttk, messagebox
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from data.db_connection import DatabaseConnection
+from data import reference_cache
 import mysql.connector
 
 class ManageResourcePermissionsApp(tk.Tk):
@@ -233,6 +234,7 @@ Contact Information:
             # Update verified status
             cursor.execute("UPDATE NGO SET verified = TRUE WHERE ngoID = %s", (ngo_id,))
             self.connection.commit()
+            reference_cache.invalidate("ngos")
             cursor.close()
             
             messagebox.showinfo("Success", f"Resource management permission granted to {org_name}!")
@@ -263,6 +265,7 @@ Contact Information:
             cursor = self.connection.cursor()
             cursor.execute("UPDATE NGO SET verified = FALSE WHERE ngoID = %s", (ngo_id,))
             self.connection.commit()
+            reference_cache.invalidate("ngos")
             cursor.close()
             
             messagebox.showinfo("Success", f"Resource management permission revoked from {org_name}!")
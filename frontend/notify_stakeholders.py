@@ -14,6 +14,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from services.user_service import UserService
 from data.db_connection import DatabaseConnection
 from data.user_repository import UserRepository
+from services.notification_service import NotificationService
 
 # ---------- Backend setup ----------
 db = DatabaseConnection()
@@ -23,6 +24,10 @@ if not connection:
 
 user_repo = UserRepository(connection)
 user_service = UserService(user_repo)
+notification_service = NotificationService(connection)
+
+# Radio button values -> UserAccount.role (None = everyone)
+STAKEHOLDER_ROLES = {"volunteer": "Volunteer", "ngo": "NGO", "victim": "Victim", "admin": "Admin", "all": None}
 
 # ---------- Windows 11 Theme ----------
 def apply_windows11_theme(window):
@@ -470,15 +475,7 @@ DRMS Team"""
     def update_recipient_count(self):
         try:
             stakeholder_type = self.stakeholder_var.get()
-            
-            if stakeholder_type == "all":
-                # Count all users
-                users = user_service.get_all_users()
-            else:
-                # Count users by specific role
-                users = user_service.get_users_by_role(stakeholder_type)
-            
-            count = len(users) if users else 0
+            count = notification_service.count_recipients(STAKEHOLDER_ROLES[stakeholder_type])
             self.recipient_count_label.config(text=f"Recipients: {count}")
             
         except Exception as e:
@@ -662,33 +659,27 @@ Please respond if you can help.
             return
         
         try:
-            # Get stakeholders
-            if stakeholder_type == "all":
-                stakeholders = user_service.get_all_users()
-            else:
-                stakeholders = user_service.get_users_by_role(stakeholder_type)
-            
-            if not stakeholders:
+            recipient_role = STAKEHOLDER_ROLES[stakeholder_type]
+            sent_count = notification_service.count_recipients(recipient_role)
+            if not sent_count:
                 messagebox.showinfo("No Stakeholders", f"No {stakeholder_type}s found to notify.")
                 self.status_label.config(text=f"✗ No {stakeholder_type}s found")
                 return
             
-            # Simulate sending notification
-            sent_count = 0
-            for user in stakeholders:
-                user_name = user[1] if isinstance(user, tuple) else user.get('name', 'User')
-                user_email = user[2] if isinstance(user, tuple) else user.get('email', '')
-                
-                # Here you would integrate with actual email/SMS services
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] "
-                      f"Sent to {user_name} ({user_email}): "
-                      f"{subject[:30]}...")
-                sent_count += 1
+            # Queued once; the background dispatcher fans it out to every recipient
+            channel = self.notification_type.get()
+            notification_service.enqueue(
+                message_content,
+                channels=("in_app", "email", "sms") if channel == "all" else (channel,),
+                recipient_role=recipient_role,
+                subject=subject,
+                created_by=self.logged_in_user.get("userID") or self.logged_in_user.get("id")
+            )
             
             # Success message
             messagebox.showinfo(
                 "Success!",
-                f"✅ Notification sent to {sent_count} {stakeholder_type}(s) successfully!\n\n"
+                f"✅ Notification queued for {sent_count} {stakeholder_type}(s)!\n\n"
                 f"Subject: {subject}\n"
                 f"Message length: {len(message_content)} characters\n"
                 f"Sent via: {self.notification_type.get().upper()}"
@@ -698,7 +689,7 @@ Please respond if you can help.
             self.message_text.delete("1.0", "end")
             self.subject_entry.delete(0, "end")
             self.subject_entry.insert(0, f"DRMS Notification - {datetime.now().strftime('%Y-%m-%d')}")
-            self.status_label.config(text=f"✓ Sent to {sent_count} recipients successfully")
+            self.status_label.config(text=f"✓ Queued for {sent_count} recipients")
             
             # Log the notification
             self.log_notification(subject, stakeholder_type, sent_count)
@@ -710,7 +701,7 @@ Please respond if you can help.
     def log_notification(self, subject, recipient_type, count):
         """Log the notification (in a real app, this would save to database)"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] Sent '{subject}' to {count} {recipient_type}s\n"
+        log_entry = f"[{timestamp}] Queued '{subject}' for {count} {recipient_type}s\n"
         
         # In a real app, save to database or log file
         print(f"LOG: {log_entry}")
@@ -6,6 +6,82 @@ import sv_ttk
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from data.db_connection import DatabaseConnection
+from data.priority_zone_repository import PriorityZoneRepository
+from data.shelter_repository import ShelterRepository
+from data.sos_repository import SOSRepository
+from frontend.db_executor import QueryExecutor
+from frontend.virtual_table import KeysetPager, VirtualTreeview
+from services.sos_change_feed import SOSChangeFeed
+from services.priority_scoring_service import PriorityScoringService
+from services.hotspot_service import HotspotService
+from services.shelter_matching_service import ShelterMatchingService
+from services.sos_priority_queue import get_sos_priority_queue
+from services.zone_index import get_zone_index
+
+# Auto-refresh cadence and the largest change batch merged incrementally
+# (bigger bursts fall back to a full reload).
+AUTO_REFRESH_MS = 5000
+MAX_CHANGES_PER_REFRESH = 2000
+NEXT_UP_COUNT = 10
+
+REQUEST_COLUMNS = """
+    SELECT SOSRequest.requestID, UserAccount.name, SOSRequest.location, 
+           SOSRequest.description, SOSRequest.urgencyLevel, SOSRequest.priorityScore,
+           SOSRequest.status, SOSRequest.updatedAt, SOSRequest.duplicateOf,
+           SOSRequest.latitude, SOSRequest.longitude,
+           head.status AS headStatus,
+           (SELECT COUNT(*) FROM SOSRequest dup
+            WHERE dup.duplicateOf = SOSRequest.requestID AND dup.status = 'pending') AS duplicateCount
+    FROM SOSRequest
+    JOIN UserAccount ON SOSRequest.victimID = UserAccount.userID
+    LEFT JOIN SOSRequest head ON head.requestID = SOSRequest.duplicateOf
+"""
+
+# A duplicate stays hidden behind its cluster head while the head is pending
+CLUSTER_HEADS_ONLY = " AND (SOSRequest.duplicateOf IS NULL OR head.status <> 'pending')"
+
+ALL_ZONES = "All areas"
+ANY_ZONE = "Any priority zone"
+
+# Narrow snapshot of the pending set: what the counters, the priority queue
+# and request_listed() need
+SNAPSHOT_QUERY = """
+    SELECT SOSRequest.requestID, SOSRequest.status, SOSRequest.urgencyLevel,
+           SOSRequest.priorityScore, SOSRequest.location,
+           SOSRequest.duplicateOf, head.status AS headStatus
+    FROM SOSRequest
+    JOIN UserAccount ON SOSRequest.victimID = UserAccount.userID
+    LEFT JOIN SOSRequest head ON head.requestID = SOSRequest.duplicateOf
+    WHERE SOSRequest.status='pending'
+"""
+
+
+def pending_request_query(collapse, zone_id, zones):
+    """
+    (query with a {keyset} placeholder, params) for the pending requests the
+    table lists: cluster heads only when collapse is set, and members of
+    zone_id (0 for any zone) when it is not None.
+    """
+    heads_only = CLUSTER_HEADS_ONLY if collapse else ""
+    in_zone, params = "", ()
+    if zone_id is not None:
+        params = tuple(sorted(zones.members(zone_id or None)))
+        in_zone = f" AND SOSRequest.requestID IN ({', '.join(['%s'] * len(params))})" if params else " AND 1=0"
+    return REQUEST_COLUMNS + " WHERE SOSRequest.status='pending'" + heads_only + in_zone + " {keyset}", params
+
+
+def request_listed(row, collapse, zone_id, zones):
+    """Whether pending_request_query() would list the row (row needs SNAPSHOT_QUERY's columns)"""
+    if row["status"] != "pending":
+        return False
+    if zone_id is not None:
+        zone_ids = zones.zones_of(row["requestID"])
+        if not zone_ids or (zone_id and zone_id not in zone_ids):
+            return False
+    if collapse and row["duplicateOf"] is not None:
+        return row["headStatus"] != "pending"
+    return True
+
 
 class PrioritizeRequestsApp(tk.Tk):
     def __init__(self, logged_in_user=None, db_connection=None, back_command=None):
@@ -41,11 +117,29 @@ class PrioritizeRequestsApp(tk.Tk):
         # Use passed DB connection or create new
         self.connection = db_connection if db_connection else DatabaseConnection().connect()
         self.cursor = self.connection.cursor()
+        self.executor = QueryExecutor(self)
+        self.collapse_var = tk.BooleanVar(value=True)
+        self.zone_var = tk.StringVar(value=ALL_ZONES)
+        self.zone_choices = {}
+        self.zones = get_zone_index()
+        self.queue = get_sos_priority_queue()
+        self.feed = SOSChangeFeed(
+            include=self.is_listed,
+            classify=lambda row: [row["urgencyLevel"]]
+        )
+        self.refresh_job = None
 
         # Create scrollable UI
         self.create_scrollable_ui()
         self.load_requests()
 
+    def destroy(self):
+        if self.refresh_job:
+            self.after_cancel(self.refresh_job)
+            self.refresh_job = None
+        self.executor.shutdown()
+        super().destroy()
+
     def create_scrollable_ui(self):
         # ========== MAIN CONTAINER WITH SCROLLBAR ==========
         main_container = tk.Frame(self, bg="#f3f3f3")
@@ -233,10 +327,33 @@ class PrioritizeRequestsApp(tk.Tk):
             command=self.load_requests
         )
         refresh_btn.pack(side="right", padx=15, pady=8)
+
+        # Collapse probable duplicates into their cluster head
+        tk.Checkbutton(
+            table_header,
+            text="Collapse duplicates",
+            variable=self.collapse_var,
+            font=("Segoe UI", 9),
+            bg="#f8fafc",
+            activebackground="#f8fafc",
+            command=self.load_table
+        ).pack(side="right", pady=8)
+
+        # Filter by PriorityZone (membership comes from the in-memory zone index)
+        self.zone_box = ttk.Combobox(
+            table_header,
+            textvariable=self.zone_var,
+            values=[ALL_ZONES, ANY_ZONE],
+            state="readonly",
+            width=28,
+            font=("Segoe UI", 9)
+        )
+        self.zone_box.pack(side="right", padx=15, pady=8)
+        self.zone_box.bind("<<ComboboxSelected>>", lambda e: self.load_table())
         
         # Create Treeview with scrollbars
-        columns = ("requestID", "victimName", "location", "description", "urgencyLevel")
-        column_names = ["Request ID", "Victim Name", "Location", "Message", "Current Urgency"]
+        columns = ("requestID", "victimName", "location", "description", "urgencyLevel", "zone", "reports")
+        column_names = ["Request ID", "Victim Name", "Location", "Message", "Current Urgency", "Zone", "Reports"]
         
         # Frame for tree and scrollbars
         tree_frame = tk.Frame(table_container, bg="white")
@@ -250,9 +367,11 @@ class PrioritizeRequestsApp(tk.Tk):
         x_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal")
         x_scrollbar.pack(side="bottom", fill="x")
         
-        # Create Treeview
-        self.table = ttk.Treeview(
+        # Create Treeview (rows are paged in as the user scrolls)
+        self.table = VirtualTreeview(
             tree_frame,
+            self.executor,
+            self.format_request,
             columns=columns,
             show="headings",
             height=15,
@@ -279,6 +398,10 @@ class PrioritizeRequestsApp(tk.Tk):
                 self.table.column(col, width=300, anchor="w")
             elif col == "urgencyLevel":
                 self.table.column(col, width=120, anchor="center")
+            elif col == "zone":
+                self.table.column(col, width=180, anchor="w")
+            elif col == "reports":
+                self.table.column(col, width=80, anchor="center")
         
         # Bind selection event
         self.table.bind("<<TreeviewSelect>>", self.on_row_select)
@@ -470,80 +593,188 @@ class PrioritizeRequestsApp(tk.Tk):
                 self.status_label.config(text=f"✅ Selected Request ID: {request_id}")
 
     def load_requests(self):
-        """Load SOS requests from database"""
-        # Clear existing data
-        for item in self.table.get_children():
-            self.table.delete(item)
-        
-        # Reset statistics
-        for label in self.stat_labels:
-            label.config(text="0")
-        
-        try:
-            query = """
-                SELECT SOSRequest.requestID, UserAccount.name, SOSRequest.location, 
-                       SOSRequest.description, SOSRequest.urgencyLevel
-                FROM SOSRequest
-                JOIN UserAccount ON SOSRequest.victimID = UserAccount.userID
-                WHERE SOSRequest.status='pending'
-                ORDER BY 
-                    CASE urgencyLevel
-                        WHEN 'critical' THEN 1
-                        WHEN 'high' THEN 2
-                        WHEN 'medium' THEN 3
-                        WHEN 'low' THEN 4
-                        ELSE 5
-                    END
-            """
-            self.cursor.execute(query)
-            rows = self.cursor.fetchall()
-            
-            # Statistics counters
-            stats = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-            
-            for row in rows:
-                request_id, victim_name, location, description, urgency = row
-                
-                # Format urgency with icons
-                urgency_icons = {
-                    "critical": "🚨 CRITICAL",
-                    "high": "⚠️ HIGH",
-                    "medium": "📊 MEDIUM",
-                    "low": "📉 LOW"
-                }
-                urgency_display = urgency_icons.get(urgency, urgency.upper())
-                
-                # Insert into table
-                self.table.insert("", "end", values=(
-                    request_id,
-                    victim_name,
-                    location,
-                    description[:100] + "..." if len(description) > 100 else description,
-                    urgency_display
-                ))
-                
-                # Update statistics
-                if urgency in stats:
-                    stats[urgency] += 1
-            
-            total_count = len(rows)
-            
-            # Update statistics labels
-            if len(self.stat_labels) >= 5:
-                self.stat_labels[0].config(text=str(total_count))
-                self.stat_labels[1].config(text=str(stats["critical"]))
-                self.stat_labels[2].config(text=str(stats["high"]))
-                self.stat_labels[3].config(text=str(stats["medium"]))
-                self.stat_labels[4].config(text=str(stats["low"]))
-            
-            self.status_label.config(text=f"✅ Loaded {total_count} pending SOS requests")
-            
-            if not rows:
-                self.status_label.config(text="ℹ️ No pending SOS requests found")
-                
-        except Exception as e:
-            messagebox.showerror("Database Error", f"Failed to load requests: {str(e)}")
-            self.status_label.config(text="❌ Failed to load requests")
+        """Bring the zone index up to date, then reload the table"""
+        self.status_label.config(text="⏳ Loading SOS requests...")
+        self.executor.cancel("sos_changes")
+
+        def work(connection):
+            self.zones.sync(SOSRepository(connection), PriorityZoneRepository(connection))
+
+        def on_synced(_):
+            self.update_zone_choices()
+            self.load_table()
+
+        def on_error(error):
+            # The table still works without zone information
+            print(f"Zone index sync failed: {error}")
+            self.load_table()
+
+        self.executor.submit("zone_sync", work, on_success=on_synced, on_error=on_error)
+
+    def update_zone_choices(self):
+        zones = sorted(self.zones.zones.values(), key=lambda z: (z["name"] or "", z["zoneID"]))
+        self.zone_choices = {f"{z['name'] or 'Zone'} (#{z['zoneID']}, {z['priority_level']})": z["zoneID"]
+                             for z in zones}
+        self.zone_box.config(values=[ALL_ZONES, ANY_ZONE, *self.zone_choices])
+        if self.zone_var.get() not in (ALL_ZONES, ANY_ZONE, *self.zone_choices):
+            self.zone_var.set(ALL_ZONES)
+
+    def zone_filter(self):
+        """None for no filter, otherwise the zoneID to filter on (0 for any zone)"""
+        choice = self.zone_var.get()
+        if choice == ANY_ZONE:
+            return 0
+        return self.zone_choices.get(choice)
+
+    def load_table(self):
+        """Load SOS requests from database in the background, one page at a time"""
+        self.executor.cancel("sos_changes")
+        query, params = pending_request_query(self.collapse_var.get(), self.zone_filter(), self.zones)
+        pager = KeysetPager(
+            query,
+            params=params,
+            order=[
+                ("SOSRequest.priorityScore", "priorityScore", "DESC"),
+                ("SOSRequest.requestID", "requestID", "ASC")
+            ]
+        )
+        self.table.load(pager, on_error=self.on_load_error)
+        self.load_snapshot()
+
+    def load_snapshot(self):
+        """
+        Take a narrow snapshot of the pending set to seed counters, the priority queue and the watermark.
+        It carries the columns is_listed() reads, so the feed only counts what the table shows;
+        the shared priority queue gets every pending row.
+        """
+        def work(connection):
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute("SELECT NOW() AS now")
+                watermark = cursor.fetchone()["now"]
+                cursor.execute(SNAPSHOT_QUERY)
+                return watermark, cursor.fetchall()
+            finally:
+                cursor.close()
+
+        def on_snapshot(result):
+            watermark, rows = result
+            self.feed.reset(rows, watermark)
+            self.queue.rebuild(rows)
+            self.show_request_stats()
+            self.schedule_refresh()
+
+        self.executor.submit("request_stats", work, on_success=on_snapshot, on_error=self.on_load_error)
+
+    def schedule_refresh(self):
+        if self.refresh_job:
+            self.after_cancel(self.refresh_job)
+        self.refresh_job = self.after(AUTO_REFRESH_MS, self.refresh_changes)
+
+    def refresh_changes(self):
+        """Merge only rows whose updatedAt moved past the watermark"""
+        if self.refresh_job:
+            self.after_cancel(self.refresh_job)
+        self.refresh_job = None
+        since = self.feed.since()
+        if since is None:
+            return
+
+        def work(connection):
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(
+                    REQUEST_COLUMNS + " WHERE SOSRequest.updatedAt >= %s ORDER BY SOSRequest.updatedAt LIMIT %s",
+                    (since, MAX_CHANGES_PER_REFRESH)
+                )
+                rows = cursor.fetchall()
+                # A head changing status does not touch its duplicates' updatedAt, but
+                # whether they are listed depends on it: re-read those clusters too
+                head_ids = [row["requestID"] for row in rows if row["duplicateCount"]]
+                if head_ids and len(rows) < MAX_CHANGES_PER_REFRESH:
+                    cursor.execute(
+                        REQUEST_COLUMNS + " WHERE SOSRequest.status='pending' AND SOSRequest.duplicateOf IN ("
+                        + ", ".join(["%s"] * len(head_ids)) + ")",
+                        tuple(head_ids)
+                    )
+                    rows += cursor.fetchall()
+                return rows
+            finally:
+                cursor.close()
+
+        def on_changes(rows):
+            if len(rows) >= MAX_CHANGES_PER_REFRESH:
+                self.load_requests()
+                return
+            self.zones.update_requests(rows)
+            self.queue.apply(rows)
+            upserts, removed_ids = self.feed.apply(rows)
+            self.table.apply_changes(upserts, removed_ids)
+            self.show_request_stats()
+            self.schedule_refresh()
+
+        def on_error(error):
+            print(f"Auto-refresh failed: {error}")
+            self.schedule_refresh()
+
+        self.executor.submit("sos_changes", work, on_success=on_changes, on_error=on_error)
+
+    def is_listed(self, row):
+        """Whether a request belongs in the table under the current collapse setting and zone filter"""
+        return request_listed(row, self.collapse_var.get(), self.zone_filter(), self.zones)
+
+    def on_load_error(self, error):
+        messagebox.showerror("Database Error", f"Failed to load requests: {str(error)}")
+        self.status_label.config(text="❌ Failed to load requests")
+
+    def format_request(self, row):
+        """Table values for one SOS request row"""
+        description = row["description"] or ""
+        
+        # Format urgency with icons
+        urgency_icons = {
+            "critical": "🚨 CRITICAL",
+            "high": "⚠️ HIGH",
+            "medium": "📊 MEDIUM",
+            "low": "📉 LOW"
+        }
+        urgency_display = urgency_icons.get(row["urgencyLevel"], row["urgencyLevel"].upper())
+
+        # Cluster heads show how many reports they stand for; duplicates point at their head
+        if row["duplicateOf"] is not None:
+            reports = f"↳ #{row['duplicateOf']}"
+        else:
+            reports = f"×{row['duplicateCount'] + 1}" if row["duplicateCount"] else "1"
+        
+        zone = self.zones.best_zone(row["requestID"])
+        zone_display = f"{zone['name'] or 'Zone'} ({zone['priority_level']})" if zone else "—"
+        
+        return (
+            row["requestID"],
+            row["name"],
+            row["location"],
+            description[:100] + "..." if len(description) > 100 else description,
+            urgency_display,
+            zone_display,
+            reports
+        )
+
+    def show_request_stats(self):
+        """Update statistics labels from the change feed's counters"""
+        stats = self.feed.counters
+        total_count = len(self.feed)
+        
+        if len(self.stat_labels) >= 5:
+            self.stat_labels[0].config(text=str(total_count))
+            self.stat_labels[1].config(text=str(stats["critical"]))
+            self.stat_labels[2].config(text=str(stats["high"]))
+            self.stat_labels[3].config(text=str(stats["medium"]))
+            self.stat_labels[4].config(text=str(stats["low"]))
+        
+        self.status_label.config(text=f"✅ Showing {total_count} pending SOS requests")
+        
+        if not total_count:
+            self.status_label.config(text="ℹ️ No pending SOS requests found")
 
     def apply_priority(self):
         """Apply priority to selected request"""
@@ -567,21 +798,21 @@ class PrioritizeRequestsApp(tk.Tk):
             return
         
         try:
-            query = "UPDATE SOSRequest SET urgencyLevel=%s WHERE requestID=%s"
-            self.cursor.execute(query, (selected_priority, request_id))
-            self.connection.commit()
+            # A collapsed row stands for its whole cluster
+            rows = SOSRepository(self.connection).set_urgency(
+                [request_id], selected_priority, with_duplicates=self.collapse_var.get()
+            )
+            self.queue.apply(rows)
             
             # Success message
             messagebox.showinfo("Success", f"✅ Priority updated to '{selected_priority.upper()}'!")
             self.status_label.config(text=f"✅ Priority updated for Request ID {request_id}")
             
-            # Remove from table and refresh
-            self.table.delete(selected_item)
             self.selected_label.config(text="No request selected")
             self.priority_var.set("")
             
-            # Update statistics
-            self.load_requests()
+            # Merge the change and update statistics
+            self.refresh_changes()
             
         except Exception as e:
             messagebox.showerror("Database Error", f"Failed to update priority: {str(e)}")
@@ -593,6 +824,10 @@ class PrioritizeRequestsApp(tk.Tk):
         quick_menu.add_command(label="🚨 Mark All Critical", command=lambda: self.bulk_update("critical"))
         quick_menu.add_command(label="⚠️ Mark All High", command=lambda: self.bulk_update("high"))
         quick_menu.add_separator()
+        quick_menu.add_command(label="🎯 Next Up", command=self.show_next_up)
+        quick_menu.add_command(label="🧮 Recalculate Scores", command=self.recalculate_scores)
+        quick_menu.add_command(label="🗺️ Refresh Hotspot Zones", command=self.refresh_hotspot_zones)
+        quick_menu.add_command(label="🏠 Assign Shelters", command=self.assign_shelters)
         quick_menu.add_command(label="🔄 Refresh All", command=self.load_requests)
         quick_menu.add_command(label="📊 Show Statistics", command=self.show_statistics)
         
@@ -605,6 +840,19 @@ class PrioritizeRequestsApp(tk.Tk):
         except:
             quick_menu.tk_popup(self.winfo_pointerx(), self.winfo_pointery())
 
+    def show_next_up(self):
+        """Show the highest-priority requests in view, read from the priority queue"""
+        rows = self.queue.top(NEXT_UP_COUNT, include=lambda row: row["requestID"] in self.feed)
+        if not rows:
+            messagebox.showinfo("Next Up", "No pending SOS requests.")
+            return
+        lines = [
+            f"{rank}. #{row['requestID']} {(row['urgencyLevel'] or '').upper()} "
+            f"(score {row['priorityScore'] or 0}) - {row['location'] or 'No location'}"
+            for rank, row in enumerate(rows, start=1)
+        ]
+        messagebox.showinfo("Next Up", "🎯 Highest priority pending requests:\n\n" + "\n".join(lines))
+
     def bulk_update(self, priority):
         """Bulk update all visible requests to a specific priority"""
         if not messagebox.askyesno("Bulk Update", f"Set ALL visible requests to '{priority.upper()}' priority?"):
@@ -621,23 +869,101 @@ class PrioritizeRequestsApp(tk.Tk):
                 messagebox.showinfo("No Requests", "No requests to update.")
                 return
             
-            # Update all in database
-            placeholders = ','.join(['%s'] * len(request_ids))
-            query = f"UPDATE SOSRequest SET urgencyLevel=%s WHERE requestID IN ({placeholders})"
-            self.cursor.execute(query, (priority, *request_ids))
-            self.connection.commit()
+            # Update all in database and re-key them in the priority queue
+            rows = SOSRepository(self.connection).set_urgency(
+                request_ids, priority, with_duplicates=self.collapse_var.get()
+            )
+            self.queue.apply(rows)
             
-            updated_count = self.cursor.rowcount
+            updated_count = len(rows)
             messagebox.showinfo("Success", f"✅ Updated {updated_count} requests to '{priority.upper()}' priority!")
             self.status_label.config(text=f"✅ Bulk updated {updated_count} requests")
             
-            # Refresh table
-            self.load_requests()
+            # Merge the changes into the table
+            self.refresh_changes()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to bulk update: {str(e)}")
             self.status_label.config(text="❌ Failed to bulk update")
 
+    def recalculate_scores(self):
+        """Rescore open requests in the background and reload the ordered table"""
+        self.status_label.config(text="⏳ Recalculating priority scores...")
+
+        def on_done(result):
+            self.status_label.config(
+                text=f"✅ Rescored {result['scanned']} open requests "
+                     f"({result['updated']} changed) in {result['seconds']}s"
+            )
+            self.table.reload()
+
+        def on_error(error):
+            messagebox.showerror("Database Error", f"Failed to recalculate scores: {str(error)}")
+            self.status_label.config(text="❌ Failed to recalculate scores")
+
+        self.executor.submit(
+            "rescore",
+            lambda connection: PriorityScoringService(SOSRepository(connection), queue=self.queue).rescore_open(),
+            on_success=on_done,
+            on_error=on_error
+        )
+
+    def refresh_hotspot_zones(self):
+        """Regenerate auto PriorityZones from open request clusters, then rescore"""
+        self.status_label.config(text="⏳ Clustering open requests into hotspot zones...")
+
+        def work(connection):
+            sos_repo, zone_repo = SOSRepository(connection), PriorityZoneRepository(connection)
+            plan = HotspotService(sos_repo, zone_repo).refresh_zones()
+            self.zones.sync(sos_repo, zone_repo)
+            return plan
+
+        def on_done(plan):
+            messagebox.showinfo(
+                "Hotspot Zones",
+                f"🗺️ {plan['hotspots']} hotspots found in {plan['cluster_seconds']}s\n\n"
+                f"New zones: {len(plan['insert'])}\n"
+                f"Updated zones: {len(plan['update'])}\n"
+                f"Retired zones: {len(plan['retire'])}\n"
+                f"Already covered by manual zones: {plan['covered']}"
+            )
+            self.update_zone_choices()
+            self.recalculate_scores()
+
+        def on_error(error):
+            messagebox.showerror("Database Error", f"Failed to refresh hotspot zones: {str(error)}")
+            self.status_label.config(text="❌ Failed to refresh hotspot zones")
+
+        self.executor.submit("hotspots", work, on_success=on_done, on_error=on_error)
+
+    def assign_shelters(self):
+        """Place open shelter requests into the nearest shelters with room"""
+        if not messagebox.askyesno("Assign Shelters", "Assign all open shelter requests to shelters with space?"):
+            return
+        self.status_label.config(text="⏳ Matching shelter requests to shelters...")
+
+        def on_done(plan):
+            messagebox.showinfo(
+                "Assign Shelters",
+                f"🏠 {len(plan['assignments'])} requests placed ({plan['people']} people)\n"
+                f"Without a place: {len(plan['unplaced'])}\n\n"
+                f"Matched in {plan['match_seconds']}s, {plan['seconds']}s in total"
+            )
+            self.status_label.config(text=f"✅ Assigned {len(plan['assignments'])} requests to shelters")
+            self.queue.remove([a["requestID"] for a in plan["assignments"]])
+            self.refresh_changes()
+
+        def on_error(error):
+            messagebox.showerror("Database Error", f"Failed to assign shelters: {str(error)}")
+            self.status_label.config(text="❌ Failed to assign shelters")
+
+        self.executor.submit(
+            "shelters",
+            lambda connection: ShelterMatchingService(ShelterRepository(connection)).assign_pending(),
+            on_success=on_done,
+            on_error=on_error
+        )
+
     def show_statistics(self):
         """Show detailed statistics"""
         try:
@@ -680,14 +1006,7 @@ class PrioritizeRequestsApp(tk.Tk):
                        SOSRequest.description, SOSRequest.urgencyLevel, SOSRequest.status
                 FROM SOSRequest
                 JOIN UserAccount ON SOSRequest.victimID = UserAccount.userID
-                ORDER BY 
-                    CASE urgencyLevel
-                        WHEN 'critical' THEN 1
-                        WHEN 'high' THEN 2
-                        WHEN 'medium' THEN 3
-                        WHEN 'low' THEN 4
-                        ELSE 5
-                    END
+                ORDER BY SOSRequest.priorityScore DESC, SOSRequest.requestID
             """
             self.cursor.execute(query)
             rows = self.cursor.fetchall()
@@ -4,6 +4,7 @@ import tkinter as tk
 from tkinter import messagebox, ttk
 import sv_ttk
 from data.db_connection import DatabaseConnection
+from data import reference_cache
 import sys
 import os
 
@@ -454,6 +455,7 @@ class RegisterNGOApp(tk.Tk):
             """
             self.cursor.execute(insert_ngo, (user_id, name, False, None, region, contact))
             self.connection.commit()
+            reference_cache.invalidate("ngos")
 
             messagebox.showinfo("Success", f"✅ NGO '{name}' registered successfully!")
             self.status_label.config(text=f"✓ NGO '{name}' registered successfully")
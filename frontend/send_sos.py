@@ -1,13 +1,14 @@
 import sys
 import os
 import tkinter as tk
+import uuid
 from tkinter import messagebox
 
 # Allow imports from project root
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from data.db_connection import DatabaseConnection
-import mysql.connector
+from services.sos_ingestion_service import IngestionBusy, get_sos_ingestion_service
 
 
 class SendSOSApp(tk.Tk):
@@ -37,6 +38,8 @@ class SendSOSApp(tk.Tk):
 
         # Database connection
         self.connection = db_connection if db_connection else DatabaseConnection().connect()
+        # Resubmitting the same form (e.g. after a timeout) reuses this key
+        self.submission_key = str(uuid.uuid4())
         if not self.connection:
             messagebox.showerror("Database Error", "Cannot connect to database!")
             self.destroy()
@@ -98,7 +101,7 @@ class SendSOSApp(tk.Tk):
         btn_frame = tk.Frame(self, bg="#f5f5f5")
         btn_frame.pack(pady=20)
 
-        tk.Button(
+        self.submit_btn = tk.Button(
             btn_frame,
             text="Submit SOS",
             font=("Helvetica", 12, "bold"),
@@ -106,7 +109,8 @@ class SendSOSApp(tk.Tk):
             fg="white",
             width=14,
             command=self.submit_sos,
-        ).grid(row=0, column=0, padx=10)
+        )
+        self.submit_btn.grid(row=0, column=0, padx=10)
 
         tk.Button(
             btn_frame,
@@ -129,6 +133,7 @@ class SendSOSApp(tk.Tk):
         ).grid(row=0, column=2, padx=10)
 
     def clear_form(self):
+        self.submission_key = str(uuid.uuid4())
         self.location_entry.delete(0, tk.END)
         self.need_entry.delete(0, tk.END)
         self.description_text.delete("1.0", tk.END)
@@ -150,42 +155,50 @@ class SendSOSApp(tk.Tk):
             return
 
         try:
-            cursor = self.connection.cursor()
-            victim_id = self.logged_in_user.get("id")
-
-            cursor.execute(
-                """
-                INSERT INTO SOSRequest (
-                    victimID,
-                    location,
-                    latitude,
-                    longitude,
-                    typeOfNeed,
-                    description,
-                    urgencyLevel,
-                    status,
-                    priorityScore,
-                    assignedVolunteerID,
-                    assignedNGO
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, 'pending', 0, NULL, NULL)
-                """,
-                (victim_id, location, 0.0, 0.0, type_of_need, description, urgency),
-            )
+            future = get_sos_ingestion_service().submit({
+                "victimID": self.logged_in_user.get("id"),
+                "location": location,
+                "latitude": None,
+                "longitude": None,
+                "typeOfNeed": type_of_need,
+                "description": description,
+                "urgencyLevel": urgency,
+                "submissionKey": self.submission_key,
+            })
+        except (IngestionBusy, ValueError) as e:
+            self.show_submit_error(e)
+            return
 
-            self.connection.commit()
-            cursor.close()
+        # Disabled until the write resolves, so a retry reuses submission_key
+        self.submit_btn.config(state="disabled")
+        self.after(50, self.check_submission, future)
 
-            # UC-17: notify admin/NGOs — handled by DB trigger on SOSRequest insert
-            messagebox.showinfo(
-                "SOS Sent",
-                "Your SOS request has been sent and logged.\n"
-                "Relevant admins and NGOs will be notified.",
-            )
-            self.clear_form()
+    def check_submission(self, future):
+        """Poll the ingestion Future from the Tk loop until the SOS is written."""
+        if not future.done():
+            self.after(50, self.check_submission, future)
+            return
+
+        self.submit_btn.config(state="normal")
+        try:
+            future.result()
+        except Exception as e:
+            self.show_submit_error(e)
+            return
+
+        # UC-17: notify admin/NGOs — handled by DB trigger on SOSRequest insert
+        messagebox.showinfo(
+            "SOS Sent",
+            "Your SOS request has been sent and logged.\n"
+            "Relevant admins and NGOs will be notified.",
+        )
+        self.clear_form()
 
-        except mysql.connector.Error as e:
-            messagebox.showerror("Error", f"Failed to send SOS request.\n{str(e)}")
+    def show_submit_error(self, error):
+        if isinstance(error, IngestionBusy):
+            messagebox.showwarning("System busy", f"{str(error)}\nYour SOS was not sent yet.")
+        else:
+            messagebox.showerror("Error", f"Failed to send SOS request.\n{str(error)}")
 
     def go_back(self):
         """Return to previous screen."""
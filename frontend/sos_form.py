@@ -1,6 +1,8 @@
 import tkinter as tk
+import uuid
 from tkinter import messagebox, ttk
 from data.db_connection import DatabaseConnection
+from services.sos_ingestion_service import IngestionBusy, InvalidCoordinates, get_sos_ingestion_service
 
 class SOSFormApp(tk.Tk):
     def __init__(self, logged_in_user=None, db_connection=None, back_command=None):
@@ -16,6 +18,8 @@ class SOSFormApp(tk.Tk):
         # DB connection
         self.connection = db_connection if db_connection else DatabaseConnection().connect()
         self.cursor = self.connection.cursor(dictionary=True)
+        # Resubmitting the same form (e.g. after a timeout) reuses this key
+        self.submission_key = str(uuid.uuid4())
         
         self.create_widgets()
 
@@ -573,6 +577,7 @@ class SOSFormApp(tk.Tk):
 
     def clear_form(self):
         """Clear the SOS form"""
+        self.submission_key = str(uuid.uuid4())
         self.location_var.set("")
         self.lat_var.set("")
         self.long_var.set("")
@@ -665,54 +670,52 @@ Do you confirm this is a REAL emergency?"""
             self.status_label.config(text="❌ SOS submission cancelled")
             return
         
+        # Checked as numbers and range by the ingestion service (InvalidCoordinates)
+        latitude = lat or None
+        longitude = long or None
+        
+        # Get victim ID
+        victim_id = self.logged_in_user.get('id')
+        
+        # Written by the ingestion service in a batch with other submissions;
+        # the window keeps running while we wait for the write to land
         try:
-            self.status_label.config(text="⏳ Sending emergency SOS...")
-            self.update()
-            
-            # Convert coordinates to float if provided
-            latitude = float(lat) if lat else None
-            longitude = float(long) if long else None
-            
-            # Get victim ID
-            victim_id = self.logged_in_user.get('id')
-            
-            # Insert into SOSRequest table
-            sql = """
-            INSERT INTO SOSRequest 
-            (victimID, location, latitude, longitude, typeOfNeed, description, urgencyLevel, status)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, 'pending')
-            """
-            
-            self.cursor.execute(sql, (
-                victim_id,
-                location,
-                latitude,
-                longitude,
-                emergency_type,
-                f"People affected: {num_people}. Vulnerable: {', '.join(vulnerable_list) if vulnerable_list else 'None'}. Details: {description}",
-                urgency
-            ))
-            
-            request_id = self.cursor.lastrowid
-            
-            # Insert into Notification table to alert responders
-            notify_sql = """
-            INSERT INTO Notification 
-            (message, channel, recipientUserID, recipientRole, status)
-            VALUES 
-            (%s, 'in_app', NULL, 'Admin', 'sent'),
-            (%s, 'in_app', NULL, 'Volunteer', 'sent'),
-            (%s, 'in_app', NULL, 'NGO', 'sent')
-            """
-            
-            emergency_msg = f"🚨 NEW SOS REQUEST #{request_id}: {emergency_type} at {location}. Urgency: {urgency}"
-            
-            self.cursor.execute(notify_sql, (emergency_msg, emergency_msg, emergency_msg))
-            
-            self.connection.commit()
-            
-            # Success message
-            success_msg = f"""
+            future = get_sos_ingestion_service().submit({
+                "victimID": victim_id,
+                "location": location,
+                "latitude": latitude,
+                "longitude": longitude,
+                "typeOfNeed": emergency_type,
+                "description": f"People affected: {num_people}. Vulnerable: {', '.join(vulnerable_list) if vulnerable_list else 'None'}. Details: {description}",
+                "urgencyLevel": urgency,
+                "peopleAffected": num_people,
+                "submissionKey": self.submission_key
+            })
+        except Exception as e:
+            self.show_submit_error(e)
+            return
+        
+        # Disabled until the write resolves, so a retry reuses submission_key
+        self.submit_btn.config(state="disabled")
+        self.status_label.config(text="⏳ Sending emergency SOS...")
+        self.after(50, self.check_submission, future, location, emergency_type, urgency)
+
+    def check_submission(self, future, location, emergency_type, urgency):
+        """Poll the ingestion Future from the Tk loop until the SOS is written."""
+        if not future.done():
+            self.after(50, self.check_submission, future, location, emergency_type, urgency)
+            return
+        
+        self.submit_btn.config(state="normal")
+        try:
+            request_id = future.result()
+        except Exception as e:
+            self.show_submit_error(e)
+            return
+        # Responders are notified by trg_after_insert_sos (one row per role)
+        
+        # Success message
+        success_msg = f"""
 ✅ EMERGENCY SOS SENT SUCCESSFULLY!
 
 📋 Request ID: {request_id}
@@ -725,26 +728,32 @@ Do you confirm this is a REAL emergency?"""
 🚑 Help is on the way!
 
 Your request status: PENDING ASSIGNMENT"""
-            
-            messagebox.showinfo("🚨 SOS REQUEST SENT", success_msg)
-            
-            self.status_label.config(text=f"✅ Emergency SOS #{request_id} sent successfully")
-            
-            # Clear form
-            self.clear_form()
-            
-            # Ask if user wants to go back to dashboard
-            if messagebox.askyesno("Return to Dashboard", "SOS sent successfully!\n\nReturn to Victim Dashboard?"):
-                self.go_back_to_victim_dashboard()
-            
-        except ValueError as ve:
-            messagebox.showerror("Invalid Coordinates", f"Please enter valid latitude and longitude numbers.\n\nError: {str(ve)}")
+        
+        messagebox.showinfo("🚨 SOS REQUEST SENT", success_msg)
+        
+        self.status_label.config(text=f"✅ Emergency SOS #{request_id} sent successfully")
+        
+        # Clear form
+        self.clear_form()
+        
+        # Ask if user wants to go back to dashboard
+        if messagebox.askyesno("Return to Dashboard", "SOS sent successfully!\n\nReturn to Victim Dashboard?"):
+            self.go_back_to_victim_dashboard()
+
+    def show_submit_error(self, error):
+        """Report a rejected or failed SOS; the form (and its submission key) is kept for a retry."""
+        if isinstance(error, InvalidCoordinates):
+            messagebox.showerror("Invalid Coordinates", f"Please enter valid latitude and longitude numbers.\n\nError: {str(error)}")
             self.status_label.config(text="❌ Invalid coordinates format")
-            self.connection.rollback()
-        except Exception as e:
-            messagebox.showerror("Submission Error", f"Failed to send SOS request.\n\nError: {str(e)}")
+        elif isinstance(error, ValueError):
+            messagebox.showerror("Invalid Submission", f"Your SOS could not be sent.\n\nError: {str(error)}")
+            self.status_label.config(text="❌ Invalid SOS details")
+        elif isinstance(error, IngestionBusy):
+            messagebox.showwarning("System Busy", f"{str(error)}\n\nYour SOS was NOT sent yet.")
+            self.status_label.config(text="⚠️ System busy - please press Submit again")
+        else:
+            messagebox.showerror("Submission Error", f"Failed to send SOS request.\n\nError: {str(error)}")
             self.status_label.config(text="❌ Failed to send SOS")
-            self.connection.rollback()
 
     def go_back_to_victim_dashboard(self):
         """Go back to VictimDashboardApp - EXACT COPY FROM GIVEFEEDBACKAPP"""
@@ -2,6 +2,48 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sv_ttk
 from data.db_connection import DatabaseConnection
+from frontend.db_executor import QueryExecutor
+from frontend.virtual_table import KeysetPager, VirtualTreeview
+from services.sos_change_feed import SOSChangeFeed
+
+# Auto-refresh cadence and the largest change batch merged incrementally
+AUTO_REFRESH_MS = 5000
+MAX_CHANGES_PER_REFRESH = 2000
+
+# Most urgent first, newest first within an urgency level
+URGENCY_RANK_SQL = """
+    CASE R.urgencyLevel
+        WHEN 'critical' THEN 1
+        WHEN 'high' THEN 2
+        WHEN 'medium' THEN 3
+        WHEN 'low' THEN 4
+        ELSE 5
+    END"""
+
+REQUEST_COLUMNS = f"""
+    SELECT R.requestID, U.name as victim, R.location, R.typeOfNeed, R.urgencyLevel, R.status,
+           {URGENCY_RANK_SQL} as urgencyRank,
+           R.updatedAt, V.name as assignedVolunteer, N.orgName as assignedNGO
+    FROM SOSRequest R
+    JOIN UserAccount U ON R.victimID = U.userID
+    LEFT JOIN UserAccount V ON R.assignedVolunteerID = V.userID
+    LEFT JOIN NGO N ON R.assignedNGO = N.ngoID
+"""
+
+
+def request_buckets(row):
+    """Statistic tiles a request counts towards"""
+    buckets = []
+    if row["status"] == "pending":
+        buckets.append("pending")
+    elif row["status"] in ("assigned", "in_process"):
+        buckets.append("in_progress")
+    elif row["status"] == "completed":
+        buckets.append("completed")
+    if row["urgencyLevel"] == "critical":
+        buckets.append("critical")
+    return buckets
+
 
 class TrackRequestApp(tk.Tk):
     def __init__(self, logged_in_user=None, db_connection=None, back_command=None):
@@ -22,11 +64,21 @@ class TrackRequestApp(tk.Tk):
         # DB connection
         self.connection = db_connection if db_connection else DatabaseConnection().connect()
         self.cursor = self.connection.cursor(dictionary=True)
+        self.executor = QueryExecutor(self)
+        self.feed = SOSChangeFeed(include=lambda row: True, classify=request_buckets)
+        self.refresh_job = None
         
         # Create scrollable UI
         self.create_scrollable_ui()
         self.load_requests()
 
+    def destroy(self):
+        if self.refresh_job:
+            self.after_cancel(self.refresh_job)
+            self.refresh_job = None
+        self.executor.shutdown()
+        super().destroy()
+
     def create_scrollable_ui(self):
         # ========== MAIN CONTAINER WITH SCROLLBAR ==========
         main_container = tk.Frame(self, bg="#f5f8fa")
@@ -337,8 +389,10 @@ class TrackRequestApp(tk.Tk):
         
         # Treeview
         columns = ("requestID", "victim", "location", "typeOfNeed", "urgencyLevel", "status", "assignedVolunteer", "assignedNGO")
-        self.tree = ttk.Treeview(
+        self.tree = VirtualTreeview(
             tree_frame,
+            self.executor,
+            self.format_request,
             columns=columns,
             show="headings",
             height=15,
@@ -427,109 +481,134 @@ class TrackRequestApp(tk.Tk):
         self.update_panel.pack_forget()
         self.status_label.config(text="✅ Update panel closed")
 
+    def request_filter(self):
+        """WHERE condition and params limiting the view to the current user"""
+        if self.logged_in_user and self.logged_in_user.get("role") == "Victim":
+            return "R.victimID=%s", (self.logged_in_user.get("id"),)
+        return "1=1", ()
+
     def load_requests(self):
-        """Load requests from DB into the treeview and update statistics"""
-        try:
-            self.status_label.config(text="⏳ Loading requests...")
-            self.update()
-            
-            # Hide update panel while refreshing
-            self.hide_update_panel()
-            
-            # Build query based on user role
-            if self.logged_in_user and self.logged_in_user.get("role") == "Victim":
-                query = """
-                SELECT R.requestID, U.name as victim, R.location, R.typeOfNeed, R.urgencyLevel, R.status,
-                       V.name as assignedVolunteer, N.orgName as assignedNGO
-                FROM SOSRequest R
-                JOIN UserAccount U ON R.victimID = U.userID
-                LEFT JOIN UserAccount V ON R.assignedVolunteerID = V.userID
-                LEFT JOIN NGO N ON R.assignedNGO = N.ngoID
-                WHERE R.victimID=%s
-                ORDER BY 
-                    CASE R.urgencyLevel
-                        WHEN 'critical' THEN 1
-                        WHEN 'high' THEN 2
-                        WHEN 'medium' THEN 3
-                        WHEN 'low' THEN 4
-                        ELSE 5
-                    END,
-                    R.requestID DESC
-                """
-                self.cursor.execute(query, (self.logged_in_user.get("id"),))
-            else:
-                query = """
-                SELECT R.requestID, U.name as victim, R.location, R.typeOfNeed, R.urgencyLevel, R.status,
-                       V.name as assignedVolunteer, N.orgName as assignedNGO
-                FROM SOSRequest R
-                JOIN UserAccount U ON R.victimID = U.userID
-                LEFT JOIN UserAccount V ON R.assignedVolunteerID = V.userID
-                LEFT JOIN NGO N ON R.assignedNGO = N.ngoID
-                ORDER BY 
-                    CASE R.urgencyLevel
-                        WHEN 'critical' THEN 1
-                        WHEN 'high' THEN 2
-                        WHEN 'medium' THEN 3
-                        WHEN 'low' THEN 4
-                        ELSE 5
-                    END,
-                    R.requestID DESC
-                """
-                self.cursor.execute(query)
-
-            results = self.cursor.fetchall()
-            self.tree.delete(*self.tree.get_children())
-            
-            # Update statistics
-            total = len(results)
-            pending = sum(1 for r in results if r["status"] == "pending")
-            in_progress = sum(1 for r in results if r["status"] in ["assigned", "in_process"])
-            completed = sum(1 for r in results if r["status"] == "completed")
-            critical = sum(1 for r in results if r["urgencyLevel"] == "critical")
-            
-            stats = [total, pending, in_progress, completed, critical]
-            for i, value in enumerate(stats):
-                if i < len(self.stat_labels):
-                    self.stat_labels[i].config(text=str(value))
-            
-            # Insert data into treeview with colors
-            for row in results:
-                # Format status with icon
-                status_icons = {
-                    "pending": "⏳",
-                    "assigned": "👤",
-                    "in_process": "🔄",
-                    "completed": "✅"
-                }
-                status_icon = status_icons.get(row["status"], "❓")
-                status_display = f"{status_icon} {row['status'].title()}"
-                
-                # Format urgency with icon
-                urgency_icons = {
-                    "critical": "🚨",
-                    "high": "⚠️",
-                    "medium": "📊",
-                    "low": "📉"
-                }
-                urgency_icon = urgency_icons.get(row["urgencyLevel"], "📝")
-                urgency_display = f"{urgency_icon} {row['urgencyLevel'].title()}"
-                
-                self.tree.insert("", tk.END, values=(
-                    row["requestID"],
-                    row["victim"],
-                    row["location"],
-                    row["typeOfNeed"],
-                    urgency_display,
-                    status_display,
-                    row["assignedVolunteer"] or "Not Assigned",
-                    row["assignedNGO"] or "Not Assigned"
-                ))
-            
-            self.status_label.config(text=f"✅ Loaded {len(results)} requests")
-            
-        except Exception as e:
-            messagebox.showerror("Database Error", f"Failed to load requests.\n{str(e)}")
-            self.status_label.config(text="❌ Failed to load requests")
+        """Load requests page by page into the treeview and update statistics"""
+        self.status_label.config(text="⏳ Loading requests...")
+        self.executor.cancel("sos_changes")
+        
+        # Hide update panel while refreshing
+        self.hide_update_panel()
+        
+        # Build query based on user role
+        where, params = self.request_filter()
+        pager = KeysetPager(
+            REQUEST_COLUMNS + f" WHERE {where} {{keyset}}",
+            params,
+            order=[
+                (URGENCY_RANK_SQL, "urgencyRank", "ASC"),
+                ("R.requestID", "requestID", "DESC")
+            ]
+        )
+        self.tree.load(pager, on_error=self.on_load_error)
+
+        # Statistics are seeded from a narrow snapshot and then kept up to date by the change feed
+        def work(connection):
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute("SELECT NOW() AS now")
+                watermark = cursor.fetchone()["now"]
+                cursor.execute(f"SELECT R.requestID, R.status, R.urgencyLevel FROM SOSRequest R WHERE {where}", params)
+                return watermark, cursor.fetchall()
+            finally:
+                cursor.close()
+
+        def on_snapshot(result):
+            watermark, rows = result
+            self.feed.reset(rows, watermark)
+            self.show_request_stats()
+            self.schedule_refresh()
+
+        self.executor.submit("request_stats", work, on_success=on_snapshot, on_error=self.on_load_error)
+
+    def schedule_refresh(self):
+        if self.refresh_job:
+            self.after_cancel(self.refresh_job)
+        self.refresh_job = self.after(AUTO_REFRESH_MS, self.refresh_changes)
+
+    def refresh_changes(self):
+        """Merge only rows whose updatedAt moved past the watermark"""
+        if self.refresh_job:
+            self.after_cancel(self.refresh_job)
+        self.refresh_job = None
+        since = self.feed.since()
+        if since is None:
+            return
+
+        def on_changes(rows):
+            if len(rows) >= MAX_CHANGES_PER_REFRESH:
+                self.load_requests()
+                return
+            upserts, removed_ids = self.feed.apply(rows)
+            self.tree.apply_changes(upserts, removed_ids)
+            self.show_request_stats()
+            self.schedule_refresh()
+
+        def on_error(error):
+            print(f"Auto-refresh failed: {error}")
+            self.schedule_refresh()
+
+        where, params = self.request_filter()
+        self.executor.run_query(
+            "sos_changes",
+            REQUEST_COLUMNS + f" WHERE {where} AND R.updatedAt >= %s ORDER BY R.updatedAt LIMIT %s",
+            params + (since, MAX_CHANGES_PER_REFRESH),
+            dictionary=True,
+            on_success=on_changes,
+            on_error=on_error
+        )
+
+    def on_load_error(self, error):
+        messagebox.showerror("Database Error", f"Failed to load requests.\n{str(error)}")
+        self.status_label.config(text="❌ Failed to load requests")
+
+    def show_request_stats(self):
+        """Update statistics labels from the change feed's counters"""
+        counters = self.feed.counters
+        stats = [len(self.feed), counters["pending"], counters["in_progress"], counters["completed"], counters["critical"]]
+        for i, value in enumerate(stats):
+            if i < len(self.stat_labels):
+                self.stat_labels[i].config(text=str(value))
+        
+        self.status_label.config(text=f"✅ Tracking {stats[0]} requests")
+
+    def format_request(self, row):
+        """Treeview values for one request row"""
+        # Format status with icon
+        status_icons = {
+            "pending": "⏳",
+            "assigned": "👤",
+            "in_process": "🔄",
+            "completed": "✅"
+        }
+        status_icon = status_icons.get(row["status"], "❓")
+        status_display = f"{status_icon} {row['status'].title()}"
+        
+        # Format urgency with icon
+        urgency_icons = {
+            "critical": "🚨",
+            "high": "⚠️",
+            "medium": "📊",
+            "low": "📉"
+        }
+        urgency_icon = urgency_icons.get(row["urgencyLevel"], "📝")
+        urgency_display = f"{urgency_icon} {row['urgencyLevel'].title()}"
+        
+        return (
+            row["requestID"],
+            row["victim"],
+            row["location"],
+            row["typeOfNeed"],
+            urgency_display,
+            status_display,
+            row["assignedVolunteer"] or "Not Assigned",
+            row["assignedNGO"] or "Not Assigned"
+        )
 
     def on_request_select(self, event):
         """Handle request selection"""
@@ -574,8 +653,8 @@ class TrackRequestApp(tk.Tk):
                 f"Request ID {self.selected_request_id} status updated to '{new_status}'."
             )
             
-            # Refresh the data
-            self.load_requests()
+            # Merge the change into the table
+            self.refresh_changes()
             
             # Hide the update panel
             self.hide_update_panel()
@@ -7,7 +7,8 @@ from tkinter import ttk, messagebox
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from data.db_connection import DatabaseConnection
-import mysql.connector
+from frontend.db_executor import QueryExecutor
+from frontend.virtual_table import KeysetPager, VirtualTreeview
 
 
 class TrackResourcesApp(tk.Tk):
@@ -47,9 +48,15 @@ class TrackResourcesApp(tk.Tk):
             self.destroy()
             return
 
+        self.executor = QueryExecutor(self)
         self.create_widgets()
         self.load_all_resources()
 
+    def destroy(self):
+        if hasattr(self, "executor"):
+            self.executor.shutdown()
+        super().destroy()
+
     def create_widgets(self):
         # Title
         tk.Label(
@@ -107,7 +114,10 @@ class TrackResourcesApp(tk.Tk):
         table_frame.pack(padx=20, pady=10, fill="both", expand=True)
 
         columns = ("resourceID", "resourceType", "quantity", "status", "location", "latitude", "longitude")
-        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=15)
+        self.tree = VirtualTreeview(
+            table_frame, self.executor, self.format_resource,
+            columns=columns, show="headings", height=15
+        )
 
         self.tree.heading("resourceID", text="Resource ID")
         self.tree.heading("resourceType", text="Resource Type")
@@ -155,73 +165,58 @@ class TrackResourcesApp(tk.Tk):
             command=self.go_back,
         ).grid(row=0, column=1, padx=5)
 
-    def clear_tree(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
     def load_all_resources(self):
         """Load all resources visible to the current user."""
-        self.clear_tree()
-
-        try:
-            cursor = self.connection.cursor(dictionary=True)
-
-            if self.role == "NGO":
-                # NGO sees only its own stock
-                ngo_id = self.logged_in_user.get("id")
-                query = """
-                    SELECT r.resourceID,
-                           rt.name AS resourceType,
-                           r.quantity,
-                           r.status,
-                           r.location,
-                           r.latitude,
-                           r.longitude
-                    FROM ResourceStock r
-                    JOIN ResourceType rt ON r.resourceTypeID = rt.resourceTypeID
-                    WHERE r.donorNGO = %s
-                    ORDER BY r.resourceID
-                """
-                cursor.execute(query, (ngo_id,))
-            else:
-                # Admin sees all
-                query = """
-                    SELECT r.resourceID,
-                           rt.name AS resourceType,
-                           r.quantity,
-                           r.status,
-                           r.location,
-                           r.latitude,
-                           r.longitude
-                    FROM ResourceStock r
-                    JOIN ResourceType rt ON r.resourceTypeID = rt.resourceTypeID
-                    ORDER BY r.resourceID
-                """
-                cursor.execute(query)
-
-            rows = cursor.fetchall()
-            cursor.close()
-
-            for row in rows:
-                self.tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        row["resourceID"],
-                        row["resourceType"],
-                        row["quantity"],
-                        row["status"],
-                        row["location"] or "N/A",
-                        row["latitude"],
-                        row["longitude"],
-                    ),
-                )
+        if self.role == "NGO":
+            # NGO sees only its own stock
+            self.show_resources(["r.donorNGO = %s"], [self.logged_in_user.get("id")],
+                                on_empty=lambda: messagebox.showinfo("Information", "No resources found."))
+        else:
+            # Admin sees all
+            self.show_resources([], [],
+                                on_empty=lambda: messagebox.showinfo("Information", "No resources found."))
+
+    def show_resources(self, conditions, params, on_empty):
+        """Page matching resources into the table, ordered by resource ID."""
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        pager = KeysetPager(
+            f"""
+                SELECT r.resourceID,
+                       rt.name AS resourceType,
+                       r.quantity,
+                       r.status,
+                       r.location,
+                       r.latitude,
+                       r.longitude
+                FROM ResourceStock r
+                JOIN ResourceType rt ON r.resourceTypeID = rt.resourceTypeID
+                WHERE {where_clause} {{keyset}}
+            """,
+            params,
+            order=[("r.resourceID", "resourceID", "ASC")]
+        )
 
+        def on_loaded(rows):
             if not rows:
-                messagebox.showinfo("Information", "No resources found.")
+                on_empty()
 
-        except mysql.connector.Error as e:
-            messagebox.showerror("Database Error", f"Failed to load resources: {str(e)}")
+        self.tree.load(
+            pager,
+            on_loaded=on_loaded,
+            on_error=lambda e: messagebox.showerror("Database Error", f"Failed to load resources: {str(e)}")
+        )
+
+    def format_resource(self, row):
+        """Table values for one resource row."""
+        return (
+            row["resourceID"],
+            row["resourceType"],
+            row["quantity"],
+            row["status"],
+            row["location"] or "N/A",
+            row["latitude"],
+            row["longitude"],
+        )
 
     def search_resources(self):
         """Search resources by ID or category/type."""
@@ -253,51 +248,10 @@ class TrackResourcesApp(tk.Tk):
             conditions.append("r.donorNGO = %s")
             params.append(self.logged_in_user.get("id"))
 
-        where_clause = " AND ".join(conditions)
-
-        query = f"""
-            SELECT r.resourceID,
-                   rt.name AS resourceType,
-                   r.quantity,
-                   r.status,
-                   r.location,
-                   r.latitude,
-                   r.longitude
-            FROM ResourceStock r
-            JOIN ResourceType rt ON r.resourceTypeID = rt.resourceTypeID
-            WHERE {where_clause}
-            ORDER BY r.resourceID
-        """
-
-        self.clear_tree()
-
-        try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query, tuple(params))
-            rows = cursor.fetchall()
-            cursor.close()
-
-            if not rows:
-                messagebox.showwarning("Resource not found", "No matching resources were found.")
-                return
-
-            for row in rows:
-                self.tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        row["resourceID"],
-                        row["resourceType"],
-                        row["quantity"],
-                        row["status"],
-                        row["location"] or "N/A",
-                        row["latitude"],
-                        row["longitude"],
-                    ),
-                )
-
-        except mysql.connector.Error as e:
-            messagebox.showerror("Database Error", f"Failed to search resources: {str(e)}")
+        self.show_resources(
+            conditions, params,
+            on_empty=lambda: messagebox.showwarning("Resource not found", "No matching resources were found.")
+        )
 
     def clear_filters(self):
         self.resource_id_entry.delete(0, tk.END)
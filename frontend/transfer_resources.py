@@ -8,6 +8,8 @@ from tkinter import ttk, messagebox, simpledialog
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from data.db_connection import DatabaseConnection
+from services.resource_service import ResourceService
+from data import reference_cache
 import mysql.connector
 
 class TransferResourcesApp(tk.Tk):
@@ -170,16 +172,7 @@ class TransferResourcesApp(tk.Tk):
     def view_ngos(self):
         """Show list of available NGOs"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT ngoID, orgName, region, verified
-                FROM NGO
-                WHERE verified = TRUE
-                ORDER BY orgName
-            """)
-            
-            ngos = cursor.fetchall()
-            cursor.close()
+            ngos = [ngo for ngo in reference_cache.ngos(self.connection).values() if ngo["verified"]]
             
             if not ngos:
                 messagebox.showinfo("Information", "No verified NGOs found.")
@@ -262,20 +255,16 @@ class TransferResourcesApp(tk.Tk):
         
         # Verify target NGO exists
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute("SELECT ngoID, orgName, verified FROM NGO WHERE ngoID = %s", (target_ngo,))
-            target_ngo_data = cursor.fetchone()
+            target_ngo_data = reference_cache.ngo(self.connection, int(target_ngo)) if target_ngo.isdigit() else None
             
             if not target_ngo_data:
                 messagebox.showerror("Invalid NGO", "Target NGO ID not found.")
-                cursor.close()
                 return
             
             if not target_ngo_data["verified"]:
                 messagebox.showwarning("Unverified NGO", 
                                      f"NGO '{target_ngo_data['orgName']}' is not verified. "
                                      "Only verified NGOs can receive resources.")
-                cursor.close()
                 return
             
             # Get source NGO
@@ -288,27 +277,13 @@ class TransferResourcesApp(tk.Tk):
                                         f"from {source_location} to {target_location} "
                                         f"(NGO: {target_ngo_data['orgName']})?")
             if not confirm:
-                cursor.close()
                 return
             
-            # Create transfer record
-            cursor.execute("""
-                INSERT INTO ResourceTransfer (resourceID, fromNGO, toNGO, fromLocation, toLocation, 
-                                            quantity, status, transferredBy)
-                VALUES (%s, %s, %s, %s, %s, %s, 'pending', %s)
-            """, (resource_id, from_ngo, target_ngo, source_location, target_location, 
-                  transfer_qty, self.logged_in_user.get("id")))
-            
-            # Update resource quantity
-            new_qty = available_qty - transfer_qty
-            cursor.execute("""
-                UPDATE ResourceStock 
-                SET quantity = %s, status = CASE WHEN %s <= 5 THEN 'low' ELSE status END
-                WHERE resourceID = %s
-            """, (new_qty, new_qty, resource_id))
-            
-            self.connection.commit()
-            cursor.close()
+            # Stock is deducted only if still available, together with the transfer record
+            ResourceService(self.connection).transfer_resource(
+                resource_id, from_ngo, target_ngo, source_location, target_location,
+                transfer_qty, self.logged_in_user.get("id")
+            )
             
             messagebox.showinfo("Success", 
                               f"Resource transfer recorded successfully!\n"
@@ -319,6 +294,9 @@ class TransferResourcesApp(tk.Tk):
             self.target_location_entry.delete(0, tk.END)
             self.quantity_entry.delete(0, tk.END)
         
+        except ValueError as e:
+            messagebox.showerror("Insufficient Resources", f"{str(e)}\nRefresh to see current stock.")
+            self.load_resources()
         except mysql.connector.Error as e:
             messagebox.showerror("Database Error", f"Failed to transfer resource: {str(e)}")
 
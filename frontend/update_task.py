@@ -7,6 +7,9 @@ from tkinter import ttk, messagebox
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from data.db_connection import DatabaseConnection
+from data.task_repository import TaskRepository
+from frontend.db_executor import QueryExecutor
+from services.route_planner_service import RoutePlannerService
 import mysql.connector
 
 
@@ -41,9 +44,16 @@ class UpdateTaskApp(tk.Tk):
             self.destroy()
             return
 
+        self.executor = QueryExecutor(self)
         self.create_widgets()
         self.load_tasks()
 
+    def destroy(self):
+        executor = getattr(self, "executor", None)
+        if executor:
+            executor.shutdown()
+        super().destroy()
+
     def create_widgets(self):
         tk.Label(
             self,
@@ -140,6 +150,17 @@ class UpdateTaskApp(tk.Tk):
             command=self.load_tasks,
         ).grid(row=0, column=1, padx=10)
 
+        self.plan_route_btn = tk.Button(
+            btn_frame,
+            text="Plan Route",
+            font=("Helvetica", 12),
+            bg="#2196F3",
+            fg="white",
+            width=12,
+            command=self.plan_route,
+        )
+        self.plan_route_btn.grid(row=0, column=2, padx=10)
+
         tk.Button(
             btn_frame,
             text="Back",
@@ -148,7 +169,7 @@ class UpdateTaskApp(tk.Tk):
             fg="white",
             width=12,
             command=self.go_back,
-        ).grid(row=0, column=2, padx=10)
+        ).grid(row=0, column=3, padx=10)
 
     def clear_table(self):
         for item in self.tree.get_children():
@@ -269,6 +290,59 @@ class UpdateTaskApp(tk.Tk):
         except mysql.connector.Error as e:
             messagebox.showerror("Database Error", f"Failed to update task: {str(e)}")
 
+    def plan_route(self):
+        """Plan an ordered pickup/drop-off route for this volunteer's open delivery tasks in the background."""
+        volunteer_id = self.logged_in_user.get("id")
+        self.plan_route_btn.config(state="disabled", text="Planning...")
+        self.executor.submit(
+            "plan_route",
+            lambda connection: RoutePlannerService(TaskRepository(connection)).plan_for_volunteer(volunteer_id),
+            on_success=self.show_route,
+            on_error=self.on_plan_route_error
+        )
+
+    def on_plan_route_error(self, error):
+        self.plan_route_btn.config(state="normal", text="Plan Route")
+        title = "Database Error" if isinstance(error, mysql.connector.Error) else "Error"
+        messagebox.showerror(title, f"Failed to plan route: {str(error)}")
+
+    def show_route(self, route):
+        self.plan_route_btn.config(state="normal", text="Plan Route")
+        if not route["stops"]:
+            messagebox.showinfo("Plan Route", "No delivery tasks with a known location to route.")
+            return
+
+        window = tk.Toplevel(self)
+        window.title("Delivery Route - DRMS")
+        window.geometry("900x450")
+        window.configure(bg="#f5f5f5")
+
+        summary = f"{len(route['stops'])} stops, {route['total_km']} km, about {route['eta_minutes']} min"
+        if route["skippedTaskIDs"]:
+            summary += f" (no location for task(s) {', '.join(map(str, route['skippedTaskIDs']))})"
+        tk.Label(window, text=summary, font=("Helvetica", 11, "bold"), bg="#f5f5f5").pack(pady=10)
+
+        columns = ("order", "kind", "place", "items", "tasks", "leg", "eta")
+        tree = ttk.Treeview(window, columns=columns, show="headings", height=15)
+        for col, heading, width in zip(
+            columns,
+            ["#", "Stop", "Place", "Items", "Tasks", "Leg (km)", "ETA (min)"],
+            [40, 80, 220, 260, 80, 80, 80],
+        ):
+            tree.heading(col, text=heading)
+            tree.column(col, width=width)
+        for i, stop in enumerate(route["stops"], start=1):
+            tree.insert("", "end", values=(
+                i,
+                "Pick up" if stop["kind"] == "pickup" else "Drop off",
+                stop["label"],
+                ", ".join(stop["items"]),
+                ", ".join(map(str, stop["taskIDs"])),
+                stop["leg_km"],
+                stop["eta_minutes"],
+            ))
+        tree.pack(padx=15, pady=5, fill="both", expand=True)
+
     def go_back(self):
         """Return to previous screen."""
         self.destroy()
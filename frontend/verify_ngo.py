@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sv_ttk
 from data.db_connection import DatabaseConnection
+from services.dashboard_metrics_service import DashboardMetricsService
+from data import reference_cache
 
 class VerifyNGOApp(tk.Tk):
     def __init__(self, db_connection=None, logged_in_user=None, back_command=None):
@@ -556,6 +558,7 @@ class VerifyNGOApp(tk.Tk):
             """, (status, ngo_id))
 
             self.connection.commit()
+            reference_cache.invalidate("ngos")
 
             if status:
                 messagebox.showinfo("Success", "NGO Verified Successfully!")
@@ -597,6 +600,7 @@ class VerifyNGOApp(tk.Tk):
                     UPDATE NGO SET verified = TRUE WHERE verified = FALSE
                 """)
                 self.connection.commit()
+                reference_cache.invalidate("ngos")
                 self.load_ngos()
                 messagebox.showinfo("Success", "All pending NGOs have been verified!")
                 self.status_label.config(text="✅ All pending NGOs verified")
@@ -605,12 +609,8 @@ class VerifyNGOApp(tk.Tk):
 
     def show_statistics(self):
         """Show detailed statistics"""
-        self.cursor.execute("SELECT COUNT(*) as total, SUM(verified) as verified FROM NGO")
-        stats = self.cursor.fetchone()
-        
-        total = stats['total'] or 0
-        verified = stats['verified'] or 0
-        pending = total - verified
+        verified, pending = DashboardMetricsService(self.connection).snapshot().verified("NGO")
+        total = verified + pending
         
         messagebox.showinfo(
             "NGO Statistics",
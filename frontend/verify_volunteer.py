@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import messagebox, ttk, scrolledtext
 import sv_ttk
 from data.db_connection import DatabaseConnection
+from services.dashboard_metrics_service import DashboardMetricsService
 
 class VerifyVolunteerApp(tk.Tk):
     def __init__(self, logged_in_user=None, db_connection=None, back_command=None):
@@ -552,12 +553,8 @@ class VerifyVolunteerApp(tk.Tk):
     def show_statistics(self):
         """Show detailed statistics"""
         try:
-            self.cursor.execute("SELECT COUNT(*) as total, SUM(verified) as verified FROM Volunteer")
-            stats = self.cursor.fetchone()
-            
-            total = stats[0] or 0
-            verified = stats[1] or 0
-            pending = total - verified
+            verified, pending = DashboardMetricsService(self.connection).snapshot().verified("Volunteer")
+            total = verified + pending
             
             messagebox.showinfo(
                 "Volunteer Statistics",
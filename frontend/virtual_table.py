@@ -0,0 +1,270 @@
+from tkinter import ttk
+
+
+class KeysetPager:
+    """
+    Builds keyset-paginated SELECTs for a fixed sort order.
+
+    base_query must contain a "{keyset}" placeholder right after its WHERE
+    conditions (use "WHERE 1=1 {keyset}" when there are none) and no ORDER BY
+    or LIMIT. order is a list of (sql_expression, result_field, direction);
+    the last entry must be unique (normally the primary key) so pages never
+    overlap.
+    """
+
+    def __init__(self, base_query, params=(), order=()):
+        self.base_query = base_query
+        self.params = tuple(params)
+        self.order = list(order)
+
+    def key_of(self, row):
+        return tuple(row[field] for _, field, _ in self.order)
+
+    def id_of(self, row):
+        """Value of the unique (last) sort field, used as the row's identity."""
+        return row[self.order[-1][1]]
+
+    def compare(self, key_a, key_b):
+        """-1, 0 or 1 as key_a sorts before, equal to or after key_b."""
+        for (_, _, direction), a, b in zip(self.order, key_a, key_b):
+            if a == b:
+                continue
+            before = a < b if direction.upper() == "ASC" else a > b
+            return -1 if before else 1
+        return 0
+
+    def _seek_clause(self, key, forward):
+        # (a, b) "after" (a0, b0) expands to: a > a0 OR (a = a0 AND b > b0),
+        # with the comparison flipped for DESC columns and for backward paging.
+        branches, params = [], []
+        for i, (expr, _, direction) in enumerate(self.order):
+            ascending = (direction.upper() == "ASC") == forward
+            terms = [f"{e} = %s" for e, _, _ in self.order[:i]]
+            terms.append(f"{expr} {'>' if ascending else '<'} %s")
+            branches.append("(" + " AND ".join(terms) + ")")
+            params.extend(key[:i + 1])
+        return "AND (" + " OR ".join(branches) + ")", params
+
+    def page_query(self, limit, after=None, before=None):
+        """
+        Return (sql, params) for the page following `after` or preceding
+        `before`. Pages fetched with `before` come back in reverse order.
+        """
+        params = list(self.params)
+        keyset = ""
+        forward = before is None
+        key = after if forward else before
+        if key is not None:
+            keyset, seek_params = self._seek_clause(key, forward)
+            params.extend(seek_params)
+
+        order_by = []
+        for expr, _, direction in self.order:
+            ascending = (direction.upper() == "ASC") == forward
+            order_by.append(f"{expr} {'ASC' if ascending else 'DESC'}")
+
+        sql = self.base_query.format(keyset=keyset) + " ORDER BY " + ", ".join(order_by) + " LIMIT %s"
+        params.append(limit)
+        return sql, tuple(params)
+
+
+class VirtualTreeview(ttk.Treeview):
+    """
+    Treeview that pages rows in from the database as the user scrolls.
+
+    Only a sliding window of at most max_pages pages is materialised; pages
+    falling off one end are dropped and fetched again with a keyset query if
+    the user scrolls back. Queries run on the screen's QueryExecutor. Item
+    ids are the rows' unique ids, so apply_changes() can merge updates into
+    the window without refetching it.
+    """
+
+    def __init__(self, master, executor, format_row, page_size=200, max_pages=3, **kwargs):
+        self._yscroll_target = kwargs.pop("yscrollcommand", None)
+        super().__init__(master, yscrollcommand=self._on_yscroll, **kwargs)
+        self.executor = executor
+        self.format_row = format_row
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.pager = None
+        self.on_loaded = None
+        self.on_error = None
+        self._pages = []              # [[iids]] in display order
+        self._rows = {}               # iid -> raw row of materialised items
+        self._more_after = False
+        self._more_before = False
+        self._loading = False
+        self._job_key = f"virtual-table-{id(self)}"
+
+    def configure(self, cnf=None, **kw):
+        if "yscrollcommand" in kw:
+            self._yscroll_target = kw.pop("yscrollcommand")
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def load(self, pager, on_loaded=None, on_error=None):
+        """Reset to the first page of a new query; on_loaded gets the first page's rows."""
+        self.pager = pager
+        self.on_loaded = on_loaded
+        self.on_error = on_error
+        self._loading = True
+
+        def failed(error):
+            self._loading = False
+            if on_error:
+                on_error(error)
+
+        sql, params = pager.page_query(self.page_size)
+        self.executor.run_query(self._job_key, sql, params, dictionary=True,
+                                on_success=self._show_first_page, on_error=failed)
+
+    def reload(self):
+        if self.pager is not None:
+            self.load(self.pager, self.on_loaded, self.on_error)
+
+    def row(self, iid):
+        """Raw database row behind a materialised item."""
+        return self._rows.get(iid)
+
+    def apply_changes(self, upserts=(), removed_ids=()):
+        """
+        Merge changed rows into the materialised window: removed ids are
+        dropped, upserts are re-rendered at their sorted position when that
+        position lies inside the window (otherwise paging will pick them up).
+        """
+        if self.pager is None:
+            return
+        anchor = self._anchor()
+        for row_id in removed_ids:
+            self._remove(str(row_id))
+        for row in upserts:
+            iid = str(self.pager.id_of(row))
+            self._remove(iid)
+            self._place(iid, row)
+        self._restore(anchor)
+
+    def _remove(self, iid):
+        if iid not in self._rows:
+            return
+        del self._rows[iid]
+        self.delete(iid)
+        for page in self._pages:
+            if iid in page:
+                page.remove(iid)
+                break
+        self._pages = [page for page in self._pages if page]
+
+    def _place(self, iid, row):
+        key = self.pager.key_of(row)
+        children = self.get_children()
+        if children:
+            first = self.pager.key_of(self._rows[children[0]])
+            last = self.pager.key_of(self._rows[children[-1]])
+            if self._more_before and self.pager.compare(key, first) < 0:
+                return
+            if self._more_after and self.pager.compare(key, last) > 0:
+                return
+        elif self._more_after or self._more_before:
+            return
+
+        index = 0
+        while index < len(children) and self.pager.compare(self.pager.key_of(self._rows[children[index]]), key) <= 0:
+            index += 1
+        self.insert("", index, iid=iid, values=self.format_row(row))
+        self._rows[iid] = row
+
+        # Attach to the page of the row it now follows (or the first page)
+        neighbour = children[index - 1] if index else None
+        for page in self._pages:
+            if neighbour is None or neighbour in page:
+                page.insert(page.index(neighbour) + 1 if neighbour else 0, iid)
+                break
+        else:
+            self._pages.append([iid])
+
+    def _clear(self):
+        self.delete(*self.get_children())
+        self._pages = []
+        self._rows = {}
+
+    def _show_first_page(self, rows):
+        self._clear()
+        self._loading = False
+        self._more_before = False
+        self._more_after = len(rows) == self.page_size
+        if rows:
+            self._pages.append(self._materialise(rows, at_end=True))
+        if self.on_loaded:
+            self.on_loaded(rows)
+
+    def _materialise(self, rows, at_end):
+        iids = []
+        for offset, row in enumerate(rows):
+            iid = str(self.pager.id_of(row))
+            self._remove(iid)  # a merged change may already have placed it
+            self.insert("", "end" if at_end else offset, iid=iid, values=self.format_row(row))
+            self._rows[iid] = row
+            iids.append(iid)
+        return iids
+
+    def _drop_page(self, index):
+        iids = self._pages.pop(index)
+        self.delete(*iids)
+        for iid in iids:
+            self._rows.pop(iid, None)
+
+    def _anchor(self):
+        """First visible item, used to keep the viewport still while pages shift."""
+        return self.identify_row(5) or None
+
+    def _restore(self, anchor):
+        children = self.get_children()
+        if anchor and children and self.exists(anchor):
+            self.yview_moveto(self.index(anchor) / len(children))
+
+    def _on_yscroll(self, first, last):
+        if self._yscroll_target:
+            self._yscroll_target(first, last)
+        if self._loading or self.pager is None or not self._pages:
+            return
+        first, last = float(first), float(last)
+        if last > 0.9 and self._more_after:
+            self._fetch(forward=True)
+        elif first < 0.1 and self._more_before:
+            self._fetch(forward=False)
+
+    def _fetch(self, forward):
+        children = self.get_children()
+        if not children:
+            return
+        self._loading = True
+        if forward:
+            sql, params = self.pager.page_query(self.page_size, after=self.pager.key_of(self._rows[children[-1]]))
+        else:
+            sql, params = self.pager.page_query(self.page_size, before=self.pager.key_of(self._rows[children[0]]))
+        self.executor.run_query(
+            self._job_key, sql, params, dictionary=True,
+            on_success=lambda rows: self._show_page(rows, forward),
+            on_error=lambda e: setattr(self, "_loading", False)
+        )
+
+    def _show_page(self, rows, forward):
+        self._loading = False
+        anchor = self._anchor()
+        if forward:
+            self._more_after = len(rows) == self.page_size
+            if rows:
+                self._pages.append(self._materialise(rows, at_end=True))
+                if len(self._pages) > self.max_pages:
+                    self._drop_page(0)
+                    self._more_before = True
+        else:
+            rows = list(reversed(rows))
+            self._more_before = len(rows) == self.page_size
+            if rows:
+                self._pages.insert(0, self._materialise(rows, at_end=False))
+                if len(self._pages) > self.max_pages:
+                    self._drop_page(-1)
+                    self._more_after = True
+        self._restore(anchor)
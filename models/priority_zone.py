@@ -9,3 +9,4 @@ class PriorityZone:
     center_long: float
     radius_km: float
     priority_level: str  # 'low', 'medium', 'high'
+    source: str = "manual"  # 'manual' or 'auto' (hotspot job)
@@ -0,0 +1,63 @@
+# prioritize_view_check.py
+# Checks that the Prioritize Requests counters agree with its table: for every
+# zone filter (all areas, any zone, each PriorityZone) with and without
+# duplicate collapsing, the change feed seeded from the pending snapshot must
+# count exactly the rows the table query lists, per urgency level. Read-only.
+#
+#   python prioritize_view_check.py
+
+from collections import Counter
+
+from data.connection_pool import get_pool
+from data.priority_zone_repository import PriorityZoneRepository
+from data.sos_repository import SOSRepository
+from frontend.prioritize_requests import SNAPSHOT_QUERY, pending_request_query, request_listed
+from services.sos_change_feed import SOSChangeFeed
+from services.zone_index import get_zone_index
+
+
+def check(cursor, snapshot, watermark, zones, collapse, zone_id):
+    """(ok, feed counters, table counters) for one filter setting."""
+    feed = SOSChangeFeed(include=lambda row: request_listed(row, collapse, zone_id, zones),
+                         classify=lambda row: [row["urgencyLevel"]])
+    feed.reset(snapshot, watermark)
+
+    query, params = pending_request_query(collapse, zone_id, zones)
+    cursor.execute(query.format(keyset=""), params)
+    table = Counter(row["urgencyLevel"] for row in cursor.fetchall())
+
+    listed = +feed.counters
+    return listed == table and len(feed) == sum(table.values()), listed, table
+
+
+def main():
+    zones = get_zone_index()
+    with get_pool().connection() as connection:
+        zones.sync(SOSRepository(connection), PriorityZoneRepository(connection))
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("SELECT NOW() AS now")
+        watermark = cursor.fetchone()["now"]
+        cursor.execute(SNAPSHOT_QUERY)
+        snapshot = cursor.fetchall()
+
+        filters = [("all areas", None), ("any zone", 0)]
+        filters += [(f"zone #{zid} {z['name'] or ''}".rstrip(), zid) for zid, z in sorted(zones.zones.items())]
+        failures = 0
+        for label, zone_id in filters:
+            for collapse in (True, False):
+                ok, listed, table = check(cursor, snapshot, watermark, zones, collapse, zone_id)
+                failures += not ok
+                mode = "heads only" if collapse else "all reports"
+                print(f"{'✅' if ok else '❌'} {label:<30} {mode:<12} "
+                      f"counters {sum(listed.values()):>6}, table {sum(table.values()):>6}")
+                if not ok:
+                    print(f"   counters {dict(listed)} vs table {dict(table)}")
+        cursor.close()
+
+    print(f"📋 {len(snapshot)} pending requests, {len(zones.zones)} zones, {failures} mismatch(es)")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# scoring_benchmark.py
+# Times one priority rescoring run against SOSRequest tables of growing size
+# where only a fixed share of the rows is still open. "full table" scores
+# every row the way compute_priorities() used to; "open only" is
+# PriorityScoringService.rescore_open(). Runs entirely in memory on synthetic
+# rows; no database needed.
+#
+#   python scoring_benchmark.py
+#   python scoring_benchmark.py --rows 10000 100000 1000000 --open-share 0.05
+
+import argparse
+import bisect
+import time
+
+import numpy as np
+
+from services.priority_scoring_service import PriorityScoringService
+
+URGENCY_LEVELS = np.array(["low", "medium", "high", "critical"])
+URGENCY_WEIGHTS = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+ZONES = [
+    {"zoneID": 1, "centerLat": 24.86, "centerLong": 67.01, "radius_km": 5, "priority_level": "high"},
+    {"zoneID": 2, "centerLat": 24.95, "centerLong": 67.10, "radius_km": 8, "priority_level": "medium"},
+    {"zoneID": 3, "centerLat": 24.80, "centerLong": 66.95, "radius_km": 12, "priority_level": "low"},
+]
+
+
+class SyntheticSOSRepository:
+    """The SOSRepository calls rescore_open() makes, served from in-memory rows."""
+
+    def __init__(self, rows, open_only=True):
+        self.rows = rows
+        self.ids = [row["requestID"] for row in rows if row["open"] or not open_only]
+        self.by_id = {row["requestID"]: row for row in rows}
+        self.written = 0
+
+    def get_urgency_weights(self):
+        return URGENCY_WEIGHTS
+
+    def get_priority_zones(self):
+        return ZONES
+
+    def get_open_batch(self, after_id, limit):
+        start = bisect.bisect_right(self.ids, after_id)
+        return [dict(self.by_id[request_id]) for request_id in self.ids[start:start + limit]]
+
+    def update_priority_scores(self, scores):
+        for request_id, score in scores.items():
+            self.by_id[request_id]["priorityScore"] = score
+        self.written += len(scores)
+        return len(scores)
+
+
+def sos_table(n, open_share, rng):
+    """n SOSRequest rows, open_share of them still open, scattered around Karachi."""
+    lat = rng.normal(24.88, 0.08, n)
+    lon = rng.normal(67.03, 0.08, n)
+    urgency = URGENCY_LEVELS[rng.choice(4, n, p=[0.3, 0.3, 0.25, 0.15])]
+    people = rng.integers(1, 80, n)
+    age = rng.integers(0, 60 * 24 * 30, n)
+    is_open = rng.random(n) < open_share
+    return [{
+        "requestID": i + 1, "urgencyLevel": str(urgency[i]), "latitude": float(lat[i]),
+        "longitude": float(lon[i]), "peopleAffected": int(people[i]), "priorityScore": 0,
+        "ageMinutes": int(age[i]), "open": bool(is_open[i]),
+    } for i in range(n)]
+
+
+def run(rows, open_only, batch_size):
+    repo = SyntheticSOSRepository(rows, open_only=open_only)
+    started = time.perf_counter()
+    result = PriorityScoringService(repo).rescore_open(batch_size)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Priority rescoring benchmark")
+    parser.add_argument("--rows", type=int, nargs="*", default=[10000, 100000, 500000])
+    parser.add_argument("--open-share", type=float, default=0.1, help="share of requests still open")
+    parser.add_argument("--batch", type=int, default=500, help="rows per chunk")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for n in args.rows:
+        rows = sos_table(n, args.open_share, np.random.default_rng(args.seed))
+        full, full_seconds = run(rows, False, args.batch)
+        for row in rows:
+            row["priorityScore"] = 0
+        incremental, open_seconds = run(rows, True, args.batch)
+        print(f"📋 {n:>9,} requests, {incremental['scanned']:,} open")
+        print(f"⏱️ full table {full_seconds:7.3f}s ({full['scanned']:,} scored, {full['batches']} chunks) | "
+              f"open only {open_seconds:7.3f}s ({incremental['scanned']:,} scored, {incremental['batches']} chunks) | "
+              f"{full_seconds / open_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
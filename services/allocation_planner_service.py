@@ -0,0 +1,91 @@
+import math
+
+from data.resource_repository import ResourceRepository
+from services.geo import GridIndex, distance_km, has_location
+
+
+class AllocationPlannerService:
+    """
+    Plans a relief round: every pending, not yet served SOS request gets the
+    resource types its type of need calls for (NeedResourceType), scaled by
+    people affected, from the nearest stock that can cover the whole amount.
+
+    Planning runs in memory against a snapshot of stock; commit() then writes
+    the entire plan in one transaction and fails as a whole if stock moved.
+    """
+
+    def __init__(self, db_connection):
+        self.resource_repo = ResourceRepository(db_connection)
+
+    @staticmethod
+    def needs_for(request, mappings):
+        """[(resourceTypeID, resourceType, quantity)] a request calls for."""
+        need = (request["typeOfNeed"] or "").lower()
+        people = max(1, request["peopleAffected"] or 1)
+        found = {}
+        for m in mappings:
+            if m["needKeyword"].lower() in need and m["resourceTypeID"] not in found:
+                quantity = max(1, math.ceil(float(m["quantityPerPerson"]) * people))
+                found[m["resourceTypeID"]] = (m["resourceTypeID"], m["resourceType"], quantity)
+        return list(found.values())
+
+    def plan(self, donor_ngo_id=None):
+        """
+        Return {'lines': [...], 'unmet': [...]}. Each line is a dict with
+        request, resource, quantity and distance_km; unmet lists
+        (request, resourceType, quantity) nobody could cover.
+        """
+        mappings = self.resource_repo.get_need_resource_types()
+        requests = self.resource_repo.get_unserved_requests()
+        stock = self.resource_repo.get_allocatable_stock(donor_ngo_id)
+
+        remaining = {s["resourceID"]: s["quantity"] for s in stock}
+        by_type, located, unlocated = {}, {}, {}
+        for s in stock:
+            by_type.setdefault(s["resourceTypeID"], []).append(s["resourceID"])
+            if has_location(s["latitude"], s["longitude"]):
+                index = located.setdefault(s["resourceTypeID"], GridIndex())
+                index.put(s["resourceID"], s["latitude"], s["longitude"], s)
+            else:
+                unlocated.setdefault(s["resourceTypeID"], []).append(s)
+
+        lines, unmet = [], []
+        for request in requests:
+            for type_id, type_name, quantity in self.needs_for(request, mappings):
+                if not any(remaining[r] >= quantity for r in by_type.get(type_id, ())):
+                    unmet.append((request, type_name, quantity))
+                    continue
+                enough = lambda s: remaining[s["resourceID"]] >= quantity
+                source, distance = None, None
+                index = located.get(type_id)
+                if has_location(request["latitude"], request["longitude"]) and index is not None:
+                    nearest = index.nearest(request["latitude"], request["longitude"], k=1, accept=enough)
+                    if nearest:
+                        distance, _, source = nearest[0]
+                if source is None:
+                    # No location to go by: the fullest stock that can cover it
+                    pool = [s for s in unlocated.get(type_id, []) if enough(s)]
+                    if index is not None and not has_location(request["latitude"], request["longitude"]):
+                        pool += [s for _, s in index.items() if enough(s)]
+                    if pool:
+                        source = max(pool, key=lambda s: remaining[s["resourceID"]])
+                        if has_location(request["latitude"], request["longitude"]) and has_location(source["latitude"], source["longitude"]):
+                            distance = distance_km(float(request["latitude"]), float(request["longitude"]),
+                                                   float(source["latitude"]), float(source["longitude"]))
+                if source is None:
+                    unmet.append((request, type_name, quantity))
+                    continue
+
+                remaining[source["resourceID"]] -= quantity
+                if remaining[source["resourceID"]] <= 0 and index is not None:
+                    index.remove(source["resourceID"])
+                lines.append({"request": request, "resource": source, "quantity": quantity, "distance_km": distance})
+        return {"lines": lines, "unmet": unmet}
+
+    def commit(self, plan):
+        """Write a plan in one transaction; returns the number of allocation rows."""
+        return self.resource_repo.commit_allocation_plan([
+            (line["resource"]["resourceID"], line["request"]["victimID"],
+             line["request"]["requestID"], line["quantity"])
+            for line in plan["lines"]
+        ])
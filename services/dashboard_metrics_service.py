@@ -0,0 +1,61 @@
+from datetime import date
+
+from data.dashboard_repository import DashboardRepository
+
+
+class DashboardMetrics:
+    """Read-only view over one snapshot of DashboardCounter rows."""
+
+    def __init__(self, counters, day=None):
+        self.counters = counters
+        self.day = day or date.today()
+
+    def get(self, entity, bucket):
+        return self.counters.get((entity, bucket), 0)
+
+    def by_status(self, entity):
+        prefix = "status:"
+        return {bucket[len(prefix):]: value for (e, bucket), value in self.counters.items()
+                if e == entity and bucket.startswith(prefix)}
+
+    def total(self, entity):
+        return sum(self.by_status(entity).values())
+
+    def verified(self, entity):
+        """(verified, pending) counts for Volunteer or NGO."""
+        return self.get(entity, "verified:1"), self.get(entity, "verified:0")
+
+    def completed_on(self):
+        """Tasks completed on the snapshot's day."""
+        return self.get("Task", f"completed_on:{self.day.isoformat()}")
+
+    def stock_quantity(self, status="available"):
+        return self.get("ResourceStock", f"quantity:{status}")
+
+
+class DashboardMetricsService:
+    """
+    Dashboard tiles from the trigger-maintained DashboardCounter table.
+
+    The table holds one row per (entity, bucket), e.g. ('Task', 'status:
+    unassigned'), kept current by the trg_counter_* triggers, so every tile
+    on every screen comes from a single small read instead of COUNT(*) scans.
+    """
+
+    def __init__(self, db_connection):
+        self.repo = DashboardRepository(db_connection)
+
+    def snapshot(self, day=None):
+        day = day or date.today()
+        return DashboardMetrics(self.repo.get_counters(day), day)
+
+    def volunteer_tasks(self, volunteer_id):
+        """Task counts by status for one volunteer, plus the unassigned pool."""
+        counts = {}
+        for bucket, value in self.repo.get_volunteer_task_counters(volunteer_id).items():
+            status = bucket.split(":", 1)[1]
+            counts[status] = counts.get(status, 0) + value
+        return counts
+
+    def rebuild(self):
+        self.repo.rebuild()
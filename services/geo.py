@@ -0,0 +1,208 @@
+import heapq
+import math
+import threading
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LAT = 111.32
+
+
+def distance_km(lat1, lon1, lat2, lon2):
+    """Great-circle (haversine) distance between two points in kilometres."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def has_location(lat, lon):
+    """False for missing or placeholder (0, 0) coordinates."""
+    return lat is not None and lon is not None and not (float(lat) == 0 and float(lon) == 0)
+
+
+def geohash_cell(lat, lon, precision=7):
+    """
+    (row, col) of the geohash cell containing a point. Cells match the
+    standard base-32 geohash grid (precision 7 is ~150 m across), kept as
+    integers so neighbouring cells are just row/col +-1.
+    """
+    lat_bits, lon_bits = 5 * precision // 2, (5 * precision + 1) // 2
+    row = min(int((float(lat) + 90.0) / 180.0 * (1 << lat_bits)), (1 << lat_bits) - 1)
+    col = int((float(lon) + 180.0) / 360.0 * (1 << lon_bits)) % (1 << lon_bits)
+    return row, col
+
+
+def geohash_neighbourhood(cell, precision=7):
+    """The cell and the eight cells around it (longitude wraps around)."""
+    row, col = cell
+    cols = 1 << ((5 * precision + 1) // 2)
+    return [(row + d_row, (col + d_col) % cols) for d_row in (-1, 0, 1) for d_col in (-1, 0, 1)]
+
+
+class GridIndex:
+    """
+    In-memory spatial index over points bucketed into fixed-size lat/lon cells.
+
+    Cells are cell_km tall; their width in degrees of longitude is the same,
+    so cells get narrower in km towards the poles and searches simply visit a
+    few more of them. Points are kept by id, so put() doubles as an update and
+    remove() is O(1). All methods are thread-safe.
+    """
+
+    def __init__(self, cell_km=2.0):
+        self.cell_deg = cell_km / KM_PER_DEGREE_LAT
+        self._cells = {}              # (row, col) -> {id: (lat, lon, item)}
+        self._where = {}              # id -> (row, col)
+        self._bounds = None           # [min_row, max_row, min_col, max_col] of cells ever used
+        self._lock = threading.RLock()
+
+    def _cell(self, lat, lon):
+        return int(math.floor(lat / self.cell_deg)), int(math.floor(lon / self.cell_deg))
+
+    def put(self, item_id, lat, lon, item=None):
+        lat, lon = float(lat), float(lon)
+        cell = self._cell(lat, lon)
+        with self._lock:
+            self.remove(item_id)
+            self._cells.setdefault(cell, {})[item_id] = (lat, lon, item)
+            self._where[item_id] = cell
+            row, col = cell
+            if self._bounds is None:
+                self._bounds = [row, row, col, col]
+            else:
+                b = self._bounds
+                b[0], b[1], b[2], b[3] = min(b[0], row), max(b[1], row), min(b[2], col), max(b[3], col)
+
+    def remove(self, item_id):
+        with self._lock:
+            cell = self._where.pop(item_id, None)
+            if cell is None:
+                return False
+            bucket = self._cells[cell]
+            del bucket[item_id]
+            if not bucket:
+                del self._cells[cell]
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._cells = {}
+            self._where = {}
+            self._bounds = None
+
+    def get(self, item_id):
+        """(lat, lon, item) for an indexed id, or None."""
+        with self._lock:
+            cell = self._where.get(item_id)
+            return self._cells[cell][item_id] if cell else None
+
+    def items(self, limit=None):
+        """Up to limit (id, item) pairs in no particular order."""
+        found = []
+        with self._lock:
+            for bucket in self._cells.values():
+                for item_id, (_, _, item) in bucket.items():
+                    if limit is not None and len(found) >= limit:
+                        return found
+                    found.append((item_id, item))
+        return found
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, item_id):
+        return item_id in self._where
+
+    def _ring(self, center, radius):
+        """Cells at Chebyshev distance exactly `radius` from center."""
+        row0, col0 = center
+        if radius == 0:
+            yield center
+            return
+        for col in range(col0 - radius, col0 + radius + 1):
+            yield row0 - radius, col
+            yield row0 + radius, col
+        for row in range(row0 - radius + 1, row0 + radius):
+            yield row, col0 - radius
+            yield row, col0 + radius
+
+    def _ring_reach_km(self, lat, radius):
+        """Distance any point outside rings 0..radius is guaranteed to be beyond."""
+        # Longitude cells shrink with cos(lat); use the narrower dimension.
+        shrink = max(math.cos(math.radians(min(abs(lat) + radius * self.cell_deg, 89.9))), 0.01)
+        return radius * self.cell_deg * KM_PER_DEGREE_LAT * shrink
+
+    def nearest(self, lat, lon, k=5, max_km=None, accept=None):
+        """
+        Up to k (distance_km, id, item) tuples closest to (lat, lon), nearest
+        first. accept(item) filters candidates; max_km bounds the search.
+        """
+        lat, lon = float(lat), float(lon)
+        center = self._cell(lat, lon)
+        best = []                      # max-heap of (-distance, id, item)
+
+        def consider(bucket):
+            for item_id, (p_lat, p_lon, item) in bucket.items():
+                if accept and not accept(item):
+                    continue
+                d = distance_km(lat, lon, p_lat, p_lon)
+                if max_km is not None and d > max_km:
+                    continue
+                if len(best) < k:
+                    heapq.heappush(best, (-d, item_id, item))
+                elif d < -best[0][0]:
+                    heapq.heapreplace(best, (-d, item_id, item))
+
+        with self._lock:
+            if not self._where:
+                return []
+            max_radius = self._max_radius(center)
+            total, seen = len(self._where), 0
+            radius = 0
+            while radius <= max_radius and seen < total:
+                for cell in self._ring(center, radius):
+                    bucket = self._cells.get(cell)
+                    if bucket:
+                        seen += len(bucket)
+                        consider(bucket)
+                reach = self._ring_reach_km(lat, radius)
+                if len(best) == k and -best[0][0] <= reach:
+                    break
+                if max_km is not None and reach > max_km:
+                    break
+                if (2 * radius + 1) ** 2 > len(self._cells):
+                    # Mostly empty space left (sparse outliers): scan the
+                    # occupied cells outside the square instead of more rings.
+                    row0, col0 = center
+                    for (row, col), bucket in self._cells.items():
+                        if max(abs(row - row0), abs(col - col0)) > radius:
+                            consider(bucket)
+                    break
+                radius += 1
+        return sorted(((-d, item_id, item) for d, item_id, item in best), key=lambda t: t[0])
+
+    def within(self, lat, lon, radius_km, accept=None):
+        """All (distance_km, id, item) within radius_km of (lat, lon), nearest first."""
+        lat, lon = float(lat), float(lon)
+        lat_span = radius_km / KM_PER_DEGREE_LAT
+        lon_span = radius_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(min(abs(lat) + lat_span, 89.9))), 0.01))
+        row_lo, col_lo = self._cell(lat - lat_span, lon - lon_span)
+        row_hi, col_hi = self._cell(lat + lat_span, lon + lon_span)
+
+        found = []
+        with self._lock:
+            for row in range(row_lo, row_hi + 1):
+                for col in range(col_lo, col_hi + 1):
+                    for item_id, (p_lat, p_lon, item) in self._cells.get((row, col), {}).items():
+                        if accept and not accept(item):
+                            continue
+                        d = distance_km(lat, lon, p_lat, p_lon)
+                        if d <= radius_km:
+                            found.append((d, item_id, item))
+        found.sort(key=lambda t: t[0])
+        return found
+
+    def _max_radius(self, center):
+        """Ring radius that covers every occupied cell (bounds only ever grow)."""
+        row0, col0 = center
+        min_row, max_row, min_col, max_col = self._bounds
+        return max(abs(min_row - row0), abs(max_row - row0), abs(min_col - col0), abs(max_col - col0))
@@ -0,0 +1,35 @@
+import numpy as np
+
+from services.geo import EARTH_RADIUS_KM, KM_PER_DEGREE_LAT
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km between broadcastable arrays of points."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def distance_matrix_km(lat, lon, dtype=np.float64, chunk_rows=512):
+    """
+    Symmetric n x n haversine distance matrix for n points, filled a block of
+    rows at a time so large inputs do not need several n x n temporaries.
+    """
+    lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+    matrix = np.empty((lat.size, lat.size), dtype=dtype)
+    for start in range(0, lat.size, chunk_rows):
+        stop = start + chunk_rows
+        matrix[start:stop] = haversine_km(lat[start:stop, None], lon[start:stop, None], lat[None, :], lon[None, :])
+    return matrix
+
+
+def project_km(lat, lon, ref_lat=None):
+    """
+    Equirectangular projection to (x, y) km around ref_lat (default: the
+    mean latitude). Accurate enough for clustering within one disaster
+    region, not across continents.
+    """
+    lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+    ref_lat = float(lat.mean()) if ref_lat is None else ref_lat
+    return lon * KM_PER_DEGREE_LAT * np.cos(np.radians(ref_lat)), lat * KM_PER_DEGREE_LAT
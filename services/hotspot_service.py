@@ -0,0 +1,211 @@
+import time
+
+import numpy as np
+
+from config.settings import HOTSPOT_CONFIG
+from services.geo_arrays import haversine_km, project_km
+
+# 3x3 block of cell offsets around (and including) a cell
+NEIGHBOUR_OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+
+def grid_density_clusters(lat, lon, eps_km, min_points):
+    """
+    DBSCAN-style clustering on a grid of eps_km cells; returns one label per
+    point (-1 for noise).
+
+    A cell is core when its 3x3 neighbourhood holds at least min_points
+    points, which stands in for DBSCAN's eps-neighbourhood count. Adjacent
+    core cells form one cluster; points in non-core cells next to a core
+    cell join its cluster as border points. Everything is done with array
+    operations over occupied cells, so the cost grows with n log n rather
+    than with the number of point pairs.
+    """
+    lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+    if lat.size == 0:
+        return np.empty(0, dtype=np.int64)
+
+    x, y = project_km(lat, lon)
+    cx = np.floor((x - x.min()) / eps_km).astype(np.int64) + 1
+    cy = np.floor((y - y.min()) / eps_km).astype(np.int64) + 1
+    height = int(cy.max()) + 2
+    cells, point_cell, counts = np.unique(cx * height + cy, return_inverse=True, return_counts=True)
+    point_cell = point_cell.reshape(-1)
+
+    # Index of each neighbouring cell (or -1) for every occupied cell
+    neighbours = np.empty((len(NEIGHBOUR_OFFSETS), cells.size), dtype=np.int64)
+    for i, (dx, dy) in enumerate(NEIGHBOUR_OFFSETS):
+        target = cells + dx * height + dy
+        pos = np.minimum(np.searchsorted(cells, target), cells.size - 1)
+        neighbours[i] = np.where(cells[pos] == target, pos, -1)
+
+    density = np.where(neighbours >= 0, counts[neighbours], 0).sum(axis=0)
+    core = density >= min_points
+
+    # Connected components of core cells: propagate the smallest label
+    labels = np.where(core, np.arange(cells.size), -1)
+    core_ids = np.flatnonzero(core)
+    while core_ids.size:
+        before = labels[core_ids].copy()
+        for i in range(len(NEIGHBOUR_OFFSETS)):
+            n = neighbours[i, core_ids]
+            linked = n >= 0
+            linked[linked] = core[n[linked]]
+            candidate = np.where(linked, labels[np.where(linked, n, 0)], labels[core_ids])
+            labels[core_ids] = np.minimum(labels[core_ids], candidate)
+        labels[core_ids] = labels[labels[core_ids]]   # pointer jumping
+        if np.array_equal(before, labels[core_ids]):
+            break
+
+    # Border cells take the label of their densest core neighbour
+    border = np.flatnonzero(~core)
+    if border.size:
+        n = neighbours[:, border]
+        is_core = (n >= 0) & core[np.where(n >= 0, n, 0)]
+        score = np.where(is_core, density[np.where(n >= 0, n, 0)], -1)
+        best = np.argmax(score, axis=0)
+        picked = n[best, np.arange(border.size)]
+        has_core = score.max(axis=0) >= 0
+        labels[border[has_core]] = labels[picked[has_core]]
+
+    point_labels = labels[point_cell]
+    clustered = point_labels >= 0
+    compact = np.full(point_labels.shape, -1, dtype=np.int64)
+    compact[clustered] = np.unique(point_labels[clustered], return_inverse=True)[1].reshape(-1)
+    return compact
+
+
+class HotspotService:
+    """
+    Turns open SOS coordinates into PriorityZone proposals.
+
+    find_hotspots() clusters open requests and summarises each cluster as a
+    circle (centroid, radius covering its members) with a priority level
+    derived from the mix of urgency levels in it. plan() matches hotspots to
+    existing auto-generated zones; hand-made zones are never modified, and
+    hotspots centred inside one are left to it. refresh_zones() does both
+    and writes the result.
+    """
+
+    def __init__(self, sos_repo, zone_repo, config=None):
+        self.sos_repo = sos_repo
+        self.zone_repo = zone_repo
+        self.config = dict(HOTSPOT_CONFIG, **(config or {}))
+
+    def summarise(self, lat, lon, urgency, weights):
+        """Hotspot dicts (largest first) for the clusters found in the given points."""
+        cfg = self.config
+        lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+        labels = grid_density_clusters(lat, lon, cfg["eps_km"], cfg["min_points"])
+        if labels.size == 0 or labels.max() < 0:
+            return []
+
+        member = labels >= 0
+        labels, lat, lon = labels[member], lat[member], lon[member]
+        urgency = np.asarray(urgency, dtype=object)[member]
+        k = int(labels.max()) + 1
+        size = np.bincount(labels, minlength=k)
+        center_lat = np.bincount(labels, weights=lat, minlength=k) / size
+        center_lon = np.bincount(labels, weights=lon, minlength=k) / size
+
+        spread = haversine_km(lat, lon, center_lat[labels], center_lon[labels])
+        radius = np.zeros(k)
+        np.maximum.at(radius, labels, spread)
+        radius = np.clip(radius + cfg["eps_km"] / 2, cfg["min_radius_km"], cfg["max_radius_km"])
+
+        top_weight = max(weights.values()) if weights else 1
+        point_weight = np.array([weights.get(level, 0) for level in urgency], dtype=float) / (top_weight or 1)
+        mix = np.bincount(labels, weights=point_weight, minlength=k) / size
+        critical = np.bincount(labels, weights=(urgency == "critical").astype(float), minlength=k)
+        high = np.bincount(labels, weights=(urgency == "high").astype(float), minlength=k)
+
+        hotspots = []
+        for c in np.argsort(-size):
+            if size[c] < cfg["min_cluster_size"]:
+                continue
+            hotspots.append({
+                "centerLat": round(float(center_lat[c]), 7),
+                "centerLong": round(float(center_lon[c]), 7),
+                "radius_km": round(float(radius[c]), 2),
+                "priority_level": self.priority_for(mix[c]),
+                "requests": int(size[c]),
+                "critical": int(critical[c]),
+                "high": int(high[c]),
+                "mix": round(float(mix[c]), 3),
+            })
+        return hotspots
+
+    def priority_for(self, mix):
+        for level in ("high", "medium"):
+            if mix >= self.config["level_thresholds"][level]:
+                return level
+        return "low"
+
+    def find_hotspots(self):
+        rows = self.sos_repo.get_open_points()
+        weights = self.sos_repo.get_urgency_weights()
+        return self.summarise([r["latitude"] for r in rows], [r["longitude"] for r in rows],
+                              [r["urgencyLevel"] for r in rows], weights)
+
+    def plan(self, hotspots, zones):
+        """{'insert': [...], 'update': [...], 'retire': [zoneID, ...], 'covered': n}"""
+        usable = [z for z in zones if z["centerLat"] is not None and z["centerLong"] is not None and z["radius_km"]]
+        manual = [z for z in usable if z["source"] != "auto"]
+        auto = [z for z in usable if z["source"] == "auto"]
+        plan = {"insert": [], "update": [], "retire": [], "covered": 0}
+        matched = set()
+
+        def distances(zone_list, hotspot):
+            if not zone_list:
+                return np.empty(0)
+            return haversine_km(hotspot["centerLat"], hotspot["centerLong"],
+                                [float(z["centerLat"]) for z in zone_list],
+                                [float(z["centerLong"]) for z in zone_list])
+
+        for hotspot in hotspots:
+            d = distances(manual, hotspot)
+            if d.size and (d <= np.array([float(z["radius_km"]) for z in manual])).any():
+                plan["covered"] += 1
+                continue
+            zone = self._describe(hotspot)
+            d = distances(auto, hotspot)
+            best = None
+            for i in np.argsort(d):
+                reach = max(float(auto[i]["radius_km"]), hotspot["radius_km"])
+                if d[i] > reach:
+                    break
+                if auto[i]["zoneID"] not in matched:
+                    best = auto[i]
+                    break
+            if best is None:
+                plan["insert"].append(zone)
+            else:
+                matched.add(best["zoneID"])
+                plan["update"].append(dict(zone, zoneID=best["zoneID"]))
+
+        plan["retire"] = [z["zoneID"] for z in auto if z["zoneID"] not in matched]
+        return plan
+
+    def _describe(self, hotspot):
+        return {
+            "name": f"Hotspot near {hotspot['centerLat']:.3f}, {hotspot['centerLong']:.3f}",
+            "description": (f"Auto-generated from {hotspot['requests']} open SOS requests "
+                            f"({hotspot['critical']} critical, {hotspot['high']} high)"),
+            "centerLat": hotspot["centerLat"],
+            "centerLong": hotspot["centerLong"],
+            "radius_km": hotspot["radius_km"],
+            "priority_level": hotspot["priority_level"],
+        }
+
+    def refresh_zones(self, apply=True):
+        """Cluster, plan and (unless apply is False) write; returns the plan with timings."""
+        started = time.perf_counter()
+        hotspots = self.find_hotspots()
+        clustered = time.perf_counter()
+        plan = self.plan(hotspots, self.zone_repo.get_all())
+        if apply:
+            self.zone_repo.apply_plan(plan)
+        plan["hotspots"] = len(hotspots)
+        plan["cluster_seconds"] = round(clustered - started, 3)
+        plan["seconds"] = round(time.perf_counter() - started, 3)
+        return plan
@@ -0,0 +1,202 @@
+import os
+import threading
+import time
+from datetime import datetime
+
+from config.settings import NOTIFICATION_CONFIG
+from data.db_connection import job_connection
+from data.notification_repository import NotificationRepository
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+class InAppChannel:
+    """In-app notifications are delivered as soon as they are in the table."""
+    name = "in_app"
+    success_status = "delivered"
+
+    def send(self, notifications):
+        return [n["notificationID"] for n in notifications], []
+
+
+class LocalFileChannel:
+    """
+    Stand-in for an email/SMS gateway: appends each message to a log file.
+    Returns (sent_ids, failed_ids); rows without the contact field fail.
+    """
+    success_status = "sent"
+
+    def __init__(self, name, contact_field, log_dir=None):
+        self.name = name
+        self.contact_field = contact_field
+        self.log_path = os.path.join(PROJECT_ROOT, log_dir or NOTIFICATION_CONFIG["log_dir"], f"{name}_outbox.log")
+
+    def send(self, notifications):
+        sent, failed, lines = [], [], []
+        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for n in notifications:
+            contact = n.get(self.contact_field)
+            if not contact:
+                failed.append(n["notificationID"])
+                continue
+            lines.append(f"[{stamp}] #{n['notificationID']} to {n['name']} <{contact}>: {n['message']}\n")
+            sent.append(n["notificationID"])
+        if lines:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as log:
+                log.writelines(lines)
+        return sent, failed
+
+
+def default_channels():
+    return {
+        "in_app": InAppChannel(),
+        "email": LocalFileChannel("email", "email"),
+        "sms": LocalFileChannel("sms", "phone"),
+    }
+
+
+class NotificationService:
+    """Entry point for screens: queue a notification and let the dispatcher fan it out."""
+
+    def __init__(self, db_connection):
+        self.repo = NotificationRepository(db_connection)
+
+    def enqueue(self, message, channels=("in_app",), recipient_role=None, recipient_user_id=None,
+                subject=None, created_by=None):
+        outbox_id = self.repo.enqueue(message, channels, recipient_role, recipient_user_id, subject, created_by)
+        get_notification_dispatcher().wake()
+        return outbox_id
+
+    def count_recipients(self, recipient_role=None):
+        return self.repo.count_recipients(recipient_role)
+
+
+class NotificationDispatcher:
+    """
+    Background worker that drains the outbox: expands entries into
+    Notification rows, hands pending rows to the channel adapters in batches
+    and writes their statuses back with one UPDATE per outcome.
+    """
+
+    def __init__(self, channels=None, interval_seconds=None, batch_size=None):
+        self.channels = channels or default_channels()
+        self.interval = interval_seconds or NOTIFICATION_CONFIG["interval_seconds"]
+        self.batch_size = batch_size or NOTIFICATION_CONFIG["batch_size"]
+        self.last_result = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="drms-notifications", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def wake(self):
+        """Dispatch now instead of waiting for the next interval (starts the worker if needed)."""
+        self.start()
+        self._wake.set()
+
+    def run_once(self, repo):
+        """One full pass; returns counts and throughput."""
+        started = time.perf_counter()
+        result = {"outbox": 0, "expanded": 0, "delivered": 0, "failed": 0}
+
+        while True:
+            entries = repo.claim_outbox(NOTIFICATION_CONFIG["outbox_batch"])
+            result["outbox"] += len(entries)
+            result["expanded"] += sum(e["recipientCount"] for e in entries)
+            if len(entries) < NOTIFICATION_CONFIG["outbox_batch"]:
+                break
+
+        for channel in self.channels.values():
+            last_id = 0
+            while True:
+                batch = repo.get_pending(channel.name, last_id, self.batch_size)
+                if not batch:
+                    break
+                sent, failed = channel.send(batch)
+                repo.mark(sent, channel.success_status)
+                repo.mark(failed, "failed")
+                result["delivered"] += len(sent)
+                result["failed"] += len(failed)
+                last_id = batch[-1]["notificationID"]
+                if len(batch) < self.batch_size:
+                    break
+
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        handled = result["delivered"] + result["failed"]
+        result["per_second"] = round(handled / result["seconds"], 1) if result["seconds"] else handled
+        self.last_result = result
+        return result
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                with job_connection() as connection:
+                    result = self.run_once(NotificationRepository(connection))
+                if result["delivered"] or result["failed"]:
+                    print(f"📨 Notifications: {result['outbox']} queued, {result['delivered']} delivered, "
+                          f"{result['failed']} failed ({result['per_second']}/s)")
+            except Exception as e:
+                print(f"❌ Notification dispatch failed: {e}")
+            self._wake.wait(self.interval)
+
+
+_shared_dispatcher = None
+_shared_dispatcher_lock = threading.Lock()
+
+
+def get_notification_dispatcher():
+    """Return the process-wide notification dispatcher."""
+    global _shared_dispatcher
+    with _shared_dispatcher_lock:
+        if _shared_dispatcher is None:
+            _shared_dispatcher = NotificationDispatcher()
+        return _shared_dispatcher
+
+
+class InboxService:
+    """
+    One user's in-app inbox: their role's broadcasts plus notifications
+    addressed to them. Keeps a (createdAt, notificationID) cursor so poll()
+    only returns what arrived since the last call.
+    """
+
+    def __init__(self, db_connection, user_id, role):
+        self.repo = NotificationRepository(db_connection)
+        self.user_id = user_id
+        self.role = role
+        self.cursor = None
+
+    def latest(self, limit=10):
+        rows = self.repo.get_inbox(self.user_id, self.role, limit)
+        if rows:
+            self._advance(rows[0])
+        return rows
+
+    def poll(self, limit=50):
+        """New notifications since the last latest()/poll(), oldest first."""
+        if self.cursor is None:
+            return self.latest(limit)[::-1]
+        rows = self.repo.poll(self.user_id, self.role, self.cursor, limit)
+        if rows:
+            self._advance(rows[-1])
+        return rows
+
+    def unread(self):
+        return self.repo.unread_count(self.user_id, self.role)
+
+    def mark_all_read(self):
+        self.repo.mark_all_read(self.user_id, self.role)
+
+    def _advance(self, row):
+        self.cursor = (row["createdAt"], row["notificationID"])
@@ -0,0 +1,144 @@
+import threading
+import time
+
+from config.settings import PRIORITY_SCORING_CONFIG
+from data.db_connection import DatabaseConnection
+from data.sos_repository import SOSRepository
+from services.geo import has_location
+from services.sos_priority_queue import get_sos_priority_queue
+from services.zone_index import ZoneArrays
+
+
+class PriorityScoringService:
+    """
+    Rescores open SOS requests in chunks.
+
+    Replaces the full-table compute_priorities() procedure: delivered and
+    cancelled requests are never touched, each chunk is its own short
+    transaction, and only rows whose score actually changed are written.
+    Score = urgency weight * urgency_points + waiting time + people
+    affected + the bonus of the highest-priority zone the request falls in.
+    New scores are also pushed into `queue` (an SOSPriorityQueue) if given.
+    """
+
+    def __init__(self, repo, config=None, queue=None):
+        self.repo = repo
+        self.config = dict(PRIORITY_SCORING_CONFIG, **(config or {}))
+        self.queue = queue
+
+    def score(self, row, weights, zone_level=None):
+        """zone_level is the priority_level of the best zone containing the request, if any."""
+        cfg = self.config
+        score = weights.get(row["urgencyLevel"], 0) * cfg["urgency_points"]
+        score += max(0, row["ageMinutes"] or 0) // cfg["age_step_minutes"]
+        people = min(max(1, row.get("peopleAffected") or 1), cfg["people_cap"])
+        score += (people - 1) * cfg["people_weight"]
+        score += cfg["zone_bonus"].get(zone_level, 0)
+        return int(score)
+
+    def zone_levels(self, rows, zones):
+        """Best containing zone level per row, tested for the whole chunk at once."""
+        levels = [None] * len(rows)
+        located = [i for i, row in enumerate(rows) if has_location(row.get("latitude"), row.get("longitude"))]
+        if located and len(zones):
+            found = zones.best_levels([float(rows[i]["latitude"]) for i in located],
+                                      [float(rows[i]["longitude"]) for i in located])
+            for i, level in zip(located, found):
+                levels[i] = level
+        return levels
+
+    def rescore_open(self, batch_size=None):
+        """Rescore every open request; returns {'scanned', 'updated', 'batches', 'seconds'}."""
+        batch_size = batch_size or self.config["batch_size"]
+        started = time.perf_counter()
+        weights = self.repo.get_urgency_weights()
+        zones = ZoneArrays(self.repo.get_priority_zones())
+
+        result = {"scanned": 0, "updated": 0, "batches": 0}
+        last_id = 0
+        while True:
+            rows = self.repo.get_open_batch(last_id, batch_size)
+            if not rows:
+                break
+            changed = {}
+            for row, zone_level in zip(rows, self.zone_levels(rows, zones)):
+                new_score = self.score(row, weights, zone_level)
+                if new_score != row["priorityScore"]:
+                    changed[row["requestID"]] = new_score
+            self.repo.update_priority_scores(changed)
+            if self.queue is not None:
+                self.queue.rescore(changed)
+            result["scanned"] += len(rows)
+            result["updated"] += len(changed)
+            result["batches"] += 1
+            last_id = rows[-1]["requestID"]
+            if len(rows) < batch_size:
+                break
+
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        return result
+
+
+class PriorityScoringScheduler:
+    """
+    Runs PriorityScoringService.rescore_open() every interval_seconds on a
+    daemon thread. repo_factory() is called once per run and must return a
+    repository bound to a connection that thread may use; the connection is
+    closed (handed back, when pooled) after the run. New scores are pushed
+    into `queue` if given.
+    """
+
+    def __init__(self, repo_factory, interval_seconds=None, on_run=None, queue=None):
+        self.repo_factory = repo_factory
+        self.interval = interval_seconds or PRIORITY_SCORING_CONFIG["interval_seconds"]
+        self.on_run = on_run
+        self.queue = queue
+        self.last_result = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="drms-priority-scoring", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def run_once(self):
+        repo = self.repo_factory()
+        if repo.db is None:
+            raise RuntimeError("No database connection for priority rescoring")
+        try:
+            self.last_result = PriorityScoringService(repo, queue=self.queue).rescore_open()
+        finally:
+            repo.db.close()
+        if self.on_run:
+            self.on_run(self.last_result)
+        return self.last_result
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"❌ Priority rescoring failed: {e}")
+            self._stop.wait(self.interval)
+
+
+_shared_scheduler = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_priority_scoring_scheduler():
+    """Return the process-wide rescoring scheduler, feeding the shared SOS priority queue."""
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = PriorityScoringScheduler(
+                lambda: SOSRepository(DatabaseConnection().connect()),
+                queue=get_sos_priority_queue(),
+            )
+        return _shared_scheduler
@@ -0,0 +1,108 @@
+import threading
+from datetime import timedelta
+
+from config.settings import PROXIMITY_CONFIG
+from services.geo import GridIndex, has_location
+
+OPEN_REQUEST_STATUSES = ("pending", "in_process", "assigned")
+USABLE_RESOURCE_STATUSES = ("available", "low")
+
+
+class ProximityService:
+    """
+    In-memory spatial indexes of available volunteers, open SOS requests,
+    usable resource stock and shelters.
+
+    refresh() reads only rows whose updatedAt moved past the last watermark
+    (with a small overlap, merges are idempotent) and rebuilds everything
+    every few refreshes to catch hard deletes. Queries never touch the
+    database, so they can run on the UI thread.
+    """
+
+    def __init__(self, cell_km=None):
+        cell_km = cell_km or PROXIMITY_CONFIG["cell_km"]
+        self.volunteers = GridIndex(cell_km)
+        self.requests = GridIndex(cell_km)
+        self.resources = GridIndex(cell_km)
+        self.shelters = GridIndex(cell_km)
+        self.overlap = timedelta(seconds=PROXIMITY_CONFIG["overlap_seconds"])
+        self.full_refresh_every = PROXIMITY_CONFIG["full_refresh_every"]
+        self.watermark = None
+        self._refreshes = 0
+        self._refresh_lock = threading.Lock()
+
+    def refresh(self, repo, full=False):
+        """Bring the indexes up to date through a ProximityRepository."""
+        with self._refresh_lock:
+            full = full or self.watermark is None or self._refreshes % self.full_refresh_every == 0
+            since = None if full else self.watermark - self.overlap
+            now = repo.get_db_time()
+
+            volunteers = repo.get_volunteers(since)
+            requests = repo.get_open_requests(since)
+            resources = repo.get_resources(since)
+            shelters = repo.get_shelters()
+
+            if full:
+                for index in (self.volunteers, self.requests, self.resources):
+                    index.clear()
+            self._merge(self.volunteers, volunteers, "volunteerID",
+                        lambda row: row["status"] == "available")
+            self._merge(self.requests, requests, "requestID",
+                        lambda row: row["status"] in OPEN_REQUEST_STATUSES)
+            self._merge(self.resources, resources, "resourceID",
+                        lambda row: row["status"] in USABLE_RESOURCE_STATUSES and row["quantity"] > 0)
+            self.shelters.clear()
+            self._merge(self.shelters, shelters, "shelterID", lambda row: True)
+
+            self.watermark = now
+            self._refreshes += 1
+            return {"full": full, "volunteers": len(self.volunteers), "requests": len(self.requests),
+                    "resources": len(self.resources), "shelters": len(self.shelters)}
+
+    @staticmethod
+    def _merge(index, rows, id_field, keep):
+        for row in rows:
+            if keep(row) and has_location(row["latitude"], row["longitude"]):
+                index.put(row[id_field], row["latitude"], row["longitude"], row)
+            else:
+                index.remove(row[id_field])
+
+    def nearest_volunteers(self, lat, lon, k=5, max_km=None):
+        """[(distance_km, volunteer_row)] of the k closest available volunteers."""
+        return [(d, row) for d, _, row in self.volunteers.nearest(lat, lon, k, max_km)]
+
+    def nearest_volunteers_to_request(self, request_id, k=5, max_km=None):
+        """Closest available volunteers to an indexed SOS request ([] if it has no location)."""
+        entry = self.requests.get(request_id)
+        if entry is None:
+            return []
+        lat, lon, _ = entry
+        return self.nearest_volunteers(lat, lon, k, max_km)
+
+    def requests_within(self, lat, lon, radius_km):
+        """[(distance_km, request_row)] of open requests within radius_km, nearest first."""
+        return [(d, row) for d, _, row in self.requests.within(lat, lon, radius_km)]
+
+    def nearest_resources(self, lat, lon, k=5, resource_type=None, max_km=None):
+        accept = (lambda row: row["resourceType"] == resource_type) if resource_type else None
+        return [(d, row) for d, _, row in self.resources.nearest(lat, lon, k, max_km, accept)]
+
+    def nearest_shelters(self, lat, lon, k=5, min_free=1, max_km=None):
+        """Closest shelters with at least min_free places left."""
+        def has_room(row):
+            return (row["capacity"] or 0) - (row["current_occupancy"] or 0) >= min_free
+        return [(d, row) for d, _, row in self.shelters.nearest(lat, lon, k, max_km, has_room)]
+
+
+_shared_service = None
+_shared_service_lock = threading.Lock()
+
+
+def get_proximity_service():
+    """Return the process-wide proximity index shared by all screens."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = ProximityService()
+        return _shared_service
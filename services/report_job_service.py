@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from config.settings import REPORT_JOB_CONFIG
+from data.db_connection import job_connection
+from data.report_repository import ReportRepository
+from services.report_service import ReportService
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def parameters_key(report_type, file_format, parameters=None, generated_by=None):
+    """
+    Stable hash of everything that determines a report's content, including
+    who it is for: the artifact prints "Generated by" and the Report row
+    stores generatedBy, so one user's report is never handed to another.
+    """
+    generated_by = generated_by or {}
+    author = generated_by.get("userID") or generated_by.get("id")
+    canonical = json.dumps(dict(parameters or {}, report_type=report_type, format=file_format,
+                                generated_by=[author, generated_by.get("name", "System")]),
+                           sort_keys=True, default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+class ReportJob:
+    def __init__(self, job_id, report_type, file_format, key):
+        self.job_id = job_id
+        self.report_type = report_type
+        self.file_format = file_format
+        self.key = key
+        self.future = None
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        """{'reportID', 'rows', 'file_path', 'seconds', 'cached'}; re-raises the job's error."""
+        return self.future.result(timeout)
+
+
+class ReportJobQueue:
+    """
+    Generates reports on a small worker pool and keeps the artifacts on disk.
+
+    A job whose parameters and user match a Report row generated within the
+    freshness window is answered from that file without touching the source
+    tables; identical jobs submitted while one is running share it.
+    """
+
+    def __init__(self, workers=None, freshness_seconds=None, output_dir=None):
+        self.freshness_seconds = freshness_seconds or REPORT_JOB_CONFIG["freshness_seconds"]
+        self.output_dir = os.path.join(PROJECT_ROOT, output_dir or REPORT_JOB_CONFIG["output_dir"])
+        self._pool = ThreadPoolExecutor(max_workers=workers or REPORT_JOB_CONFIG["workers"],
+                                        thread_name_prefix="drms-report")
+        self._running = {}            # key -> ReportJob still in progress
+        self._lock = threading.RLock()  # done-callbacks may fire inside submit()
+        self._next_id = 1
+
+    def submit(self, report_type, file_format, generated_by, parameters=None, copy_to=None):
+        """
+        Queue a report and return its ReportJob. copy_to, if given, receives a
+        copy of the artifact once it is ready (fresh or cached).
+        """
+        ReportRepository.columns_for(report_type)
+        key = parameters_key(report_type, file_format, parameters, generated_by)
+        with self._lock:
+            job = self._running.get(key)
+            if job is None:
+                job = ReportJob(self._next_id, report_type, file_format, key)
+                self._next_id += 1
+                job.future = self._pool.submit(self._run, job, generated_by, parameters)
+                self._running[key] = job
+                job.future.add_done_callback(lambda _, key=key: self._finished(key))
+
+        if copy_to is None:
+            return job
+        copy_job = ReportJob(job.job_id, report_type, file_format, key)
+        copy_job.future = Future()
+        job.future.add_done_callback(lambda done: self._copy(done, copy_to, copy_job.future))
+        return copy_job
+
+    def _finished(self, key):
+        with self._lock:
+            self._running.pop(key, None)
+
+    @staticmethod
+    def _copy(done, copy_to, future):
+        try:
+            result = done.result()
+            if os.path.abspath(copy_to) != os.path.abspath(result["file_path"]):
+                shutil.copyfile(result["file_path"], copy_to)
+            future.set_result(dict(result, file_path=copy_to))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _run(self, job, generated_by, parameters):
+        with job_connection() as connection:
+            repo = ReportRepository(connection)
+            cached = repo.find_recent(job.report_type, job.key, self.freshness_seconds)
+            if cached and cached["filePath"] and os.path.exists(cached["filePath"]):
+                return {"reportID": cached["reportID"], "rows": int(cached["rowCount"] or 0),
+                        "file_path": cached["filePath"], "seconds": 0.0, "cached": True}
+
+            os.makedirs(self.output_dir, exist_ok=True)
+            file_name = f"{job.report_type}_{time.strftime('%Y%m%d_%H%M%S')}_{job.key[:8]}.{job.file_format}"
+            result = ReportService(repo).generate(
+                job.report_type, os.path.join(self.output_dir, file_name), generated_by,
+                dict(parameters or {}, key=job.key)
+            )
+            return dict(result, cached=False)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False)
+
+
+_shared_queue = None
+_shared_queue_lock = threading.Lock()
+
+
+def get_report_job_queue():
+    """Return the process-wide report job queue."""
+    global _shared_queue
+    with _shared_queue_lock:
+        if _shared_queue is None:
+            _shared_queue = ReportJobQueue()
+        return _shared_queue
@@ -0,0 +1,131 @@
+import csv
+import json
+import os
+import time
+from datetime import datetime
+
+
+class CsvReportWriter:
+    def __init__(self, file_path, title, columns, meta):
+        self.file = open(file_path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(columns)
+
+    def write_rows(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self, total):
+        self.file.close()
+
+
+class JsonLinesReportWriter:
+    def __init__(self, file_path, title, columns, meta):
+        self.file = open(file_path, "w", encoding="utf-8")
+        self.columns = columns
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.file.write(json.dumps(dict(zip(self.columns, row)), default=str))
+            self.file.write("\n")
+
+    def close(self, total):
+        self.file.close()
+
+
+class PdfReportWriter:
+    """Draws rows as they arrive, starting a new page whenever one fills up."""
+
+    def __init__(self, file_path, title, columns, meta):
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
+
+        self.canvas = canvas.Canvas(file_path, pagesize=letter)
+        self.width, self.height = letter
+        self.columns = columns
+        self.col_width = (self.width - 100) / len(columns)
+
+        c = self.canvas
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(50, self.height - 50, title)
+        c.setFont("Helvetica", 10)
+        c.drawString(50, self.height - 70, f"Generated on: {meta['generated_on']}")
+        c.drawString(50, self.height - 85, f"Generated by: {meta['generated_by']}")
+        self.y = self.height - 120
+        self._draw_headings()
+
+    def _draw_headings(self):
+        self.canvas.setFont("Helvetica-Bold", 10)
+        for i, col in enumerate(self.columns):
+            self.canvas.drawString(50 + i * self.col_width, self.y, col)
+        self.canvas.setFont("Helvetica", 9)
+        self.y -= 20
+
+    def write_rows(self, rows):
+        c = self.canvas
+        for row in rows:
+            for i, item in enumerate(row):
+                c.drawString(50 + i * self.col_width, self.y, "" if item is None else str(item))
+            self.y -= 15
+            if self.y < 50:
+                c.showPage()
+                self.y = self.height - 50
+                self._draw_headings()
+
+    def close(self, total):
+        c = self.canvas
+        c.setFont("Helvetica-Oblique", 8)
+        c.drawString(50, 30, f"Total Records: {total}")
+        c.drawString(self.width - 250, 30, "DRMS - Disaster Relief Management System")
+        c.save()
+
+
+REPORT_WRITERS = {
+    ".csv": CsvReportWriter,
+    ".jsonl": JsonLinesReportWriter,
+    ".pdf": PdfReportWriter,
+}
+
+
+class ReportService:
+    """
+    Writes a report straight from the database to disk, one chunk at a time,
+    and records the finished file in the Report table. The output format
+    follows the file extension (.pdf, .csv or .jsonl).
+    """
+
+    def __init__(self, repo):
+        self.repo = repo
+
+    def generate(self, report_type, file_path, generated_by, parameters=None):
+        """
+        Returns {'reportID', 'rows', 'file_path', 'seconds'}. parameters are
+        stored with the Report row alongside the format and row count.
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension not in REPORT_WRITERS:
+            raise ValueError(f"Unsupported report format: {extension or 'none'}")
+        columns = self.repo.columns_for(report_type)
+        started = time.perf_counter()
+        meta = {
+            "generated_on": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "generated_by": generated_by.get("name", "System"),
+        }
+
+        writer = REPORT_WRITERS[extension](file_path, f"{report_type.upper()} REPORT", columns, meta)
+        total = 0
+        try:
+            for rows in self.repo.stream(report_type):
+                writer.write_rows(rows)
+                total += len(rows)
+        finally:
+            writer.close(total)
+
+        report_id = self.repo.record_report(
+            report_type,
+            dict(parameters or {}, format=extension.lstrip("."), rows=total),
+            generated_by.get("userID") or generated_by.get("id"),
+            file_path
+        )
+        return {"reportID": report_id, "rows": total, "file_path": file_path,
+                "seconds": round(time.perf_counter() - started, 2)}
+
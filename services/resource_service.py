@@ -33,26 +33,15 @@ class ResourceService:
         return self.resource_repo.get_all_resource_types()
 
     def transfer_resource(self, resource_id, from_ngo_id, to_ngo_id, from_location, to_location, quantity, transferred_by):
-        current_quantity = self.resource_repo.get_resource_quantity(resource_id)
-        if current_quantity < quantity:
-            raise ValueError("Insufficient resources for transfer.")
-        
-        # Deduct from source
-        self.resource_repo.update_resource(resource_id, quantity=(current_quantity - quantity))
-        
-        # Record transfer
-        return self.resource_repo.transfer_resource_record(resource_id, from_ngo_id, to_ngo_id, from_location, to_location, quantity, transferred_by)
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive.")
+        # Deduction is conditional on the stock still being there, in the same transaction as the record
+        return self.resource_repo.transfer_from_stock(resource_id, from_ngo_id, to_ngo_id, from_location, to_location, quantity, transferred_by)
 
     def allocate_resource(self, resource_id, allocated_to_type, allocated_to_id, request_id, quantity):
-        current_quantity = self.resource_repo.get_resource_quantity(resource_id)
-        if current_quantity < quantity:
-            raise ValueError("Insufficient resources available for allocation.")
-        
-        # Deduct from stock
-        self.resource_repo.update_resource(resource_id, quantity=(current_quantity - quantity))
-        
-        # Record allocation
-        return self.resource_repo.allocate_resource_record(resource_id, allocated_to_type, allocated_to_id, request_id, quantity)
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive.")
+        return self.resource_repo.allocate_from_stock(resource_id, allocated_to_type, allocated_to_id, request_id, quantity)
 
     def track_resource(self, resource_id):
         return self.resource_repo.get_resource_by_id(resource_id)
@@ -0,0 +1,157 @@
+import time
+
+import numpy as np
+
+from config.settings import ROUTE_CONFIG
+from services.geo import has_location
+from services.geo_arrays import distance_matrix_km
+
+
+def nearest_neighbour_order(dist, start=0):
+    """Greedy tour from start: always drive to the closest unvisited stop."""
+    n = dist.shape[0]
+    visited = np.zeros(n, dtype=bool)
+    order = np.empty(n, dtype=np.int64)
+    order[0] = current = start
+    visited[start] = True
+    for k in range(1, n):
+        current = int(np.argmin(np.where(visited, np.inf, dist[current])))
+        visited[current] = True
+        order[k] = current
+    return order
+
+
+def two_opt(order, dist, time_budget):
+    """
+    Improve an open path that starts at order[0] by reversing segments.
+    For each position i every segment end j is scored in one array
+    operation; the best improving reversal is applied straight away.
+    Stops when a full pass finds nothing or the time budget runs out.
+    """
+    route = order.copy()
+    n = route.size
+    deadline = time.perf_counter() + time_budget
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for i in range(1, n - 1):
+            a, b = route[i - 1], route[i]
+            ends = route[i + 1:]                  # route[j] for j = i+1 .. n-1
+            after = route[i + 2:]                 # route[j+1]; the last j has none (open end)
+            removed = dist[a, b] + np.append(dist[ends[:-1], after], 0.0)
+            added = dist[a, ends] + np.append(dist[b, after], 0.0)
+            delta = added - removed
+            k = int(np.argmin(delta))
+            if delta[k] < -1e-9:
+                j = i + 1 + k
+                route[i:j + 1] = route[i:j + 1][::-1].copy()
+                improved = True
+            if i % 256 == 0 and time.perf_counter() > deadline:
+                break
+    return route
+
+
+def plan_path(lat, lon, start=None, time_budget=None):
+    """
+    Order points into a short open path, beginning at start=(lat, lon) when
+    given. Returns (order, leg_km) where leg_km[k] is the distance driven to
+    reach point order[k].
+    """
+    lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+    if lat.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    time_budget = ROUTE_CONFIG["two_opt_seconds"] if time_budget is None else time_budget
+    dtype = np.float32 if lat.size > ROUTE_CONFIG["float32_above"] else np.float64
+
+    # Node 0 is the start; without one it is a dummy at distance 0 from every
+    # stop, which leaves the first stop free.
+    if start is not None:
+        dist = distance_matrix_km(np.append(start[0], lat), np.append(start[1], lon), dtype=dtype)
+    else:
+        dist = np.zeros((lat.size + 1, lat.size + 1), dtype=dtype)
+        dist[1:, 1:] = distance_matrix_km(lat, lon, dtype=dtype)
+
+    route = two_opt(nearest_neighbour_order(dist), dist, time_budget)
+    legs = dist[route[:-1], route[1:]].astype(float)
+    return route[1:] - 1, legs
+
+
+class RoutePlannerService:
+    """
+    Plans a volunteer's delivery run: collect every allocated resource from
+    its stock location first, then drop off at each SOS location. Each
+    phase is ordered with nearest-neighbour plus 2-opt on a distance matrix.
+    Distances are great-circle km scaled by road_factor; the ETA adds
+    stop_minutes per stop at speed_kmh.
+    """
+
+    def __init__(self, repo, config=None):
+        self.repo = repo
+        self.config = dict(ROUTE_CONFIG, **(config or {}))
+
+    def plan_for_volunteer(self, volunteer_id):
+        start = self.repo.get_volunteer_location(volunteer_id)
+        rows = self.repo.get_delivery_stops(volunteer_id)
+
+        pickups, dropoffs, skipped = {}, {}, set()
+        for row in rows:
+            if not has_location(row["latitude"], row["longitude"]):
+                skipped.add(row["taskID"])
+                continue
+            drop = dropoffs.setdefault(row["requestID"], {
+                "kind": "dropoff", "label": row["location"] or f"SOS #{row['requestID']}",
+                "latitude": float(row["latitude"]), "longitude": float(row["longitude"]),
+                "taskIDs": [], "items": [],
+            })
+            if row["taskID"] not in drop["taskIDs"]:
+                drop["taskIDs"].append(row["taskID"])
+            if row["allocationID"] is None:
+                continue
+            item = f"{row['quantity']} x {row['resourceName']}"
+            drop["items"].append(item)
+            if has_location(row["pickupLat"], row["pickupLong"]):
+                pick = pickups.setdefault(row["resourceID"], {
+                    "kind": "pickup", "label": row["pickupLocation"] or f"Stock #{row['resourceID']}",
+                    "latitude": float(row["pickupLat"]), "longitude": float(row["pickupLong"]),
+                    "taskIDs": [], "items": [],
+                })
+                pick["taskIDs"].append(row["taskID"])
+                pick["items"].append(item)
+
+        if start and has_location(start["latitude"], start["longitude"]):
+            start = (float(start["latitude"]), float(start["longitude"]))
+        else:
+            start = None
+        route = self.build_route(list(pickups.values()), list(dropoffs.values()), start)
+        route["skippedTaskIDs"] = sorted(skipped)
+        return route
+
+    def build_route(self, pickups, dropoffs, start=None):
+        """Ordered stops with leg/cumulative distance and ETA, plus totals."""
+        started = time.perf_counter()
+        stops, position = [], start
+        for phase in (pickups, dropoffs):
+            if not phase:
+                continue
+            order, legs = plan_path([s["latitude"] for s in phase], [s["longitude"] for s in phase],
+                                    start=position, time_budget=self.config["two_opt_seconds"])
+            for index, leg in zip(order.tolist(), legs.tolist()):
+                stops.append(dict(phase[index], leg_km=leg * self.config["road_factor"]))
+            last = phase[int(order[-1])]
+            position = (last["latitude"], last["longitude"])
+
+        total_km, minutes = 0.0, 0.0
+        for stop in stops:
+            total_km += stop["leg_km"]
+            minutes += stop["leg_km"] / self.config["speed_kmh"] * 60
+            stop["leg_km"] = round(stop["leg_km"], 2)
+            stop["distance_km"] = round(total_km, 2)
+            stop["eta_minutes"] = round(minutes)
+            minutes += self.config["stop_minutes"]
+
+        return {
+            "stops": stops,
+            "total_km": round(total_km, 2),
+            "eta_minutes": round(minutes),
+            "seconds": round(time.perf_counter() - started, 3),
+        }
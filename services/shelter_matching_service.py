@@ -0,0 +1,147 @@
+import time
+
+import numpy as np
+
+from config.settings import SHELTER_CONFIG
+from services.geo import has_location
+from services.geo_arrays import haversine_km, project_km
+
+URGENCY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+REFILL_BLOCK = 512            # requests whose candidate lists are rebuilt together
+
+
+def nearest_candidates(lat, lon, shelter_lat, shelter_lon, k, chunk_rows=2000):
+    """
+    (indices, distances): for every point its k nearest shelters, nearest
+    first. Shelters are ranked by squared distance in a local projection
+    (one matrix product per block of points); exact haversine distances are
+    computed only for the k kept. Memory stays at chunk_rows x shelters.
+    """
+    lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+    shelter_lat, shelter_lon = np.asarray(shelter_lat, dtype=float), np.asarray(shelter_lon, dtype=float)
+    k = min(k, shelter_lat.size)
+    ref_lat = float(np.concatenate([lat, shelter_lat]).mean())
+    px, py = project_km(lat, lon, ref_lat)
+    sx, sy = project_km(shelter_lat, shelter_lon, ref_lat)
+    # Centre on the shelters so float32 keeps metre-level precision
+    cx, cy = sx.mean(), sy.mean()
+    px, py, sx, sy = px - cx, py - cy, sx - cx, sy - cy
+    shelter_xy = np.column_stack([sx, sy]).astype(np.float32)
+    shelter_sq = (sx ** 2 + sy ** 2).astype(np.float32)
+
+    indices = np.empty((lat.size, k), dtype=np.int64)
+    for start in range(0, lat.size, chunk_rows):
+        stop = start + chunk_rows
+        xy = np.column_stack([px[start:stop], py[start:stop]]).astype(np.float32)
+        d2 = (xy ** 2).sum(axis=1)[:, None] + shelter_sq[None, :] - 2 * xy @ shelter_xy.T
+        if k < shelter_lat.size:
+            part = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        else:
+            part = np.tile(np.arange(k), (d2.shape[0], 1))
+        order = np.argsort(np.take_along_axis(d2, part, axis=1), axis=1)
+        indices[start:stop] = np.take_along_axis(part, order, axis=1)
+    distances = haversine_km(lat[:, None], lon[:, None], shelter_lat[indices], shelter_lon[indices])
+    return indices, distances
+
+
+class ShelterMatchingService:
+    """
+    Assigns victims (SOS requests needing shelter) to shelters with spare
+    capacity.
+
+    Requests are placed in priority order (urgency, then priorityScore),
+    each to the nearest shelter that can take its whole group. The k
+    nearest shelters of every request are found up front in one vectorized
+    pass. When a request finds all its candidates full, the candidate lists
+    of it and the next REFILL_BLOCK requests are rebuilt against the
+    shelters that still have room; only a group too big for every refreshed
+    candidate scans all shelters. commit() writes the assignments and the
+    occupancy increments in one transaction that fails as a whole if any
+    shelter filled up in the meantime.
+    """
+
+    def __init__(self, repo, config=None):
+        self.repo = repo
+        self.config = dict(SHELTER_CONFIG, **(config or {}))
+
+    def match(self, victims, shelters):
+        """
+        victims: dicts with requestID, victimID, latitude, longitude,
+        peopleAffected (already in priority order). shelters: dicts with
+        shelterID, latitude, longitude, capacity, current_occupancy.
+        Returns {'assignments': [...], 'unplaced': [...], 'seconds': s}.
+        """
+        started = time.perf_counter()
+        shelters = [s for s in shelters if has_location(s["latitude"], s["longitude"])]
+        located = [v for v in victims if has_location(v["latitude"], v["longitude"])]
+        unplaced = [v for v in victims if not has_location(v["latitude"], v["longitude"])]
+        if not shelters or not located:
+            return {"assignments": [], "unplaced": unplaced + located,
+                    "seconds": round(time.perf_counter() - started, 3)}
+
+        s_lat = np.array([float(s["latitude"]) for s in shelters])
+        s_lon = np.array([float(s["longitude"]) for s in shelters])
+        free = np.array([max(0, (s["capacity"] or 0) - (s["current_occupancy"] or 0)) for s in shelters],
+                        dtype=np.int64)
+        v_lat = np.array([float(v["latitude"]) for v in located])
+        v_lon = np.array([float(v["longitude"]) for v in located])
+        k = self.config["candidates"]
+        candidates, distances = nearest_candidates(v_lat, v_lon, s_lat, s_lon, k)
+        max_km = self.config["max_km"]
+
+        def pick(i, people):
+            for j, d in zip(candidates[i].tolist(), distances[i].tolist()):
+                if j < 0 or (max_km is not None and d > max_km):
+                    break
+                if free[j] >= people:
+                    return j, d
+            return None, None
+
+        assignments = []
+        for i, victim in enumerate(located):
+            people = max(1, victim.get("peopleAffected") or 1)
+            choice, distance = pick(i, people)
+            if choice is None and free.max() >= people and candidates.shape[1] < len(shelters):
+                # Nearby shelters filled up: rebuild candidates from those with room
+                roomy = np.flatnonzero(free > 0)
+                block = slice(i, i + REFILL_BLOCK)
+                idx, dist = nearest_candidates(v_lat[block], v_lon[block], s_lat[roomy], s_lon[roomy], k)
+                candidates[block], distances[block] = -1, np.inf
+                candidates[block, :idx.shape[1]], distances[block, :idx.shape[1]] = roomy[idx], dist
+                choice, distance = pick(i, people)
+            if choice is None and free.max() >= people and candidates.shape[1] < len(shelters):
+                # A group bigger than any nearby shelter's room: look at every shelter
+                roomy = np.flatnonzero(free >= people)
+                if roomy.size:
+                    d = haversine_km(v_lat[i], v_lon[i], s_lat[roomy], s_lon[roomy])
+                    best = int(np.argmin(d))
+                    if max_km is None or d[best] <= max_km:
+                        choice, distance = int(roomy[best]), float(d[best])
+            if choice is None:
+                unplaced.append(victim)
+                continue
+            free[choice] -= people
+            assignments.append({
+                "requestID": victim["requestID"],
+                "victimID": victim["victimID"],
+                "shelterID": shelters[choice]["shelterID"],
+                "people": people,
+                "distance_km": round(distance, 2),
+            })
+
+        return {"assignments": assignments, "unplaced": unplaced,
+                "seconds": round(time.perf_counter() - started, 3)}
+
+    def assign_pending(self, commit=True):
+        """Match every open, unsheltered request needing shelter; returns the plan with timings."""
+        started = time.perf_counter()
+        victims = self.repo.get_unsheltered_requests(self.config["need_keywords"])
+        victims.sort(key=lambda v: (URGENCY_RANK.get(v["urgencyLevel"], 4), -(v["priorityScore"] or 0),
+                                    v["requestID"]))
+        plan = self.match(victims, self.repo.get_shelters_with_room())
+        plan["match_seconds"] = plan["seconds"]
+        if commit and plan["assignments"]:
+            self.repo.commit_assignments(plan["assignments"])
+        plan["people"] = sum(a["people"] for a in plan["assignments"])
+        plan["seconds"] = round(time.perf_counter() - started, 3)
+        return plan
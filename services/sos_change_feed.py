@@ -0,0 +1,79 @@
+from collections import Counter
+from datetime import timedelta
+
+
+class SOSChangeFeed:
+    """
+    Tracks an in-memory view of SOS requests through updatedAt watermarks.
+
+    reset() takes a snapshot of the rows in view; apply() then merges rows
+    read with updatedAt >= since() and reports what to upsert or remove,
+    keeping per-bucket counters up to date without re-reading the table.
+
+    include(row) decides whether a row belongs to the view and classify(row)
+    returns the counter buckets a row contributes to. Both only read the
+    fields they need, so snapshots can be narrow.
+    """
+
+    def __init__(self, include, classify, id_field="requestID", overlap_seconds=5):
+        self.include = include
+        self.classify = classify
+        self.id_field = id_field
+        # Re-read a few seconds behind the watermark so rows from transactions
+        # that committed late are not skipped; merging is idempotent.
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.watermark = None
+        self.counters = Counter()
+        self._buckets = {}            # requestID -> buckets of rows currently in view
+
+    def reset(self, rows, watermark):
+        """
+        Start over from a snapshot taken at database time `watermark`. Rows
+        go through include() like in apply(), so the snapshot may be wider
+        than the view.
+        """
+        self.watermark = watermark
+        self.counters = Counter()
+        self._buckets = {}
+        for row in rows:
+            if self.include(row):
+                self._add(row)
+
+    def since(self):
+        """Lower bound for the next change query."""
+        return self.watermark - self.overlap if self.watermark else None
+
+    def __contains__(self, row_id):
+        return row_id in self._buckets
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def apply(self, rows):
+        """
+        Merge changed rows. Returns (upserts, removed_ids): rows that are in
+        view after the change, and ids of rows that left the view.
+        """
+        upserts, removed_ids = [], []
+        for row in rows:
+            row_id = row[self.id_field]
+            self._discard(row_id)
+            if self.include(row):
+                self._add(row)
+                upserts.append(row)
+            else:
+                removed_ids.append(row_id)
+            updated_at = row.get("updatedAt")
+            if updated_at and (self.watermark is None or updated_at > self.watermark):
+                self.watermark = updated_at
+        return upserts, removed_ids
+
+    def _add(self, row):
+        buckets = tuple(self.classify(row))
+        self._buckets[row[self.id_field]] = buckets
+        self.counters.update(buckets)
+
+    def _discard(self, row_id):
+        buckets = self._buckets.pop(row_id, None)
+        if buckets:
+            self.counters.subtract(buckets)
@@ -0,0 +1,140 @@
+import threading
+import time
+
+from config.settings import SOS_DEDUPE_CONFIG
+from services.geo import distance_km, geohash_cell, geohash_neighbourhood, has_location
+
+
+def _need_key(type_of_need):
+    return " ".join((type_of_need or "").lower().split())
+
+
+def _timestamp(created_at):
+    if created_at is None:
+        return time.time()
+    return created_at.timestamp() if hasattr(created_at, "timestamp") else float(created_at)
+
+
+class SOSDuplicateIndex:
+    """
+    In-memory bucket index that links new SOS requests to a cluster head.
+
+    Requests are bucketed by (time window, geohash cell, need). A new request
+    looks only at its own cell and the eight around it in the current and
+    previous window, so detection costs a fixed number of dict lookups no
+    matter how many requests are open. The nearest head within
+    max_distance_km and window_minutes wins; otherwise the request becomes a
+    head itself. Requests without coordinates are bucketed by their location
+    text. Windows older than the previous one are dropped as time moves on.
+    """
+
+    def __init__(self, config=None):
+        self.config = dict(SOS_DEDUPE_CONFIG, **(config or {}))
+        self.window_seconds = self.config["window_minutes"] * 60
+        self._windows = {}            # window -> {(cell, need): (requestID, lat, lon, created)}
+        self._seen = {}               # requestID -> window it was indexed in
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def _cells(self, request):
+        if has_location(request.get("latitude"), request.get("longitude")):
+            precision = self.config["geohash_precision"]
+            cell = geohash_cell(request["latitude"], request["longitude"], precision)
+            return cell, geohash_neighbourhood(cell, precision)
+        location = " ".join((request.get("location") or "").lower().split())
+        if not location:
+            return None, []
+        cell = "loc:" + location
+        return cell, [cell]
+
+    def link(self, request):
+        """
+        Index one request (needs requestID, typeOfNeed, createdAt and
+        latitude/longitude or location) and return its head's requestID,
+        or None when it starts a new cluster or cannot be placed.
+        """
+        request_id = request["requestID"]
+        need = _need_key(request.get("typeOfNeed"))
+        own_cell, cells = self._cells(request)
+        if not need or own_cell is None:
+            return None
+        created = _timestamp(request.get("createdAt"))
+        window = int(created // self.window_seconds)
+        lat, lon = request.get("latitude"), request.get("longitude")
+        located = isinstance(own_cell, tuple)
+
+        with self._lock:
+            if request_id in self._seen:
+                return None
+            self._prune(window)
+            best, best_distance = None, None
+            for w in (window, window - 1):
+                buckets = self._windows.get(w)
+                if not buckets:
+                    continue
+                for cell in cells:
+                    head = buckets.get((cell, need))
+                    if head is None or abs(created - head[3]) > self.window_seconds:
+                        continue
+                    d = distance_km(lat, lon, head[1], head[2]) if located else 0.0
+                    if d <= self.config["max_distance_km"] and (best is None or d < best_distance):
+                        best, best_distance = head, d
+            self._seen[request_id] = window
+            if best is not None:
+                return best[0]
+            self._windows.setdefault(window, {})[(own_cell, need)] = (
+                request_id, float(lat) if located else None, float(lon) if located else None, created)
+            return None
+
+    def link_many(self, requests):
+        """{requestID: headID} for the requests that joined an existing cluster."""
+        links = {}
+        for request in requests:
+            head_id = self.link(request)
+            if head_id is not None:
+                links[request["requestID"]] = head_id
+        return links
+
+    def load(self, rows):
+        """
+        Seed from recent pending rows (oldest first). Returns links for rows
+        that were never linked but belong to an earlier cluster, so callers
+        can backfill them.
+        """
+        with self._lock:
+            self._windows, self._seen = {}, {}
+        links = {}
+        for row in rows:
+            if row.get("duplicateOf"):
+                created = _timestamp(row.get("createdAt"))
+                with self._lock:
+                    self._seen[row["requestID"]] = int(created // self.window_seconds)
+                continue
+            head_id = self.link(row)
+            if head_id is not None:
+                links[row["requestID"]] = head_id
+        self.loaded = True
+        return links
+
+    def _prune(self, window):
+        stale = [w for w in self._windows if w < window - 1]
+        for w in stale:
+            del self._windows[w]
+        if stale:
+            self._seen = {rid: w for rid, w in self._seen.items() if w >= window - 1}
+
+    def __len__(self):
+        return len(self._seen)
+
+
+_shared_index = None
+_shared_index_lock = threading.Lock()
+
+
+def get_sos_duplicate_index():
+    """Return the process-wide duplicate index."""
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = SOSDuplicateIndex()
+        return _shared_index
@@ -0,0 +1,192 @@
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+
+from config.settings import SOS_DEDUPE_CONFIG, SOS_INGESTION_CONFIG
+from data.db_connection import job_connection
+from data.sos_repository import SOSRepository
+from services.sos_dedupe_service import get_sos_duplicate_index
+
+URGENCY_LEVELS = ("low", "medium", "high", "critical")
+
+
+class IngestionBusy(RuntimeError):
+    """The ingestion queue is full or the database is lagging; try again shortly."""
+
+
+class InvalidCoordinates(ValueError):
+    """Latitude/longitude are not numbers or out of range."""
+
+
+def validate_submission(data):
+    """Return a clean submission dict or raise ValueError (InvalidCoordinates for the location)."""
+    try:
+        victim_id = int(data["victimID"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("A valid victim is required.")
+    type_of_need = (data.get("typeOfNeed") or "").strip()
+    if not type_of_need:
+        raise ValueError("Type of need is required.")
+    urgency = (data.get("urgencyLevel") or "low").lower()
+    if urgency not in URGENCY_LEVELS:
+        raise ValueError(f"Unknown urgency level: {urgency}")
+    people = int(data.get("peopleAffected") or 1)
+
+    latitude, longitude = data.get("latitude"), data.get("longitude")
+    if latitude is not None or longitude is not None:
+        try:
+            latitude, longitude = float(latitude), float(longitude)
+        except (TypeError, ValueError):
+            raise InvalidCoordinates("Latitude and longitude must both be numbers.")
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise InvalidCoordinates("Coordinates are out of range.")
+
+    return {
+        "victimID": victim_id,
+        "location": (data.get("location") or "").strip() or None,
+        "latitude": latitude,
+        "longitude": longitude,
+        "typeOfNeed": type_of_need,
+        "description": data.get("description") or "",
+        "urgencyLevel": urgency,
+        "peopleAffected": max(1, people),
+        # Same key on a resubmit (e.g. after a timeout) returns the original request
+        "submissionKey": str(data.get("submissionKey") or uuid.uuid4()),
+    }
+
+
+class SOSIngestionService:
+    """
+    Accepts SOS submissions from any thread and writes them in batches.
+
+    submit() validates and queues a submission and returns a Future that
+    resolves to its requestID. A single writer thread drains the queue,
+    collecting up to batch_size submissions or whatever arrived within
+    flush_ms, and inserts each batch with one statement. When the queue is
+    full, or the last flush was slower than lag_seconds and the queue is
+    half full, submit() raises IngestionBusy instead of piling on.
+
+    Written requests are run through the duplicate index and probable
+    duplicates are linked to their cluster head in the same pass.
+    """
+
+    def __init__(self, config=None, duplicate_index=None):
+        self.config = dict(SOS_INGESTION_CONFIG, **(config or {}))
+        if duplicate_index is None and SOS_DEDUPE_CONFIG["enabled"]:
+            duplicate_index = get_sos_duplicate_index()
+        self.duplicates = duplicate_index
+        self._queue = queue.Queue(maxsize=self.config["queue_size"])
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.lagging = False
+        self._stats_lock = threading.Lock()
+        self.stats = {"accepted": 0, "rejected": 0, "written": 0, "batches": 0, "failed": 0,
+                      "duplicates": 0, "last_flush_seconds": 0.0}
+
+    def start(self):
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._loop, name="drms-sos-ingestion", daemon=True)
+            self._thread.start()
+
+    def submit(self, data):
+        submission = validate_submission(data)
+        self.start()
+        if self.lagging and self._queue.qsize() >= self.config["queue_size"] // 2:
+            self._count("rejected")
+            raise IngestionBusy("The system is busy saving other requests. Please retry in a moment.")
+
+        future = Future()
+        try:
+            self._queue.put((submission, future), timeout=self.config["submit_timeout"])
+        except queue.Full:
+            self._count("rejected")
+            raise IngestionBusy("Too many requests are waiting to be saved. Please retry in a moment.")
+        self._count("accepted")
+        return future
+
+    def submit_and_wait(self, data, timeout=None):
+        """Blocking convenience for screens: returns the new requestID."""
+        timeout = timeout or self.config["submit_timeout"] + 10
+        return self.submit(data).result(timeout)
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.config["flush_ms"] / 1000
+        while len(batch) < self.config["batch_size"]:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _loop(self):
+        while True:
+            batch = self._next_batch()
+            started = time.perf_counter()
+            self._write(batch)
+            elapsed = time.perf_counter() - started
+            self._count("batches")
+            with self._stats_lock:
+                self.stats["last_flush_seconds"] = round(elapsed, 4)
+            self.lagging = elapsed > self.config["lag_seconds"]
+
+    def _write(self, batch):
+        try:
+            with job_connection() as connection:
+                repo = SOSRepository(connection)
+                ids = repo.insert_batch([submission for submission, _ in batch])
+                self._link_duplicates(repo, batch, ids)
+        except Exception as e:
+            if len(batch) > 1:
+                # One bad row (e.g. unknown victim) must not sink the others
+                for item in batch:
+                    self._write([item])
+                return
+            self._count("failed")
+            batch[0][1].set_exception(e)
+            return
+        self._count("written", len(batch))
+        for (_, future), request_id in zip(batch, ids):
+            future.set_result(request_id)
+
+    def _link_duplicates(self, repo, batch, ids):
+        if self.duplicates is None:
+            return
+        try:
+            links = {}
+            if not self.duplicates.loaded:
+                # Also picks up this batch, which is already committed
+                links = self.duplicates.load(repo.get_recent_pending(2 * self.duplicates.config["window_minutes"]))
+            links.update(self.duplicates.link_many(
+                dict(submission, requestID=request_id) for (submission, _), request_id in zip(batch, ids)))
+            self._count("duplicates", repo.link_duplicates(links))
+        except Exception as e:
+            # Linking is best effort; the requests themselves are saved
+            print(f"⚠️ Duplicate detection skipped: {e}")
+
+
+_shared_service = None
+_shared_service_lock = threading.Lock()
+
+
+def get_sos_ingestion_service():
+    """Return the process-wide SOS ingestion service."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = SOSIngestionService()
+        return _shared_service
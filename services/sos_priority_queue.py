@@ -0,0 +1,217 @@
+import heapq
+import threading
+
+QUEUED_STATUS = "pending"     # requests waiting to be prioritised and assigned
+
+
+def priority_key(row):
+    """Heap key: highest priorityScore first, the older (lower) requestID breaking ties."""
+    return (-(row["priorityScore"] or 0), row["requestID"])
+
+
+class IndexedHeap:
+    """
+    Binary min-heap of (key, item) pairs with a position index, so any
+    item's key can be changed or the item removed in O(log n), not only the
+    one at the top. Items must be hashable; keys must be comparable.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._pos = {}                # item -> index in _heap
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, item):
+        return item in self._pos
+
+    def key_of(self, item):
+        return self._heap[self._pos[item]][0]
+
+    def heapify(self, pairs):
+        """Replace the contents with (key, item) pairs in O(n)."""
+        self._heap = [(key, item) for key, item in pairs]
+        heapq.heapify(self._heap)
+        self._pos = {item: i for i, (_, item) in enumerate(self._heap)}
+        if len(self._pos) != len(self._heap):
+            raise ValueError("Duplicate items given to IndexedHeap.heapify()")
+
+    def push(self, item, key):
+        """Insert item, or move it to its new key if already present."""
+        i = self._pos.get(item)
+        if i is None:
+            self._heap.append((key, item))
+            self._pos[item] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            return
+        old = self._heap[i][0]
+        self._heap[i] = (key, item)
+        if key < old:
+            self._sift_up(i)
+        elif old < key:
+            self._sift_down(i)
+
+    def remove(self, item):
+        """Drop item if present; returns whether it was."""
+        i = self._pos.pop(item, None)
+        if i is None:
+            return False
+        last = self._heap.pop()
+        if i < len(self._heap):
+            self._heap[i] = last
+            self._pos[last[1]] = i
+            self._sift_up(i)
+            self._sift_down(self._pos[last[1]])
+        return True
+
+    def peek(self):
+        """(key, item) at the top, or None when empty."""
+        return self._heap[0] if self._heap else None
+
+    def pop(self):
+        key, item = self._heap[0]
+        self.remove(item)
+        return key, item
+
+    def ordered(self):
+        """
+        Yield (key, item) pairs in key order without modifying the heap. A
+        small frontier heap of candidate positions is expanded lazily, so
+        reading the first k costs O(k log k).
+        """
+        if not self._heap:
+            return
+        frontier = [(self._heap[0][0], 0)]
+        while frontier:
+            key, i = heapq.heappop(frontier)
+            yield self._heap[i]
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(self._heap):
+                    heapq.heappush(frontier, (self._heap[child][0], child))
+
+    def top(self, k):
+        pairs = []
+        for pair in self.ordered():
+            if len(pairs) == k:
+                break
+            pairs.append(pair)
+        return pairs
+
+    def _swap(self, i, j):
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._pos[heap[i][1]] = i
+        self._pos[heap[j][1]] = j
+
+    def _sift_up(self, i):
+        heap = self._heap
+        while i > 0:
+            parent = (i - 1) // 2
+            if not heap[i][0] < heap[parent][0]:
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i):
+        heap = self._heap
+        n = len(heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and heap[child][0] < heap[smallest][0]:
+                    smallest = child
+            if smallest == i:
+                return
+            self._swap(i, smallest)
+            i = smallest
+
+
+class SOSPriorityQueue:
+    """
+    Pending SOS requests ordered by priority, in memory.
+
+    rebuild() loads a snapshot of the pending set in O(n); apply() then
+    merges changed rows (new requests are inserted, re-prioritised ones
+    move, assigned or closed ones drop out) in O(log n) each, and top(k)
+    reads the most urgent k without sorting the backlog. Rows need
+    requestID, status and priorityScore; the last row seen for each
+    request is kept for display.
+    """
+
+    def __init__(self):
+        self._heap = IndexedHeap()
+        self._rows = {}
+        self._lock = threading.RLock()
+        self.loaded = False
+
+    def rebuild(self, rows):
+        with self._lock:
+            self._rows = {row["requestID"]: dict(row) for row in rows if row["status"] == QUEUED_STATUS}
+            self._heap.heapify((priority_key(row), request_id) for request_id, row in self._rows.items())
+            self.loaded = True
+
+    def apply(self, rows):
+        """Merge changed rows; returns (queued, removed) counts."""
+        queued = removed = 0
+        with self._lock:
+            for row in rows:
+                request_id = row["requestID"]
+                if row["status"] == QUEUED_STATUS:
+                    merged = self._rows[request_id] = dict(self._rows.get(request_id, {}), **row)
+                    self._heap.push(request_id, priority_key(merged))
+                    queued += 1
+                elif self._heap.remove(request_id):
+                    del self._rows[request_id]
+                    removed += 1
+        return queued, removed
+
+    def rescore(self, scores):
+        """Apply {requestID: priorityScore} from a rescoring run to queued requests."""
+        with self._lock:
+            for request_id, score in scores.items():
+                row = self._rows.get(request_id)
+                if row is not None:
+                    row["priorityScore"] = score
+                    self._heap.push(request_id, priority_key(row))
+
+    def remove(self, request_ids):
+        """Drop requests that were assigned or closed; returns how many were queued."""
+        removed = 0
+        with self._lock:
+            for request_id in request_ids:
+                if self._heap.remove(request_id):
+                    del self._rows[request_id]
+                    removed += 1
+        return removed
+
+    def top(self, k, include=None):
+        """The k highest-priority queued rows, skipping those include(row) rejects."""
+        rows = []
+        with self._lock:
+            for _, request_id in self._heap.ordered():
+                if len(rows) == k:
+                    break
+                row = self._rows[request_id]
+                if include is None or include(row):
+                    rows.append(dict(row))
+        return rows
+
+    def __contains__(self, request_id):
+        return request_id in self._heap
+
+    def __len__(self):
+        return len(self._heap)
+
+
+_shared_queue = None
+_shared_queue_lock = threading.Lock()
+
+
+def get_sos_priority_queue():
+    """Return the process-wide SOS priority queue."""
+    global _shared_queue
+    with _shared_queue_lock:
+        if _shared_queue is None:
+            _shared_queue = SOSPriorityQueue()
+        return _shared_queue
@@ -0,0 +1,95 @@
+from itertools import islice
+
+from config.settings import TASK_ASSIGNMENT_CONFIG
+from services.geo import GridIndex, has_location
+
+URGENCY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+# Words in Volunteer.roles that qualify a volunteer for a task type
+SKILL_KEYWORDS = {
+    "medical": ("medical", "doctor", "nurse", "first aid", "paramedic"),
+    "rescue": ("rescue", "search", "firefight", "diver"),
+    "delivery": ("transport", "delivery", "driver", "logistics"),
+    "assessment": ("assessment", "survey", "engineer"),
+}
+
+
+def skill_match(task_type, roles):
+    roles = (roles or "").lower()
+    return any(word in roles for word in SKILL_KEYWORDS.get(task_type, ()))
+
+
+class TaskAssignmentService:
+    """
+    Matches every unassigned task to an available volunteer in one pass.
+
+    Tasks are taken most urgent first; each one picks the cheapest of the
+    nearest free volunteers, where cost is distance in km minus a bonus for
+    a matching role. Candidates come from a grid index that shrinks as
+    volunteers are taken, so a round costs O(tasks x candidates) rather than
+    a full tasks x volunteers matrix.
+    """
+
+    def __init__(self, repo, config=None):
+        self.repo = repo
+        self.config = dict(TASK_ASSIGNMENT_CONFIG, **(config or {}))
+
+    def cost(self, task, volunteer, distance):
+        if distance is None:
+            distance = self.config["unknown_distance_km"]
+        if skill_match(task["taskType"], volunteer["roles"]):
+            distance -= self.config["skill_bonus_km"]
+        return distance
+
+    def plan(self, tasks=None, volunteers=None):
+        """
+        Return [{'task', 'volunteer', 'distance_km'}]; tasks left over when
+        volunteers run out are simply not in the plan.
+        """
+        tasks = self.repo.get_unassigned_tasks() if tasks is None else tasks
+        volunteers = self.repo.get_available_volunteers() if volunteers is None else volunteers
+
+        located = GridIndex()
+        unlocated = {}
+        for volunteer in volunteers:
+            if has_location(volunteer["latitude"], volunteer["longitude"]):
+                located.put(volunteer["volunteerID"], volunteer["latitude"], volunteer["longitude"], volunteer)
+            else:
+                unlocated[volunteer["volunteerID"]] = volunteer
+
+        ordered = sorted(tasks, key=lambda t: (URGENCY_RANK.get(t["urgency"], 2), t["taskID"]))
+        plan = []
+        for task in ordered:
+            if not len(located) and not unlocated:
+                break
+            limit = self.config["candidates"]
+            if has_location(task["latitude"], task["longitude"]):
+                candidates = [(d, v) for d, _, v in located.nearest(
+                    task["latitude"], task["longitude"], limit, self.config["max_km"])]
+            else:
+                # No location to search around: any free volunteer, skill decides
+                candidates = [(None, v) for _, v in located.items(limit)]
+            candidates += [(None, v) for v in islice(unlocated.values(), limit)]
+            if not candidates:
+                continue
+
+            distance, volunteer = min(candidates, key=lambda c: self.cost(task, c[1], c[0]))
+            if not located.remove(volunteer["volunteerID"]):
+                del unlocated[volunteer["volunteerID"]]
+            plan.append({"task": task, "volunteer": volunteer, "distance_km": distance})
+        return plan
+
+    def commit(self, plan, assigned_by, note="Batch assignment"):
+        """Write a plan in one transaction; returns the number of tasks assigned."""
+        pairs = [(p["task"]["taskID"], p["volunteer"]["volunteerID"]) for p in plan]
+        return self.repo.commit_assignments(pairs, assigned_by, note)
+
+    @staticmethod
+    def summarize(plan, task_count):
+        located = [p["distance_km"] for p in plan if p["distance_km"] is not None]
+        return {
+            "assigned": len(plan),
+            "unassigned": task_count - len(plan),
+            "skill_matches": sum(1 for p in plan if skill_match(p["task"]["taskType"], p["volunteer"]["roles"])),
+            "avg_distance_km": round(sum(located) / len(located), 2) if located else None,
+        }
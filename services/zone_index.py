@@ -0,0 +1,205 @@
+import threading
+
+import numpy as np
+
+from data.sos_repository import OPEN_STATUSES
+from services.geo import KM_PER_DEGREE_LAT, has_location
+from services.geo_arrays import haversine_km
+
+LEVEL_RANK = {"low": 1, "medium": 2, "high": 3}
+CHUNK_SIZE = 50000            # points tested against all zones at once
+
+
+def _usable(zone):
+    return zone["centerLat"] is not None and zone["centerLong"] is not None and zone["radius_km"]
+
+
+class ZoneArrays:
+    """
+    PriorityZones as NumPy arrays with bounding boxes, for bulk containment
+    tests. contains() returns (point_index, zone_index) pairs: the bounding
+    box comparison filters the point x zone grid first, so haversine runs
+    only on candidate pairs.
+    """
+
+    def __init__(self, zones):
+        self.zones = [z for z in zones if _usable(z)]
+        self.ids = np.array([z["zoneID"] for z in self.zones], dtype=np.int64)
+        self.lat = np.array([float(z["centerLat"]) for z in self.zones])
+        self.lon = np.array([float(z["centerLong"]) for z in self.zones])
+        self.radius = np.array([float(z["radius_km"]) for z in self.zones])
+        self.rank = np.array([LEVEL_RANK.get(z["priority_level"], 0) for z in self.zones], dtype=np.int64)
+        lat_span = self.radius / KM_PER_DEGREE_LAT
+        lon_span = self.radius / (KM_PER_DEGREE_LAT * np.maximum(
+            np.cos(np.radians(np.minimum(np.abs(self.lat) + lat_span, 89.9))), 0.01))
+        self.lat_min, self.lat_max = self.lat - lat_span, self.lat + lat_span
+        self.lon_min, self.lon_max = self.lon - lon_span, self.lon + lon_span
+
+    def __len__(self):
+        return len(self.zones)
+
+    def contains(self, lat, lon):
+        lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+        if not len(self.zones) or lat.size == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        points, zones = [], []
+        for start in range(0, lat.size, CHUNK_SIZE):
+            c_lat, c_lon = lat[start:start + CHUNK_SIZE, None], lon[start:start + CHUNK_SIZE, None]
+            box = ((c_lat >= self.lat_min) & (c_lat <= self.lat_max)
+                   & (c_lon >= self.lon_min) & (c_lon <= self.lon_max))
+            p, z = np.nonzero(box)
+            inside = haversine_km(c_lat[p, 0], c_lon[p, 0], self.lat[z], self.lon[z]) <= self.radius[z]
+            points.append(p[inside] + start)
+            zones.append(z[inside])
+        return np.concatenate(points), np.concatenate(zones)
+
+    def best_levels(self, lat, lon):
+        """Highest priority_level of the zones containing each point (None outside all zones)."""
+        lat = np.asarray(lat, dtype=float)
+        best = np.zeros(lat.size, dtype=np.int64)
+        p, z = self.contains(lat, lon)
+        np.maximum.at(best, p, self.rank[z])
+        names = {rank: level for level, rank in LEVEL_RANK.items()}
+        return [names.get(int(rank)) for rank in best]
+
+
+class ZoneIndex:
+    """
+    Cached mapping between open SOS requests and the PriorityZones they fall in.
+
+    set_zones() and update_requests() keep it current incrementally: a
+    changed zone is re-tested against the cached request points, a changed
+    request against all zones, each as one vectorized pass. sync() does
+    both from the database using the SOSRequest.updatedAt watermark, so
+    screens can filter and sort by zone without any per-row SQL. Thread-safe.
+    """
+
+    def __init__(self):
+        self.zones = {}               # zoneID -> zone row
+        self._points = {}             # requestID -> (lat, lon) of open, located requests
+        self._zones_of = {}           # requestID -> zoneIDs, best priority first
+        self._members = {}            # zoneID -> set of requestIDs
+        self.watermark = None
+        self._lock = threading.RLock()
+
+    def _order(self, zone_ids):
+        return sorted(zone_ids, key=lambda zid: (-LEVEL_RANK.get(self.zones[zid]["priority_level"], 0),
+                                                 float(self.zones[zid]["radius_km"]), zid))
+
+    def set_zones(self, zones):
+        """Replace the zone set; only added, moved or re-levelled zones are recomputed."""
+        fields = ("centerLat", "centerLong", "radius_km", "priority_level")
+        new = {z["zoneID"]: z for z in zones if _usable(z)}
+        with self._lock:
+            changed = [zid for zid, z in new.items()
+                       if zid not in self.zones or any(self.zones[zid][f] != z[f] for f in fields)]
+            dropped = [zid for zid in self.zones if zid not in new]
+            touched = set()
+            for zid in dropped + changed:
+                members = self._members.pop(zid, set())
+                touched |= members
+                for request_id in members:
+                    self._zones_of[request_id] = [z for z in self._zones_of[request_id] if z != zid]
+            self.zones = new
+
+            if changed and self._points:
+                ids = np.fromiter(self._points.keys(), dtype=np.int64, count=len(self._points))
+                coords = np.array(list(self._points.values()), dtype=float)
+                zone_arrays = ZoneArrays([new[zid] for zid in changed])
+                p, z = zone_arrays.contains(coords[:, 0], coords[:, 1])
+                for point, zone in zip(ids[p].tolist(), zone_arrays.ids[z].tolist()):
+                    self._members.setdefault(zone, set()).add(point)
+                    self._zones_of.setdefault(point, []).append(zone)
+                    touched.add(point)
+
+            # Levels may have changed, so re-sort the affected requests
+            for request_id in touched:
+                zone_ids = self._zones_of.get(request_id)
+                if zone_ids:
+                    self._zones_of[request_id] = self._order(zone_ids)
+                else:
+                    self._zones_of.pop(request_id, None)
+            return changed, dropped
+
+    def update_requests(self, rows):
+        """Merge request rows (requestID, status, latitude, longitude); closed or unlocated ones are dropped."""
+        keep, drop = [], []
+        for row in rows:
+            if row["status"] in OPEN_STATUSES and has_location(row["latitude"], row["longitude"]):
+                keep.append(row)
+            else:
+                drop.append(row["requestID"])
+        with self._lock:
+            self.remove_requests([row["requestID"] for row in keep] + drop)
+            if not keep:
+                return
+            for row in keep:
+                self._points[row["requestID"]] = (float(row["latitude"]), float(row["longitude"]))
+            if not self.zones:
+                return
+            zone_arrays = ZoneArrays(list(self.zones.values()))
+            p, z = zone_arrays.contains([float(r["latitude"]) for r in keep], [float(r["longitude"]) for r in keep])
+            found = {}
+            for point, zone in zip(p.tolist(), zone_arrays.ids[z].tolist()):
+                request_id = keep[point]["requestID"]
+                found.setdefault(request_id, []).append(zone)
+                self._members.setdefault(zone, set()).add(request_id)
+            for request_id, zone_ids in found.items():
+                self._zones_of[request_id] = self._order(zone_ids)
+
+    def remove_requests(self, request_ids):
+        with self._lock:
+            for request_id in request_ids:
+                self._points.pop(request_id, None)
+                for zid in self._zones_of.pop(request_id, ()):
+                    self._members.get(zid, set()).discard(request_id)
+
+    def zones_of(self, request_id):
+        with self._lock:
+            return list(self._zones_of.get(request_id, ()))
+
+    def best_zone(self, request_id):
+        """The highest-priority zone row containing the request, or None."""
+        with self._lock:
+            zone_ids = self._zones_of.get(request_id)
+            return self.zones[zone_ids[0]] if zone_ids else None
+
+    def members(self, zone_id=None):
+        """Request ids inside one zone, or inside any zone when zone_id is None."""
+        with self._lock:
+            if zone_id is None:
+                return set(self._zones_of)
+            return set(self._members.get(zone_id, ()))
+
+    def sync(self, sos_repo, zone_repo):
+        """Refresh from the database: zones always (small table), requests since the watermark."""
+        zones = zone_repo.get_all()
+        if self.watermark is None:
+            watermark, rows = sos_repo.get_zone_points()
+            with self._lock:
+                self._points, self._zones_of, self._members, self.zones = {}, {}, {}, {}
+                self.set_zones(zones)
+                self.update_requests(rows)
+                self.watermark = watermark
+            return
+        watermark, rows = sos_repo.get_zone_points(since=self.watermark)
+        with self._lock:
+            self.set_zones(zones)
+            self.update_requests(rows)
+            self.watermark = watermark
+
+    def __len__(self):
+        return len(self._points)
+
+
+_shared_index = None
+_shared_index_lock = threading.Lock()
+
+
+def get_zone_index():
+    """Return the process-wide zone index."""
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = ZoneIndex()
+        return _shared_index
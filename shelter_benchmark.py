@@ -0,0 +1,57 @@
+# shelter_benchmark.py
+# Times shelter matching for a synthetic evacuation: victims clustered
+# around impact sites, shelters scattered over the city with capacities
+# covering most (not all) of the people. Runs in memory; no database needed.
+#
+#   python shelter_benchmark.py
+#   python shelter_benchmark.py --victims 20000 --shelters 1000 --coverage 0.8
+
+import argparse
+
+import numpy as np
+
+from services.shelter_matching_service import ShelterMatchingService
+
+
+def evacuation(victims, shelters, coverage, rng, center=(24.86, 67.01)):
+    sites = rng.normal(center, 0.1, size=(10, 2))
+    where = sites[rng.integers(0, len(sites), victims)] + rng.normal(0, 0.02, size=(victims, 2))
+    people = rng.choice([1, 1, 1, 2, 3, 4, 6], size=victims)
+    victim_rows = [{"requestID": i + 1, "victimID": i + 1, "latitude": lat, "longitude": lon,
+                    "peopleAffected": int(p)}
+                   for i, ((lat, lon), p) in enumerate(zip(where.tolist(), people.tolist()))]
+
+    spots = rng.normal(center, 0.15, size=(shelters, 2))
+    weights = rng.uniform(0.5, 1.5, shelters)
+    capacity = np.maximum(5, (weights / weights.sum() * people.sum() * coverage).astype(int))
+    shelter_rows = [{"shelterID": j + 1, "latitude": lat, "longitude": lon, "capacity": int(c),
+                     "current_occupancy": 0}
+                    for j, ((lat, lon), c) in enumerate(zip(spots.tolist(), capacity.tolist()))]
+    return victim_rows, shelter_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shelter matching benchmark")
+    parser.add_argument("--victims", type=int, nargs="*", default=[2000, 20000])
+    parser.add_argument("--shelters", type=int, default=300)
+    parser.add_argument("--coverage", type=float, default=0.9, help="shelter places / people")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    service = ShelterMatchingService(repo=None)
+    for n in args.victims:
+        rng = np.random.default_rng(args.seed)
+        victims, shelters = evacuation(n, args.shelters, args.coverage, rng)
+        plan = service.match(victims, shelters)
+
+        placed = plan["assignments"]
+        people = sum(a["people"] for a in placed)
+        distances = np.array([a["distance_km"] for a in placed]) if placed else np.zeros(1)
+        print(f"🏠 {n:>6,} requests into {len(shelters)} shelters: {len(placed):,} placed "
+              f"({people:,} people), {len(plan['unplaced']):,} without a place")
+        print(f"   distance median {np.median(distances):.1f} km, p95 {np.percentile(distances, 95):.1f} km; "
+              f"matched in {plan['seconds']:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# sos_alert_benchmark.py
+# Bursts SOS inserts and counts the Notification rows each one writes.
+# "before" replays the old form path (the form's own three alerts on top of
+# trg_after_insert_sos); "after" is the current trigger-only path. Rows are
+# tagged 'LOAD TEST' and removed afterwards unless --keep is given.
+#
+#   python sos_alert_benchmark.py
+#   python sos_alert_benchmark.py --burst 2000 --batch 100
+
+import argparse
+import time
+
+from data.connection_pool import get_pool
+from data.sos_repository import SOSRepository
+from services.sos_ingestion_service import validate_submission
+from sos_load_test import LOAD_TEST_TAG, cleanup, victim_ids
+
+# What frontend/sos_form.py inserted next to the trigger before the dedupe
+LEGACY_ALERT_SQL = """
+    INSERT INTO Notification (message, channel, recipientUserID, recipientRole, status)
+    VALUES (%s, 'in_app', NULL, 'Admin', 'sent'),
+           (%s, 'in_app', NULL, 'Volunteer', 'sent'),
+           (%s, 'in_app', NULL, 'NGO', 'sent')
+"""
+LEGACY_MARKER = f"at {LOAD_TEST_TAG}. Urgency"
+
+
+def last_notification_id(cursor):
+    cursor.execute("SELECT COALESCE(MAX(notificationID), 0) FROM Notification")
+    return cursor.fetchone()[0]
+
+
+def burst(victim_id, count, batch, legacy):
+    """(alerts per SOS, SOS/s) for `count` submissions written `batch` at a time."""
+    with get_pool().connection() as connection:
+        repo = SOSRepository(connection)
+        cursor = connection.cursor()
+        first_id = last_notification_id(cursor)
+        connection.commit()
+
+        started = time.perf_counter()
+        for start in range(0, count, batch):
+            submissions = [validate_submission({
+                "victimID": victim_id, "location": LOAD_TEST_TAG, "typeOfNeed": "Rescue",
+                "description": LOAD_TEST_TAG, "urgencyLevel": "high",
+            }) for _ in range(min(batch, count - start))]
+            request_ids = repo.insert_batch(submissions)
+            if legacy:
+                messages = [f"🚨 NEW SOS REQUEST #{request_id}: Rescue {LEGACY_MARKER}: high"
+                            for request_id in request_ids]
+                cursor.executemany(LEGACY_ALERT_SQL, [(m, m, m) for m in messages])
+                connection.commit()
+        elapsed = time.perf_counter() - started
+
+        cursor.execute("SELECT COUNT(*) FROM Notification WHERE notificationID > %s", (first_id,))
+        alerts = cursor.fetchone()[0]
+        cursor.close()
+    return alerts / count, count / elapsed
+
+
+def remove_legacy_alerts():
+    with get_pool().connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("DELETE FROM Notification WHERE requestID IS NULL AND message LIKE %s",
+                       (f"%{LEGACY_MARKER}%",))
+        connection.commit()
+        cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SOS alert fan-out benchmark")
+    parser.add_argument("--burst", type=int, default=1000, help="SOS requests per run")
+    parser.add_argument("--batch", type=int, default=50, help="SOS rows per INSERT")
+    parser.add_argument("--keep", action="store_true", help="keep the generated rows")
+    args = parser.parse_args()
+
+    victims = victim_ids()
+    if not victims:
+        print("❌ No victims in the database; load some sample data first.")
+        return
+
+    for label, legacy in (("before (form + trigger)", True), ("after (trigger only)", False)):
+        per_sos, rate = burst(victims[0], args.burst, args.batch, legacy)
+        print(f"🔔 {label:<24} {per_sos:.2f} alerts per SOS, {rate:,.0f} SOS/s over {args.burst} requests")
+
+    if not args.keep:
+        remove_legacy_alerts()
+        print(f"🧹 Removed {cleanup()} load-test SOS rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# sos_load_test.py
+# Floods the SOS ingestion service from many threads and reports sustained
+# submissions/second. Rows are tagged 'LOAD TEST' and removed afterwards
+# unless --keep is given.
+#
+#   python sos_load_test.py --threads 50 --seconds 20
+#   python sos_load_test.py --replay      # every thread resubmits one key
+#                                         # (own service or own connection each)
+
+import argparse
+import random
+import threading
+import time
+import uuid
+
+from data.connection_pool import get_pool
+from data.sos_repository import SOSRepository
+from services.sos_ingestion_service import IngestionBusy, SOSIngestionService, validate_submission
+
+LOAD_TEST_TAG = "LOAD TEST"
+
+
+def victim_ids():
+    with get_pool().connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT victimID FROM Victim")
+        rows = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+    return rows
+
+
+def cleanup():
+    with get_pool().connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("DELETE FROM Notification WHERE requestID IN "
+                       "(SELECT requestID FROM SOSRequest WHERE description = %s)", (LOAD_TEST_TAG,))
+        cursor.execute("DELETE FROM SOSRequest WHERE description = %s", (LOAD_TEST_TAG,))
+        connection.commit()
+        deleted = cursor.rowcount
+        cursor.close()
+    return deleted
+
+
+def replay_check(threads, victim_id):
+    """
+    Hammer a single submission key concurrently; exactly one row may exist.
+    Half the threads each run their own SOSIngestionService (own writer
+    thread), the other half call SOSRepository.insert_batch directly on
+    pooled connections, so the inserts really race in MySQL on the unique
+    key instead of being serialized by one writer.
+    """
+    key = str(uuid.uuid4())
+    submission = {
+        "victimID": victim_id, "location": "Load test", "typeOfNeed": "Rescue",
+        "description": LOAD_TEST_TAG, "urgencyLevel": "high", "submissionKey": key,
+    }
+    results, errors, lock = [], [], threading.Lock()
+    barrier = threading.Barrier(threads)
+
+    def service_client():
+        service = SOSIngestionService()
+        barrier.wait()
+        for _ in range(5):
+            try:
+                request_id = service.submit(dict(submission)).result(30)
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+                continue
+            with lock:
+                results.append(request_id)
+
+    def repository_client():
+        barrier.wait()
+        for _ in range(5):
+            try:
+                with get_pool().connection() as connection:
+                    request_id = SOSRepository(connection).insert_batch([validate_submission(submission)])[0]
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+                continue
+            with lock:
+                results.append(request_id)
+
+    workers = [threading.Thread(target=service_client if i % 2 else repository_client) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    with get_pool().connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT COUNT(*) FROM SOSRequest WHERE submissionKey = %s", (key,))
+        stored = cursor.fetchone()[0]
+        cursor.execute("SELECT COUNT(*) FROM Notification n JOIN SOSRequest s ON s.requestID = n.requestID "
+                       "WHERE s.submissionKey = %s", (key,))
+        alerts = cursor.fetchone()[0]
+        cursor.close()
+
+    distinct = set(results)
+    ok = stored == 1 and len(distinct) == 1 and not errors
+    print(f"{'✅' if ok else '❌'} {len(results)} submissions of one key -> "
+          f"{len(distinct)} requestID(s), {stored} row(s), {alerts} alert(s), {len(errors)} error(s)")
+    for error in errors[:3]:
+        print(f"   {type(error).__name__}: {error}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SOS ingestion load generator")
+    parser.add_argument("--threads", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--keep", action="store_true", help="keep the generated SOS rows")
+    parser.add_argument("--replay", action="store_true", help="check idempotent resubmission instead")
+    args = parser.parse_args()
+
+    victims = victim_ids()
+    if not victims:
+        print("❌ No victims in the database; load some sample data first.")
+        return
+
+    if args.replay:
+        replay_check(args.threads, victims[0])
+        if not args.keep:
+            print(f"🧹 Removed {cleanup()} load-test SOS rows")
+        return
+
+    service = SOSIngestionService()
+    stop_at = time.monotonic() + args.seconds
+    latencies, latency_lock = [], threading.Lock()
+
+    def client():
+        rng = random.Random()
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            try:
+                service.submit({
+                    "victimID": rng.choice(victims),
+                    "location": "Load test",
+                    "latitude": 24.8 + rng.random() * 0.2,
+                    "longitude": 67.0 + rng.random() * 0.2,
+                    "typeOfNeed": rng.choice(["Food", "Water", "Medical", "Rescue", "Shelter"]),
+                    "description": LOAD_TEST_TAG,
+                    "urgencyLevel": rng.choice(["low", "medium", "high", "critical"]),
+                    "peopleAffected": rng.randint(1, 10),
+                }).result(30)
+            except IngestionBusy:
+                time.sleep(0.05)
+                continue
+            with latency_lock:
+                latencies.append(time.perf_counter() - started)
+
+    print(f"🚀 {args.threads} clients for {args.seconds:.0f}s...")
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    stats = service.stats
+    latencies.sort()
+    print(f"✅ Written: {stats['written']} in {stats['batches']} batches "
+          f"({stats['written'] / max(1, stats['batches']):.1f} rows/batch)")
+    print(f"📈 Sustained: {stats['written'] / elapsed:.1f} submissions/s")
+    print(f"⏱️ Latency p50: {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+          f"p95: {latencies[int(len(latencies) * 0.95)] * 1000:.1f} ms" if latencies else "⏱️ No latency samples")
+    print(f"⚠️ Rejected (backpressure): {stats['rejected']}, failed: {stats['failed']}")
+    print(f"🔗 Linked as near-duplicates: {stats['duplicates']}")
+
+    if not args.keep:
+        print(f"🧹 Removed {cleanup()} load-test SOS rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# stock_stress_test.py
+# Races many threads deducting from one ResourceStock row through
+# ResourceRepository.transfer_from_stock / allocate_from_stock and checks the
+# row never goes negative and ends at the starting quantity minus exactly the
+# deductions that succeeded. The stock row is tagged 'LOAD TEST' and removed
+# (with its transfers, allocations and low stock alert) unless --keep is given.
+#
+#   python stock_stress_test.py
+#   python stock_stress_test.py --threads 50 --quantity 500 --attempts 40
+
+import argparse
+import random
+import threading
+
+from data.connection_pool import get_pool
+from data.resource_repository import ResourceRepository
+from sos_load_test import LOAD_TEST_TAG
+
+
+def create_stock(quantity):
+    """A fresh stock row of the first ResourceType; returns its resourceID (None without types)."""
+    with get_pool().connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT MIN(resourceTypeID) FROM ResourceType")
+        resource_type_id = cursor.fetchone()[0]
+        if resource_type_id is None:
+            cursor.close()
+            return None
+        cursor.execute("INSERT INTO ResourceStock (resourceTypeID, quantity, status, location) "
+                       "VALUES (%s, %s, 'available', %s)", (resource_type_id, quantity, LOAD_TEST_TAG))
+        connection.commit()
+        resource_id = cursor.lastrowid
+        cursor.close()
+    return resource_id
+
+
+def stored_totals(resource_id):
+    """(stock quantity, quantity transferred, quantity allocated) as MySQL sees them."""
+    with get_pool().connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT quantity FROM ResourceStock WHERE resourceID = %s", (resource_id,))
+        quantity = cursor.fetchone()[0]
+        cursor.execute("SELECT COALESCE(SUM(quantity), 0) FROM ResourceTransfer WHERE resourceID = %s", (resource_id,))
+        transferred = int(cursor.fetchone()[0])
+        cursor.execute("SELECT COALESCE(SUM(quantity), 0) FROM ResourceAllocation WHERE resourceID = %s", (resource_id,))
+        allocated = int(cursor.fetchone()[0])
+        cursor.close()
+    return quantity, transferred, allocated
+
+
+def cleanup(resource_id):
+    with get_pool().connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("DELETE FROM Notification WHERE recipientRole = 'NGO' AND message LIKE %s",
+                       (f"Low stock alert: {resource_id} Qty:%",))
+        # ResourceTransfer / ResourceAllocation rows go with it (ON DELETE CASCADE)
+        cursor.execute("DELETE FROM ResourceStock WHERE resourceID = %s", (resource_id,))
+        connection.commit()
+        cursor.close()
+
+
+def stress(resource_id, threads, attempts, max_take):
+    """
+    Run the race; returns (units deducted, successes, insufficient, other
+    errors, lowest quantity seen). A watcher thread polls the row while the
+    workers run so a transient negative value would be caught too.
+    """
+    deducted, successes, insufficient, errors = 0, 0, 0, []
+    lowest = [None]
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads)
+    done = threading.Event()
+
+    def watcher():
+        with get_pool().connection() as connection:
+            cursor = connection.cursor()
+            while not done.is_set():
+                cursor.execute("SELECT quantity FROM ResourceStock WHERE resourceID = %s", (resource_id,))
+                quantity = cursor.fetchone()[0]
+                connection.commit()  # next read gets a fresh snapshot
+                if lowest[0] is None or quantity < lowest[0]:
+                    lowest[0] = quantity
+                done.wait(0.01)
+            cursor.close()
+
+    def client(worker):
+        nonlocal deducted, successes, insufficient
+        rng = random.Random(worker)
+        barrier.wait()
+        for attempt in range(attempts):
+            take = rng.randint(1, max_take)
+            try:
+                with get_pool().connection() as connection:
+                    repo = ResourceRepository(connection)
+                    if (worker + attempt) % 2:
+                        repo.transfer_from_stock(resource_id, None, None, LOAD_TEST_TAG, LOAD_TEST_TAG, take, None)
+                    else:
+                        repo.allocate_from_stock(resource_id, "Shelter", None, None, take)
+            except ValueError:
+                with lock:
+                    insufficient += 1
+                continue
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+                continue
+            with lock:
+                deducted += take
+                successes += 1
+
+    monitor = threading.Thread(target=watcher)
+    monitor.start()
+    workers = [threading.Thread(target=client, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    done.set()
+    monitor.join()
+    return deducted, successes, insufficient, errors, lowest[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent stock deduction stress test")
+    parser.add_argument("--threads", type=int, default=20)
+    parser.add_argument("--attempts", type=int, default=25, help="deductions tried per thread")
+    parser.add_argument("--quantity", type=int, default=1000, help="starting stock")
+    parser.add_argument("--max-take", type=int, default=10, help="largest single deduction")
+    parser.add_argument("--keep", action="store_true", help="keep the stock row and its records")
+    args = parser.parse_args()
+
+    resource_id = create_stock(args.quantity)
+    if resource_id is None:
+        print("❌ No resource types in the database; load some sample data first.")
+        return
+
+    print(f"🚀 {args.threads} threads x {args.attempts} deductions against {args.quantity} units...")
+    deducted, successes, insufficient, errors, lowest = stress(
+        resource_id, args.threads, args.attempts, args.max_take)
+    quantity, transferred, allocated = stored_totals(resource_id)
+
+    expected = args.quantity - deducted
+    never_negative = quantity >= 0 and (lowest is None or lowest >= 0)
+    ok = never_negative and quantity == expected and transferred + allocated == deducted and not errors
+    print(f"{'✅' if ok else '❌'} Final quantity {quantity} (expected {expected}); "
+          f"lowest seen {lowest}, never below 0: {never_negative}")
+    print(f"📦 {successes} deductions took {deducted} units; recorded {transferred} transferred + {allocated} allocated")
+    print(f"⚠️ Refused for insufficient stock: {insufficient}, other errors: {len(errors)}")
+    for error in errors[:3]:
+        print(f"   {type(error).__name__}: {error}")
+
+    if not args.keep:
+        cleanup(resource_id)
+        print(f"🧹 Removed load-test stock row {resource_id}")
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()